@@ -0,0 +1,272 @@
+import argparse
+import json
+import logging
+import os
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from browser_profile import PROFILES, BrowserProfile
+from fields import FIELD_NAMES
+from fixture_portal import DEFAULT_PAGE_SIZE, DEFAULT_SEED, DETAIL_PATH, LIST_PATH, FixturePortal, start_portal
+from metrics import Metrics
+from page_cache import PageCache
+from rera_scraper import LIST_PAGE_CACHE_KEY, OdishaRERAScraper
+from sinks import open_sink
+
+RESULTS_DIR = pathlib.Path(__file__).parent / "results"
+DEFAULT_HISTORY = RESULTS_DIR / "end_to_end.jsonl"
+DEFAULT_PROJECTS = 200
+DEFAULT_TOLERANCE = 0.10
+MEMORY_SAMPLE_INTERVAL = 0.5
+
+
+class PeakMemory:
+    # Samples this process plus its children (ChromeDriver and Chrome) when psutil is available,
+    # otherwise falls back to this process's own high-water mark.
+    def __init__(self):
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+        try:
+            import psutil
+            self._process = psutil.Process()
+        except ImportError:
+            self._process = None
+
+    def sample(self):
+        try:
+            processes = [self._process] + self._process.children(recursive=True)
+            return sum(process.memory_info().rss for process in processes)
+        except Exception:
+            return 0
+
+    def _run(self):
+        while not self._stop.wait(MEMORY_SAMPLE_INTERVAL):
+            self.peak = max(self.peak, self.sample())
+
+    def __enter__(self):
+        if self._process is not None:
+            self.peak = self.sample()
+            self._thread = threading.Thread(target=self._run, name="memory-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self.peak = max(self.peak, self.sample())
+        else:
+            self.peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        return False
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def seed_cache(cache, portal, base_url, list_url, limit):
+    # Replay mode stores what a browser run would have captured, so the scraper runs offline.
+    for page in range(1, portal.pages + 1):
+        ids = portal.page_ids(page)
+        if ids.start > limit:
+            break
+        cache.put(LIST_PAGE_CACHE_KEY.format(list_url=list_url, page=page), 'list',
+                  {'rows': portal.list_snapshot_rows(base_url, page)})
+        for project_id in ids:
+            for tab in ('overview', 'promoter'):
+                cache.put(f"{base_url}{DETAIL_PATH}{project_id}", tab, portal.snapshot(project_id, tab))
+
+
+def score(records, truth):
+    expected = {record['RERA_Regd_No']: record for record in truth}
+    fields = {field: 0 for field in FIELD_NAMES}
+    mismatches = []
+    for record in records:
+        target = expected.get(record.get('RERA_Regd_No', ''))
+        if target is None:
+            continue
+        for field in FIELD_NAMES:
+            if record.get(field, '') == target[field]:
+                fields[field] += 1
+            elif len(mismatches) < 20:
+                mismatches.append({'rera_no': target['RERA_Regd_No'], 'field': field,
+                                   'expected': target[field], 'got': record.get(field, '')})
+    total = len(expected) or 1
+    accuracy = {field: round(correct / total, 4) for field, correct in fields.items()}
+    accuracy['overall'] = round(sum(fields.values()) / (total * len(FIELD_NAMES)), 4)
+    return accuracy, mismatches
+
+
+def run(config):
+    portal = FixturePortal(config['projects'], config['page_size'], config['seed'], config['delay'])
+    server = start_portal(portal)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    list_url = base_url + LIST_PATH
+    limit = min(config['limit'] or config['projects'], config['projects'])
+    metrics = Metrics()
+    cache = None
+    scraper = None
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            sink = open_sink(os.path.join(workdir, 'records.jsonl'))
+            if config['mode'] == 'replay':
+                cache = PageCache(os.path.join(workdir, 'cache'), ttl=None, max_bytes=1 << 40)
+                seed_cache(cache, portal, base_url, list_url, limit)
+                scraper = OdishaRERAScraper(extraction_mode=config['extraction'], sink=sink, cache=cache,
+                                            offline=True, metrics=metrics, list_url=list_url)
+            else:
+                profile = BrowserProfile(config['profile'], allowed_hosts=['127.0.0.1'])
+                scraper = OdishaRERAScraper(headless=True, extraction_mode=config['extraction'], sink=sink,
+                                            profile=profile, metrics=metrics, list_url=list_url)
+
+            with PeakMemory() as memory:
+                start = time.perf_counter()
+                scraper.crawl_registry(limit=limit, workers=config['workers'], rate=config['rate'])
+                elapsed = time.perf_counter() - start
+
+            scraper.flush_output()
+            records = list(sink.read_records())
+            scraper.close()
+            scraper = None
+    finally:
+        if scraper:
+            scraper.close()
+        if cache:
+            cache.close()
+        server.shutdown()
+
+    truth = [portal.project(project_id)['record'] for project_id in range(1, limit + 1)]
+    accuracy, mismatches = score(records, truth)
+    report = metrics.report()
+    project = report['stages'].get('project', {})
+    return {
+        'projects_scraped': len(records),
+        'elapsed_s': round(elapsed, 2),
+        'items_per_min': round(len(records) / elapsed * 60, 1) if elapsed else 0.0,
+        'latency_p50': project.get('p50', 0.0),
+        'latency_p95': project.get('p95', 0.0),
+        'latency_p99': project.get('p99', 0.0),
+        'round_trips_per_page': report['round_trips_per_page']['mean'],
+        'peak_memory_mb': round(memory.peak / 1024 / 1024, 1),
+        'accuracy': accuracy,
+        'mismatches': mismatches,
+        'stages': {stage: {key: summary[key] for key in ('p50', 'p95', 'p99')}
+                   for stage, summary in report['stages'].items()},
+    }
+
+
+def below_threshold(accuracy, minimum):
+    return {field: value for field, value in accuracy.items() if value < minimum}
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare(result, baseline, tolerance):
+    regressions = []
+    if baseline['items_per_min'] and result['items_per_min'] < baseline['items_per_min'] * (1 - tolerance):
+        regressions.append(f"throughput {baseline['items_per_min']} -> {result['items_per_min']} items/min")
+    if baseline['latency_p95'] and result['latency_p95'] > baseline['latency_p95'] * (1 + tolerance):
+        regressions.append(f"p95 latency {baseline['latency_p95']}s -> {result['latency_p95']}s")
+    for field, value in baseline['accuracy'].items():
+        if result['accuracy'].get(field, 0.0) < value:
+            regressions.append(f"{field} accuracy {value:.2%} -> {result['accuracy'].get(field, 0.0):.2%}")
+    return regressions
+
+
+def print_result(result, baseline):
+    def delta(key):
+        if not baseline or not baseline.get(key):
+            return ''
+        return f" ({(result[key] - baseline[key]) / baseline[key]:+.1%})"
+
+    print(f"Scraped {result['projects_scraped']} projects in {result['elapsed_s']}s")
+    print(f"  throughput      {result['items_per_min']} items/min{delta('items_per_min')}")
+    print(f"  latency p50     {result['latency_p50']}s{delta('latency_p50')}")
+    print(f"  latency p95     {result['latency_p95']}s{delta('latency_p95')}")
+    print(f"  latency p99     {result['latency_p99']}s{delta('latency_p99')}")
+    print(f"  round-trips     {result['round_trips_per_page']} per page{delta('round_trips_per_page')}")
+    print(f"  peak memory     {result['peak_memory_mb']} MB{delta('peak_memory_mb')}")
+    print("  accuracy        " + ", ".join(f"{field} {value:.1%}" for field, value in result['accuracy'].items()))
+    for mismatch in result['mismatches'][:5]:
+        print(f"    {mismatch['rera_no']} {mismatch['field']}: expected {mismatch['expected']!r}, "
+              f"got {mismatch['got']!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the scraper end to end against a local fixture portal and "
+                                                 "record throughput, latency, memory and field accuracy.")
+    parser.add_argument("--mode", choices=["browser", "replay"], default="browser",
+                        help="drive Chrome against the portal, or replay its pages from a page cache without Chrome")
+    parser.add_argument("--projects", type=int, default=DEFAULT_PROJECTS, help="projects in the synthetic portal")
+    parser.add_argument("--limit", type=int, default=None, help="projects to scrape (default: all)")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds the portal adds to every response")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--rate", type=float, default=0, help="pages per second (0 for unlimited)")
+    parser.add_argument("--profile", choices=PROFILES, default="full")
+    parser.add_argument("--extraction", choices=["live", "snapshot", "js"], default="live",
+                        help="extraction mode of the scraper; replay always reads the cached snapshots")
+    parser.add_argument("--label", help="free-form note stored with the result")
+    parser.add_argument("--history", default=str(DEFAULT_HISTORY), help="JSON Lines file of past results")
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to the history")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed throughput and p95 latency change before a run counts as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="exit non-zero when the run regresses against the last comparable one")
+    parser.add_argument("--min-accuracy", type=float, default=None,
+                        help="exit non-zero when any field's accuracy is below this fraction (e.g. 1.0)")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    config = {key: getattr(args, key) for key in ('mode', 'projects', 'limit', 'page_size', 'seed', 'delay',
+                                                  'workers', 'rate', 'profile', 'extraction')}
+    if args.mode == 'replay':
+        config['profile'] = None
+
+    history = load_history(args.history)
+    baseline = next((entry['result'] for entry in reversed(history) if entry['config'] == config), None)
+    result = run(config)
+    print_result(result, baseline)
+
+    regressions = compare(result, baseline, args.tolerance) if baseline else []
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    below = below_threshold(result['accuracy'], args.min_accuracy) if args.min_accuracy is not None else {}
+    for field, value in below.items():
+        print(f"ACCURACY: {field} {value:.2%} is below {args.min_accuracy:.2%}")
+
+    if not args.no_save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        entry = {
+            'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'label': args.label,
+            'config': config,
+            'result': result,
+        }
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        print(f"Result appended to {args.history}")
+    return 1 if (regressions and args.fail_on_regression) or below else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
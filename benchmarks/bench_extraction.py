@@ -0,0 +1,148 @@
+import argparse
+import json
+import logging
+import os
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fields import FIELD_NAMES
+from js_extraction import BatchDocument
+from rera_scraper import OdishaRERAScraper
+from snapshot import SnapshotDocument
+
+FIXTURES_DIR = pathlib.Path(__file__).parent / "fixtures"
+
+
+def count_round_trips(driver):
+    counter = {'commands': 0}
+    execute = driver.execute
+
+    def counting_execute(command, params=None):
+        counter['commands'] += 1
+        return execute(command, params)
+
+    driver.execute = counting_execute
+    return counter
+
+
+def page_document(driver, mode):
+    if mode == 'snapshot':
+        return SnapshotDocument.from_driver(driver)
+    if mode == 'js':
+        return BatchDocument(driver)
+    return driver
+
+
+def extract(document_factory, iterations):
+    timings = []
+    record = {}
+    for _ in range(iterations):
+        start = time.perf_counter()
+        overview_document, promoter_document = document_factory()
+        record = {
+            **OdishaRERAScraper.extract_overview_fields(overview_document),
+            **OdishaRERAScraper.extract_promoter_fields(promoter_document),
+        }
+        timings.append(time.perf_counter() - start)
+    return record, sum(timings) / len(timings) * 1000
+
+
+def run_live(names, iterations):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    driver = webdriver.Chrome(options=options)
+    counter = count_round_trips(driver)
+    results = {}
+    try:
+        for name in names:
+            overview_path = FIXTURES_DIR / f"{name}_overview.html"
+            promoter_path = FIXTURES_DIR / f"{name}_promoter.html"
+            page_results = {}
+            for mode in ('live', 'snapshot', 'js'):
+                timings = []
+                commands = []
+                record = {}
+                for _ in range(iterations):
+                    driver.get(overview_path.as_uri())
+                    counter['commands'] = 0
+                    start = time.perf_counter()
+                    document = page_document(driver, mode)
+                    overview = OdishaRERAScraper.extract_overview_fields(document)
+                    elapsed = time.perf_counter() - start
+                    used = counter['commands']
+
+                    driver.get(promoter_path.as_uri())
+                    counter['commands'] = 0
+                    start = time.perf_counter()
+                    document = page_document(driver, mode)
+                    promoter = OdishaRERAScraper.extract_promoter_fields(document)
+                    elapsed += time.perf_counter() - start
+                    used += counter['commands']
+
+                    timings.append(elapsed)
+                    commands.append(used)
+                    record = {**overview, **promoter}
+                page_results[mode] = {
+                    'record': record,
+                    'ms': sum(timings) / len(timings) * 1000,
+                    'round_trips': sum(commands) / len(commands),
+                }
+            results[name] = page_results
+    finally:
+        driver.quit()
+    return results
+
+
+def run_offline(names, iterations):
+    results = {}
+    for name in names:
+        overview_html = (FIXTURES_DIR / f"{name}_overview.html").read_text(encoding='utf-8')
+        promoter_html = (FIXTURES_DIR / f"{name}_promoter.html").read_text(encoding='utf-8')
+        record, ms = extract(lambda: (SnapshotDocument(overview_html), SnapshotDocument(promoter_html)), iterations)
+        results[name] = {'snapshot': {'record': record, 'ms': ms, 'round_trips': 0}}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare live-DOM, snapshot and in-page JS extraction on saved fixture pages.")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--live", action="store_true", help="also run the live, snapshot and js modes in headless Chrome")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    expected = json.loads((FIXTURES_DIR / "expected.json").read_text(encoding='utf-8'))
+    names = sorted(expected)
+    results = run_live(names, args.iterations) if args.live else run_offline(names, args.iterations)
+
+    mismatches = 0
+    print(f"{'fixture':<22}{'mode':<10}{'ms/page':>10}{'round-trips':>13}{'accuracy':>10}")
+    for name in names:
+        for mode, result in results[name].items():
+            record = result['record']
+            correct = sum(1 for field in FIELD_NAMES if record.get(field, '') == expected[name][field])
+            print(f"{name:<22}{mode:<10}{result['ms']:>10.2f}{result['round_trips']:>13.0f}"
+                  f"{correct:>7}/{len(FIELD_NAMES)}")
+        if 'live' in results[name]:
+            live = results[name]['live']['record']
+            for mode in ('snapshot', 'js'):
+                other = results[name][mode]['record']
+                for field in FIELD_NAMES:
+                    if live.get(field, '') != other.get(field, ''):
+                        mismatches += 1
+                        print(f"  MISMATCH {field}: live={live.get(field, '')!r} {mode}={other.get(field, '')!r}")
+
+    if args.live:
+        print(f"\n{mismatches} field mismatches between live extraction and the snapshot and js modes")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
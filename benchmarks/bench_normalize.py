@@ -0,0 +1,81 @@
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from fixture_portal import DEFAULT_SEED, make_project
+from normalize import load_records, normalize_frame, save_records
+
+DEFAULT_ROWS = 300000
+BASE_PROJECTS = 5000
+
+
+def scraped_records(rows, seed):
+    # Ground-truth fixture records roughened the way scraped output is: spaced or placeholder GST
+    # numbers, corrupted check digits, numeric project names and trailing commas on addresses.
+    base = []
+    for project_id in range(1, BASE_PROJECTS + 1):
+        record = dict(make_project(project_id, seed)['record'])
+        gst = record['GST_No']
+        if gst and project_id % 7 == 0:
+            record['GST_No'] = f"{gst[:2]} {gst[2:7]} {gst[7:11]}{gst[11]} {gst[12:]}"
+        elif gst and project_id % 13 == 0:
+            record['GST_No'] = gst[:14] + ('0' if gst[14] != '0' else '1')
+        elif not gst and project_id % 2:
+            record['GST_No'] = 'Not Available'
+        if project_id % 17 == 0:
+            record['Project_Name'] = str(150000 + project_id)
+        if project_id % 5 == 0:
+            record['Promoter_Address'] += ' ,,,,,'
+        base.append(record)
+    frame = pd.DataFrame(base)
+    repeats = -(-rows // len(frame))
+    frame = pd.concat([frame] * repeats, ignore_index=True).iloc[:rows]
+    # Give every row its own registration serial, then repeat one in every thousand as a duplicate.
+    prefix = frame['RERA_Regd_No'].str.rsplit('/', n=1).str[0]
+    frame['RERA_Regd_No'] = prefix + '/' + pd.Series(np.arange(rows)).map('{:06d}'.format)
+    duplicates = np.arange(999, rows, 1000)
+    frame.loc[duplicates, 'RERA_Regd_No'] = frame['RERA_Regd_No'].to_numpy()[duplicates - 1]
+    return frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the normalization stage over a large synthetic output file.")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--format", choices=["csv", "jsonl", "parquet"], default="csv")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    records = scraped_records(args.rows, args.seed)
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, f"records.{args.format}")
+        save_records(records, path)
+
+        start = time.perf_counter()
+        frame = load_records(path)
+        loaded = time.perf_counter()
+        result, counts = normalize_frame(frame)
+        normalized = time.perf_counter()
+
+    print(f"{len(frame)} rows: read {loaded - start:.2f}s, normalized {normalized - loaded:.2f}s "
+          f"({len(frame) / (normalized - loaded):,.0f} rows/s)")
+    print(f"  GST valid       {result['GST_Valid'].mean():.1%}")
+    print(f"  district found  {(result['Promoter_District'] != '').mean():.1%}")
+    print(f"  PIN found       {(result['Promoter_PIN'] != '').mean():.1%}")
+    print(f"  promoter keys   {result['Promoter_Key'].nunique()} distinct of "
+          f"{result['Promoter_Name'].nunique()} distinct names")
+    for name, count in counts.items():
+        if count:
+            print(f"  {name:<22}{count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import argparse
+import json
+import logging
+import os
+import pathlib
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from browser_profile import PROFILES, BrowserProfile
+from rera_scraper import OVERVIEW_READY, OdishaRERAScraper
+
+FIXTURES_DIR = pathlib.Path(__file__).parent / "fixtures"
+
+# Asset weights roughly matching a government portal page: a few banner images, a web font, a
+# framework stylesheet and a third-party analytics script served from a different host name.
+ASSETS = {
+    '/assets/banner-1.png': ('image/png', 300 * 1024),
+    '/assets/banner-2.jpg': ('image/jpeg', 200 * 1024),
+    '/assets/logo.svg': ('image/svg+xml', 20 * 1024),
+    '/assets/font.woff2': ('font/woff2', 120 * 1024),
+    '/assets/site.css': ('text/css', 60 * 1024),
+    '/tracker.js': ('application/javascript', 80 * 1024),
+}
+
+
+def asset_body(path, size):
+    if path.endswith('.css'):
+        head = b"@font-face{font-family:Portal;src:url(/assets/font.woff2)}body{font-family:Portal}\n"
+        return head + b"/*" + b"x" * (size - len(head) - 4) + b"*/"
+    if path.endswith('.js'):
+        return b"//" + b"x" * (size - 2)
+    return os.urandom(size)
+
+
+def decorate(html, port):
+    assets = (f'<link rel="stylesheet" href="/assets/site.css">'
+              f'<script src="http://localhost:{port}/tracker.js"></script>')
+    images = ('<img src="/assets/banner-1.png"><img src="/assets/banner-2.jpg"><img src="/assets/logo.svg">')
+    return html.replace('</head>', assets + '</head>').replace('<body>', '<body>' + images)
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    pages = {}
+    assets = {}
+    counter = None
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path in self.pages:
+            content_type, body = 'text/html', self.pages[path]
+        elif path in self.assets:
+            content_type, body = self.assets[path]
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+        with self.counter['lock']:
+            self.counter['bytes'] += len(body)
+            self.counter['requests'] += 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server(names):
+    counter = {'bytes': 0, 'requests': 0, 'lock': threading.Lock()}
+    handler = type('Handler', (FixtureHandler,), {'pages': {}, 'assets': {}, 'counter': counter})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    port = server.server_address[1]
+    for name in names:
+        html = (FIXTURES_DIR / f"{name}_overview.html").read_text(encoding='utf-8')
+        handler.pages[f"/projects/{name}"] = decorate(html, port).encode('utf-8')
+    for path, (content_type, size) in ASSETS.items():
+        handler.assets[path] = (content_type, asset_body(path, size))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, counter
+
+
+def browser_rss(driver):
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        return sum(process.memory_info().rss for process in root.children(recursive=True))
+    except psutil.Error:
+        return None
+
+
+def run_profile(name, server, counter, names, iterations):
+    port = server.server_address[1]
+    profile = BrowserProfile(name, allowed_hosts=['127.0.0.1'])
+    scraper = OdishaRERAScraper(headless=True, profile=profile)
+    results = {'bytes': [], 'requests': [], 'ms': [], 'rss': [], 'correct': 0, 'fields': 0}
+    expected = json.loads((FIXTURES_DIR / "expected.json").read_text(encoding='utf-8'))
+    try:
+        for name in names:
+            for _ in range(iterations):
+                with counter['lock']:
+                    counter['bytes'] = counter['requests'] = 0
+                start = time.perf_counter()
+                scraper.driver.get(f"http://127.0.0.1:{port}/projects/{name}")
+                scraper.readiness.wait_for_element('overview_fields', OVERVIEW_READY)
+                results['ms'].append((time.perf_counter() - start) * 1000)
+                # Late subresources (images, the tracker) still count towards the page.
+                time.sleep(0.5)
+                with counter['lock']:
+                    results['bytes'].append(counter['bytes'])
+                    results['requests'].append(counter['requests'])
+                rss = browser_rss(scraper.driver)
+                if rss is not None:
+                    results['rss'].append(rss)
+            record = OdishaRERAScraper.extract_overview_fields(scraper.driver, scraper.rules)
+            for field in ('RERA_Regd_No', 'Project_Name'):
+                results['fields'] += 1
+                results['correct'] += record.get(field, '') == expected[name][field]
+    finally:
+        scraper.close()
+    return results
+
+
+def mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare page weight, load time and Chrome memory per browser profile.")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--profiles", nargs="+", choices=PROFILES, default=PROFILES)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    names = sorted(json.loads((FIXTURES_DIR / "expected.json").read_text(encoding='utf-8')))
+    server, counter = start_fixture_server(names)
+    try:
+        results = {name: run_profile(name, server, counter, names, args.iterations) for name in args.profiles}
+    finally:
+        server.shutdown()
+
+    print(f"{'profile':<10}{'KB/page':>10}{'requests':>10}{'ms/page':>10}{'RSS MB':>10}{'overview fields':>17}")
+    for name, result in results.items():
+        rss = f"{mean(result['rss']) / 1024 / 1024:.0f}" if result['rss'] else 'n/a'
+        print(f"{name:<10}{mean(result['bytes']) / 1024:>10.1f}{mean(result['requests']):>10.1f}"
+              f"{mean(result['ms']):>10.1f}{rss:>10}{result['correct']:>12}/{result['fields']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
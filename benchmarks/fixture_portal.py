@@ -0,0 +1,347 @@
+import argparse
+import functools
+import html
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fields import FIELD_NAMES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROJECTS = 1000
+DEFAULT_PAGE_SIZE = 10
+DEFAULT_SEED = 2025
+DEFAULT_PORTAL_PORT = 8767
+LIST_PATH = "/projects/project-list"
+DETAIL_PATH = "/projects/project-details/"
+PAGE_TITLE = "Project Details | Odisha RERA"
+
+# The first four mirror the saved fixture pages. 'heading' has no Project Name label and shows the
+# GSTIN grouped with spaces next to a PAN; 'title' only names the project in the page title.
+LAYOUTS = ['rows', 'cards', 'table', 'split', 'heading', 'title']
+
+DISTRICTS = [
+    ('Angul', 1, '759'), ('Balasore', 4, '756'), ('Cuttack', 10, '753'), ('Ganjam', 14, '760'),
+    ('Jharsuguda', 17, '768'), ('Khordha', 19, '751'), ('Puri', 26, '752'), ('Sambalpur', 28, '768'),
+    ('Sundargarh', 30, '770'), ('Kalahandi', 18, '766'),
+]
+CITIES = {'Khordha': 'Bhubaneswar', 'Cuttack': 'Cuttack', 'Ganjam': 'Berhampur', 'Sundargarh': 'Rourkela'}
+LOCALITIES = ['Patia', 'Chandrasekharpur', 'Khandagiri', 'Pokhariput', 'Jharpada', 'Nayapalli', 'Kalinga Nagar',
+              'Badambadi', 'Gopalpur', 'Khetrajpur', 'Station Road', 'Old Town']
+NAME_WORDS = ['Basanti', 'Krishna', 'Neelachal', 'Udyayeen', 'Barsana', 'Shanti', 'Jagannath', 'Konark', 'Mahanadi',
+              'Ananta', 'Sai', 'Kalinga', 'Utkal', 'Lingaraj', 'Chilika', 'Subham', 'Aashirwad', 'Sunrise']
+NAME_SUFFIXES = ['Enclave', 'Residency', 'Heights', 'Kunj', 'Vihar', 'Apartments', 'Towers', 'Greens', 'Nagar',
+                 'Plaza', 'Residency - II', 'City', 'Housing Project']
+COMPANY_SUFFIXES = ['INFRA DEVELOPERS PVT. LTD', 'BUILDERS PRIVATE LIMITED', 'CONSTRUCTION PVT. LTD',
+                    'PROPERTIES & DEVELOPERS PRIVATE LIMITED', 'INFRA PROJECTS PVT LTD']
+FIRST_NAMES = ['PRAMOD', 'SUBHASH', 'ANITA', 'RAJESH', 'SASMITA', 'BISWAJIT', 'PRIYANKA', 'MANOJ']
+LAST_NAMES = ['PODDAR', 'MOHANTY', 'PATTNAIK', 'DAS', 'SAHU', 'MISHRA', 'PANDA', 'NAYAK']
+GSTIN_ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def gstin_check_char(body):
+    total = 0
+    for position, char in enumerate(body):
+        product = GSTIN_ALPHABET.index(char) * (2 if position % 2 else 1)
+        total += product // 36 + product % 36
+    return GSTIN_ALPHABET[(36 - total % 36) % 36]
+
+
+def make_pan(rng, entity):
+    return (''.join(rng.choice(LETTERS) for _ in range(3)) + entity + rng.choice(LETTERS)
+            + f"{rng.randrange(10000):04d}" + rng.choice(LETTERS))
+
+
+def make_project(project_id, seed=DEFAULT_SEED):
+    rng = random.Random(seed * 1000003 + project_id)
+    district, code, pin_prefix = rng.choice(DISTRICTS)
+    pin = f"{pin_prefix}{rng.randrange(1000):03d}"
+    company = rng.random() < 0.75
+    if company:
+        promoter = f"M/S. {rng.choice(NAME_WORDS).upper()} {rng.choice(COMPANY_SUFFIXES)}"
+        if rng.random() < 0.5:
+            promoter = promoter[len("M/S. "):]
+    else:
+        promoter = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    pan = make_pan(rng, 'C' if company else 'P')
+    gst_body = f"21{pan}{rng.randrange(1, 10)}Z"
+    gst = '' if rng.random() < 0.1 else gst_body + gstin_check_char(gst_body)
+    address = (f"Plot No-{rng.randrange(1, 3000)}, {rng.choice(LOCALITIES)}, {CITIES.get(district, district)}, "
+               f"Dist. {district}, Odisha-{pin}")
+    if rng.random() < 0.3:
+        address += rng.choice([' ,,,,,', '.,,,,,'])
+    record = {
+        'RERA_Regd_No': f"{rng.choice(['RP', 'RP', 'PS'])}/{code:02d}/{rng.choice([2023, 2024, 2025])}/{project_id:05d}",
+        'Project_Name': f"{rng.choice(NAME_WORDS)} {rng.choice(NAME_SUFFIXES)}",
+        'Promoter_Name': promoter,
+        'Promoter_Address': address,
+        'GST_No': gst,
+    }
+    if rng.random() < 0.3:
+        record['Project_Name'] = record['Project_Name'].upper()
+    return {
+        'id': project_id,
+        'layout': LAYOUTS[project_id % len(LAYOUTS)],
+        'company': company,
+        'pan': pan,
+        'district': district,
+        'application_no': str(100000 + project_id),
+        'record': record,
+    }
+
+
+def esc(text):
+    return html.escape(text, quote=False)
+
+
+def field_rows(layout, pairs):
+    if layout == 'rows':
+        return ''.join(f'<div class="details-row"><span class="details-label">{esc(label)}</span>'
+                       f'<span class="details-value">{value}</span></div>' for label, value in pairs)
+    if layout == 'table':
+        return ('<table class="table table-bordered"><tbody>'
+                + ''.join(f'<tr><th>{esc(label)}</th><td>{value}</td></tr>' for label, value in pairs)
+                + '</tbody></table>')
+    if layout == 'split':
+        return ''.join(f'<div class="col-md-6"><label>{esc(label)}</label><div class="value">{value}</div></div>'
+                       for label, value in pairs)
+    return ''.join(f'<div class="col-md-4"><label>{esc(label)}</label><strong>{value}</strong></div>'
+                   for label, value in pairs)
+
+
+def overview_html(project):
+    record, layout = project['record'], project['layout']
+    rera = esc(record['RERA_Regd_No'])
+    name = esc(record['Project_Name'])
+    if layout == 'title':
+        return (f'<h3 class="card-title">Overview</h3>'
+                f'{field_rows("rows", [("RERA Regd. No.", rera), ("District", esc(project["district"]))])}')
+    if layout == 'heading':
+        return (f'<h1 class="project-title">{name}</h1>'
+                f'<p>Registration: <span>{rera}</span></p>'
+                f'<p>District: <span>{esc(project["district"])}</span></p>')
+    if layout == 'split':
+        prefix, rest = rera.split('/', 1)
+        body = field_rows(layout, [('Name of the Project', f'<b>{name}</b>'),
+                                   ('RERA Regd. No.', f'<span>{prefix}/</span><span>{rest}</span>')])
+        return (f'<div class="card-header"><b>Application No.</b> <strong>{project["application_no"]}</strong></div>'
+                f'<div class="row">{body}</div>')
+    if layout == 'table':
+        rera = f'<span class="badge">{rera}</span>'
+    return field_rows(layout, [('Project Name', name), ('RERA Regd. No.', rera),
+                               ('District', esc(project['district']))])
+
+
+def promoter_html(project):
+    record, layout = project['record'], project['layout']
+    name_label = 'Company Name' if project['company'] else 'Promoter Name'
+    gst = record['GST_No']
+    if layout in ('split', 'heading') and gst:
+        gst = f"{gst[:2]} {gst[2:7]} {gst[7:11]}{gst[11]} {gst[12:]}"
+    pairs = [(name_label, esc(record['Promoter_Name'])),
+             ('Registered Office Address', esc(record['Promoter_Address']))]
+    if layout == 'heading':
+        pairs.append(('PAN No.', project['pan']))
+        pairs.append(('GSTIN', esc(gst) or 'Not Available'))
+        return f'<div class="row">{field_rows("cards", pairs)}</div>'
+    pairs.append(('GST No.', esc(gst) or 'N/A'))
+    return f'<div class="row">{field_rows(layout, pairs)}</div>'
+
+
+def page_html(title, body, script=''):
+    return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{esc(title)}</title></head><body>'
+            f'<nav class="navbar"><a href="/">Home</a> <a href="{LIST_PATH}">Projects</a></nav>'
+            f'<div class="container">{body}</div>{script}</body></html>')
+
+
+TAB_SCRIPT = """<script>
+function showPromoter(event) {
+    event.preventDefault();
+    var xhr = new XMLHttpRequest();
+    xhr.open('GET', location.pathname.replace(/\\/$/, '') + '/promoter');
+    xhr.onload = function () {
+        document.getElementById('tab-content').innerHTML = xhr.responseText;
+        document.getElementById('overview-tab').className = 'nav-link';
+        document.getElementById('promoter-tab').className = 'nav-link active';
+    };
+    xhr.send();
+}
+</script>"""
+
+
+def page_title(project):
+    if project['layout'] == 'title':
+        return f"{project['record']['Project_Name']} - Odisha RERA"
+    return PAGE_TITLE
+
+
+def detail_html(project, tab='overview'):
+    # The promoter tab is fetched and swapped in on click, the way the portal's SPA renders tabs.
+    content = overview_html(project) if tab == 'overview' else promoter_html(project)
+    active = {'overview': ' active' if tab == 'overview' else '', 'promoter': ' active' if tab == 'promoter' else ''}
+    body = ('<h2>Project Details</h2><ul class="nav nav-tabs" role="tablist">'
+            f'<li class="nav-item"><a id="overview-tab" class="nav-link{active["overview"]}" role="tab" '
+            f'href="#project-overview">Project Overview</a></li>'
+            f'<li class="nav-item"><a id="promoter-tab" class="nav-link{active["promoter"]}" role="tab" '
+            f'href="#promoter-details" onclick="showPromoter(event)">Promoter Details</a></li></ul>'
+            f'<div id="tab-content" class="tab-content card"><div class="card-body">{content}</div></div>')
+    return page_html(page_title(project), body, TAB_SCRIPT)
+
+
+class FixturePortal:
+    def __init__(self, projects=DEFAULT_PROJECTS, page_size=DEFAULT_PAGE_SIZE, seed=DEFAULT_SEED, delay=0.0):
+        self.projects = projects
+        self.page_size = page_size
+        self.seed = seed
+        self.delay = delay
+
+    @property
+    def pages(self):
+        return max(1, -(-self.projects // self.page_size))
+
+    @functools.lru_cache(maxsize=4096)
+    def project(self, project_id):
+        if not 1 <= project_id <= self.projects:
+            return None
+        return make_project(project_id, self.seed)
+
+    def page_ids(self, page):
+        first = (page - 1) * self.page_size + 1
+        return range(first, min(first + self.page_size, self.projects + 1))
+
+    def ground_truth(self):
+        for project_id in range(1, self.projects + 1):
+            yield self.project(project_id)['record']
+
+    def list_rows(self, page):
+        rows = []
+        for project_id in self.page_ids(page):
+            record = self.project(project_id)['record']
+            rows.append(f'<tr><td>{project_id}</td><td>{esc(record["RERA_Regd_No"])}</td>'
+                        f'<td>{esc(record["Project_Name"])}</td><td>{esc(record["Promoter_Name"])}</td>'
+                        f'<td><a class="btn btn-sm" href="{DETAIL_PATH}{project_id}">View Details</a></td></tr>')
+        return ''.join(rows)
+
+    def pagination(self, page):
+        items = []
+        for number in range(max(1, page - 2), min(self.pages, page + 2) + 1):
+            current = ' active' if number == page else ''
+            items.append(f'<li class="page-item{current}"><a class="page-link" href="{LIST_PATH}?page={number}">'
+                         f'{number}</a></li>')
+        if page < self.pages:
+            items.append(f'<li class="page-item next"><a class="page-link" aria-label="Next" '
+                         f'href="{LIST_PATH}?page={page + 1}">›</a></li>')
+        else:
+            items.append('<li class="page-item next disabled"><a class="page-link" aria-label="Next">›</a></li>')
+        return f'<ul class="pagination">{"".join(items)}</ul>'
+
+    def list_html(self, page):
+        body = ('<h2>Registered Projects</h2><table class="table"><thead><tr><th>Sl.</th><th>RERA Regd. No.</th>'
+                f'<th>Project</th><th>Promoter</th><th></th></tr></thead><tbody>{self.list_rows(page)}</tbody>'
+                f'</table>{self.pagination(page)}')
+        return page_html("Projects | Odisha RERA", body)
+
+    def snapshot(self, project_id, tab):
+        project = self.project(project_id)
+        return {'html': detail_html(project, tab), 'title': page_title(project)}
+
+    def list_snapshot_rows(self, base_url, page):
+        # The rows HARVEST_LIST_SCRIPT would return in a browser, for seeding a page cache directly.
+        rows = []
+        for project_id in self.page_ids(page):
+            record = self.project(project_id)['record']
+            rows.append({'href': f"{base_url}{DETAIL_PATH}{project_id}", 'data_href': '', 'onclick': '',
+                         'text': f"{project_id}\t{record['RERA_Regd_No']}\t{record['Project_Name']}\t"
+                                 f"{record['Promoter_Name']}\tView Details"})
+        return rows
+
+    def render(self, path, query):
+        if path == LIST_PATH:
+            try:
+                page = int(query.get('page', ['1'])[0])
+            except ValueError:
+                return None
+            return self.list_html(page) if 1 <= page <= self.pages else None
+        if path.startswith(DETAIL_PATH):
+            parts = path[len(DETAIL_PATH):].strip('/').split('/')
+            if not parts[0].isdigit():
+                return None
+            project = self.project(int(parts[0]))
+            if project is None:
+                return None
+            if len(parts) == 2 and parts[1] == 'promoter':
+                return f'<div class="card-body">{promoter_html(project)}</div>'
+            return detail_html(project) if len(parts) == 1 else None
+        return None
+
+
+class PortalHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    portal = None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        body = self.portal.render(url.path, parse_qs(url.query))
+        if body is None:
+            self.send_error(404)
+            return
+        if self.portal.delay:
+            time.sleep(self.portal.delay)
+        payload = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def start_portal(portal, host="127.0.0.1", port=0):
+    handler = type('Handler', (PortalHandler,), {'portal': portal})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, name="fixture-portal", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic replica of the Odisha RERA project portal.")
+    parser.add_argument("--projects", type=int, default=DEFAULT_PROJECTS)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORTAL_PORT)
+    parser.add_argument("--ground-truth", help="write the expected records to this JSON Lines file and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    portal = FixturePortal(args.projects, args.page_size, args.seed, args.delay)
+    if args.ground_truth:
+        with open(args.ground_truth, 'w', encoding='utf-8') as f:
+            for record in portal.ground_truth():
+                f.write(json.dumps({field: record[field] for field in FIELD_NAMES}, ensure_ascii=False) + '\n')
+        return 0
+    server = start_portal(portal, args.host, args.port)
+    logger.info(f"Fixture portal with {args.projects} projects on http://{args.host}:{args.port}{LIST_PATH}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+import logging
+
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+PROFILES = ['full', 'lean']
+DEFAULT_ALLOWED_HOSTS = ['odisha.gov.in', '*.odisha.gov.in']
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+HIDE_WEBDRIVER_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+FULL_WINDOW_SIZE = (1920, 1080)
+LEAN_WINDOW_SIZE = (1280, 800)
+
+# URL patterns for Network.setBlockedURLs, grouped so they can be switched on and off by name.
+BLOCKED_RESOURCES = {
+    'images': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp'],
+    'fonts': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'media': ['*.mp4', '*.webm', '*.ogg', '*.mp3', '*.wav', '*.m4a'],
+    'stylesheets': ['*.css'],
+    'trackers': ['*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*facebook.net*',
+                 '*hotjar.com*', '*clarity.ms*'],
+}
+
+
+def blocked_url_patterns(categories):
+    patterns = []
+    for category in categories:
+        if category not in BLOCKED_RESOURCES:
+            raise ValueError(f"Unknown resource category: {category}")
+        for pattern in BLOCKED_RESOURCES[category]:
+            patterns.append(pattern)
+            if pattern.startswith('*.'):
+                patterns.append(pattern + '?*')
+    return patterns
+
+
+class BrowserProfile:
+    def __init__(self, name='full', allowed_hosts=None, blocked=None):
+        if name not in PROFILES:
+            raise ValueError(f"Unknown browser profile: {name}")
+        self.name = name
+        self.allowed_hosts = list(DEFAULT_ALLOWED_HOSTS if allowed_hosts is None else allowed_hosts)
+        self.blocked = list(BLOCKED_RESOURCES if blocked is None else blocked)
+        blocked_url_patterns(self.blocked)
+
+    @property
+    def lean(self):
+        return self.name == 'lean'
+
+    @property
+    def page_load_strategy(self):
+        return 'eager' if self.lean else 'normal'
+
+    def as_dict(self):
+        return {'name': self.name, 'allowed_hosts': self.allowed_hosts, 'blocked': self.blocked}
+
+    @classmethod
+    def from_dict(cls, spec):
+        return cls(spec['name'], allowed_hosts=spec.get('allowed_hosts'), blocked=spec.get('blocked'))
+
+    def host_resolver_rules(self):
+        # Every host outside the allow-list fails DNS inside Chrome, which drops third-party
+        # scripts and trackers before a connection is opened.
+        return ', '.join(['MAP * ~NOTFOUND'] + [f"EXCLUDE {host}" for host in self.allowed_hosts])
+
+    def chrome_options(self, headless=False, debugging_port=None):
+        options = Options()
+        self.configure(options, headless)
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument(f"--user-agent={USER_AGENT}")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        if debugging_port:
+            options.add_argument(f"--remote-debugging-port={debugging_port}")
+        return options
+
+    def attach_options(self, debugger_address):
+        # ChromeDriver rejects launch-only options when it attaches to a running browser, but the
+        # page load strategy belongs to the session, so it has to be set again here.
+        options = Options()
+        options.debugger_address = debugger_address
+        options.page_load_strategy = self.page_load_strategy
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        return options
+
+    def configure(self, options, headless=False):
+        if not self.lean:
+            if headless:
+                options.add_argument("--headless")
+            options.add_argument(f"--window-size={FULL_WINDOW_SIZE[0]},{FULL_WINDOW_SIZE[1]}")
+            return
+
+        if headless:
+            options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={LEAN_WINDOW_SIZE[0]},{LEAN_WINDOW_SIZE[1]}")
+        options.page_load_strategy = self.page_load_strategy
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--mute-audio")
+        if 'images' in self.blocked:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+        if self.allowed_hosts:
+            options.add_argument(f"--host-resolver-rules={self.host_resolver_rules()}")
+
+    def attach(self, driver):
+        if not self.lean or not self.blocked:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_url_patterns(self.blocked)})
+            logger.debug(f"Blocking {', '.join(self.blocked)} in the lean browser profile")
+        except Exception as e:
+            logger.warning(f"Could not enable request blocking: {e}")
@@ -0,0 +1,126 @@
+import logging
+import sqlite3
+import threading
+import time
+
+from crawler import project_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = "scrape_state.sqlite"
+
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    detail_url TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at REAL NOT NULL
+)
+"""
+
+UPSERT = """
+INSERT INTO jobs (key, detail_url, status, attempts, last_error, updated_at)
+VALUES (?, ?, ?, 1, ?, ?)
+ON CONFLICT(key) DO UPDATE SET
+    detail_url = excluded.detail_url,
+    status = excluded.status,
+    attempts = jobs.attempts + 1,
+    last_error = excluded.last_error,
+    updated_at = excluded.updated_at
+"""
+
+
+class CheckpointStore:
+    def __init__(self, path=DEFAULT_STATE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(SCHEMA)
+        self.operations = 0
+        self.rows_written = 0
+        self.time_spent = 0.0
+        self._lock = threading.Lock()
+
+    def _timed(self, operation, *args):
+        with self._lock:
+            start = time.perf_counter()
+            try:
+                return operation(*args)
+            finally:
+                self.time_spent += time.perf_counter() - start
+                self.operations += 1
+
+    def reset(self):
+        self._timed(self.conn.execute, "DELETE FROM jobs")
+
+    def _record_many(self, rows):
+        self.conn.execute("BEGIN")
+        try:
+            self.conn.executemany(UPSERT, rows)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.rows_written += len(rows)
+
+    def mark_done(self, projects):
+        now = time.time()
+        rows = [(project_key(p), p.get('detail_url', ''), STATUS_DONE, None, now) for p in projects if project_key(p)]
+        if rows:
+            self._timed(self._record_many, rows)
+
+    def mark_failed(self, project, error):
+        key = project_key(project)
+        if key:
+            row = (key, project.get('detail_url', ''), STATUS_FAILED, str(error or 'unknown error')[:500], time.time())
+            self._timed(self._record_many, [row])
+
+    def status(self, key):
+        row = self._timed(lambda: self.conn.execute("SELECT status FROM jobs WHERE key = ?", (key,)).fetchone())
+        return row[0] if row else None
+
+    def keys_with_status(self, status):
+        rows = self._timed(lambda: self.conn.execute("SELECT key FROM jobs WHERE status = ?", (status,)).fetchall())
+        return {row[0] for row in rows}
+
+    def attempts(self, key):
+        row = self._timed(lambda: self.conn.execute("SELECT attempts FROM jobs WHERE key = ?", (key,)).fetchone())
+        return row[0] if row else 0
+
+    def skip_completed(self, projects):
+        completed = self.keys_with_status(STATUS_DONE)
+        logger.info(f"Resuming: {len(completed)} projects already completed in {self.path}")
+        skipped = 0
+        for project in projects:
+            if project_key(project) in completed:
+                skipped += 1
+                continue
+            yield project
+        logger.info(f"Skipped {skipped} completed projects")
+
+    def summary(self):
+        rows = self._timed(lambda: self.conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        return dict(rows)
+
+    def overhead(self):
+        return {
+            'operations': self.operations,
+            'rows_written': self.rows_written,
+            'total_ms': round(self.time_spent * 1000, 1),
+            'mean_ms': round(self.time_spent * 1000 / self.operations, 3) if self.operations else 0.0,
+        }
+
+    def log_overhead(self, elapsed=None):
+        overhead = self.overhead()
+        share = f", {overhead['total_ms'] / (elapsed * 10):.2f}% of the run" if elapsed else ""
+        logger.info(f"Checkpoint store: {overhead['operations']} operations, {overhead['rows_written']} rows, "
+                    f"{overhead['total_ms']} ms total ({overhead['mean_ms']} ms each{share}); status {self.summary()}")
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,116 @@
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FRONTIER_SIZE = 50
+STATS_LOG_INTERVAL = 30
+
+_DONE = object()
+
+
+def project_key(project):
+    return project.get('rera_no') or project.get('detail_url') or ''
+
+
+class RegistryCrawler:
+    def __init__(self, list_scraper, limit=None, start_page=1, frontier_size=DEFAULT_FRONTIER_SIZE):
+        self.list_scraper = list_scraper
+        self.limit = limit
+        self.start_page = start_page
+        self.frontier = queue.Queue(maxsize=frontier_size)
+        self.seen = set()
+        self.pages = 0
+        self.discovered = 0
+        self.duplicates = 0
+        self.completed = 0
+        self.error = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._started_at = None
+        self._last_stats_log = 0.0
+
+    def start(self):
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._produce, name="registry-crawler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def join(self, timeout=None):
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self.frontier.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self):
+        try:
+            for page, projects in self.list_scraper.iter_list_pages(self.start_page):
+                self.pages += 1
+                for project in projects:
+                    key = project_key(project)
+                    if key and key in self.seen:
+                        self.duplicates += 1
+                        continue
+                    if key:
+                        self.seen.add(key)
+
+                    project['index'] = self.discovered
+                    if not self._put(project):
+                        return
+                    self.discovered += 1
+
+                    if self.limit and self.discovered >= self.limit:
+                        logger.info(f"Reached crawl limit of {self.limit} projects")
+                        return
+                if self._stop.is_set():
+                    return
+        except Exception as e:
+            self.error = e
+            logger.error(f"List crawl stopped on page {self.start_page + self.pages}: {e}")
+        finally:
+            self._put(_DONE)
+
+    def __iter__(self):
+        while True:
+            item = self.frontier.get()
+            if item is _DONE:
+                return
+            yield item
+
+    def record_completed(self, count=1):
+        self.completed += count
+        now = time.monotonic()
+        if now - self._last_stats_log >= STATS_LOG_INTERVAL:
+            self._last_stats_log = now
+            self.log_stats()
+
+    def stats(self):
+        elapsed = max(time.monotonic() - self._started_at, 1e-9) if self._started_at else 0.0
+        return {
+            'pages': self.pages,
+            'discovered': self.discovered,
+            'duplicates': self.duplicates,
+            'completed': self.completed,
+            'queued': self.frontier.qsize(),
+            'elapsed_s': round(elapsed, 1),
+            'pages_per_sec': round(self.pages / elapsed, 3) if elapsed else 0.0,
+            'items_per_sec': round(self.completed / elapsed, 3) if elapsed else 0.0,
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        logger.info(f"Crawl: {stats['pages']} pages, {stats['discovered']} discovered "
+                    f"({stats['duplicates']} duplicates), {stats['completed']} scraped, "
+                    f"{stats['queued']} queued - {stats['pages_per_sec']} pages/sec, "
+                    f"{stats['items_per_sec']} items/sec")
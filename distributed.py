@@ -0,0 +1,206 @@
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+
+from selenium.common.exceptions import WebDriverException
+
+from checkpoint import STATUS_DONE as CHECKPOINT_DONE
+from crawler import DEFAULT_FRONTIER_SIZE, RegistryCrawler, project_key
+from job_queue import DEFAULT_VISIBILITY_TIMEOUT, STATUS_DEAD, STATUS_DONE, STATUS_LEASED, STATUS_PENDING
+
+logger = logging.getLogger(__name__)
+
+PUSH_BATCH_SIZE = 100
+PROGRESS_INTERVAL = 30
+COORDINATOR_POLL = 5.0
+WORKER_IDLE_POLL = 2.0
+WORKER_START_ATTEMPTS = 3
+
+
+def job_key(project, position):
+    # Projects with no RERA number or detail URL still get a job each, keyed by their place in the list.
+    return project_key(project) or f"pos:{position}"
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+class Coordinator:
+    # Harvests the registry into the queue, waits for workers to drain it, then exports every result
+    # in list order through the scraper's sink, so the output matches a single-node run.
+    def __init__(self, scraper, job_queue, poll_interval=COORDINATOR_POLL):
+        self.scraper = scraper
+        self.queue = job_queue
+        self.poll_interval = poll_interval
+        self.pushed = 0
+        self.added = 0
+
+    def harvest(self, limit=None, start_page=1, frontier_size=DEFAULT_FRONTIER_SIZE, incremental=False):
+        crawler = RegistryCrawler(self.scraper, limit=limit, start_page=start_page, frontier_size=frontier_size)
+        crawler.start()
+        try:
+            projects = crawler
+            if incremental and self.scraper.index:
+                projects = self.scraper.index.plan(crawler, on_stop=crawler.stop)
+
+            # Jobs are keyed by project, so a resumed harvest only adds projects the queue has not seen;
+            # the list position is refreshed for every job and orders the exported output.
+            batch = []
+            for project in projects:
+                batch.append((self.pushed, job_key(project, self.pushed), project))
+                self.pushed += 1
+                if len(batch) >= PUSH_BATCH_SIZE:
+                    self.added += self.queue.push(batch)
+                    batch = []
+            if batch:
+                self.added += self.queue.push(batch)
+            crawler.join()
+            crawler.log_stats()
+        finally:
+            crawler.stop()
+        self.queue.close_intake()
+        logger.info(f"Queued {self.pushed} projects for workers ({self.added} new)")
+
+    def wait(self):
+        last_log = 0.0
+        while True:
+            self.queue.requeue_expired()
+            counts = self.queue.counts()
+            if not counts[STATUS_PENDING] and not counts[STATUS_LEASED]:
+                break
+            now = time.monotonic()
+            if now - last_log >= PROGRESS_INTERVAL:
+                last_log = now
+                logger.info(f"Queue: {counts[STATUS_PENDING]} pending, {counts[STATUS_LEASED]} leased, "
+                            f"{counts[STATUS_DONE]} done, {counts[STATUS_DEAD]} dead")
+            time.sleep(self.poll_interval)
+
+    def export(self):
+        exported = self.scraper.checkpoint.keys_with_status(CHECKPOINT_DONE) if self.scraper.checkpoint else set()
+        for seq, project, record in self.queue.results():
+            if project_key(project) in exported:
+                continue
+            if record is None:
+                self.scraper.retries.give_up(project, project.get('error'))
+            self.scraper.record_result(project, record)
+        self.scraper.flush_output()
+
+    def run(self, limit=None, start_page=1, frontier_size=DEFAULT_FRONTIER_SIZE, incremental=False, resume=False):
+        started = time.time()
+        if not resume:
+            self.queue.reset()
+        if resume and self.queue.intake_closed():
+            logger.info("Resuming a queue that is already fully harvested")
+        else:
+            self.harvest(limit, start_page, frontier_size, incremental)
+        self.wait()
+        self.export()
+        counts = self.queue.counts()
+        logger.info(f"Distributed crawl finished: {counts[STATUS_DONE]} done, {counts[STATUS_DEAD]} dead")
+        self.scraper.log_run_stats(time.time() - started)
+
+
+class Worker:
+    def __init__(self, scraper_factory, job_queue, worker_id=None, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT,
+                 idle_poll=WORKER_IDLE_POLL):
+        self.scraper_factory = scraper_factory
+        self.queue = job_queue
+        self.worker_id = worker_id or default_worker_id()
+        self.visibility_timeout = visibility_timeout
+        self.idle_poll = idle_poll
+        self.completed = 0
+        self.failed = 0
+        self.lost = 0
+        self.scraper = None
+
+    def _start_scraper(self):
+        for attempt in range(1, WORKER_START_ATTEMPTS + 1):
+            try:
+                return self.scraper_factory()
+            except Exception as e:
+                logger.error(f"{self.worker_id}: failed to start browser (attempt {attempt}): {e}")
+                time.sleep(attempt)
+        raise RuntimeError(f"{self.worker_id}: could not start a browser")
+
+    def _restart_scraper(self):
+        try:
+            self.scraper.close()
+        except Exception as e:
+            logger.debug(f"Error closing worker browser: {e}")
+        self.scraper = self._start_scraper()
+
+    def _driver_alive(self):
+        try:
+            self.scraper.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _heartbeat(self, seq, stop, lost):
+        # Renew well before the visibility timeout so one slow renewal does not lose the lease.
+        interval = max(1.0, self.visibility_timeout / 3)
+        while not stop.wait(interval):
+            try:
+                if not self.queue.heartbeat(seq, self.worker_id, self.visibility_timeout):
+                    lost.set()
+                    return
+            except Exception as e:
+                logger.warning(f"{self.worker_id}: heartbeat for job {seq} failed: {e}")
+
+    def process(self, job):
+        seq, project = job['seq'], job['project']
+        stop, lost = threading.Event(), threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(seq, stop, lost), name="worker-heartbeat",
+                                     daemon=True)
+        heartbeat.start()
+        try:
+            record = self.scraper.scrape_project_details(project)
+            if record is None and not self.scraper.offline and not self._driver_alive():
+                raise WebDriverException("browser stopped responding")
+        except WebDriverException as e:
+            logger.warning(f"{self.worker_id}: browser crashed on project {project['index'] + 1}: {e}")
+            project['error'] = f"browser crashed: {e}"
+            record = None
+            self._restart_scraper()
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        if lost.is_set():
+            self.lost += 1
+            logger.warning(f"{self.worker_id}: lease on project {project['index'] + 1} was lost, discarding result")
+            return
+        if record is not None and self.queue.complete(seq, self.worker_id, record):
+            self.completed += 1
+            self.scraper.metrics.count('items')
+            return
+        if record is None:
+            status = self.queue.fail(seq, self.worker_id, project.get('error'))
+            self.failed += 1
+            self.scraper.metrics.count('failures')
+            logger.info(f"{self.worker_id}: project {project['index'] + 1} failed on attempt {job['attempts']} "
+                        f"({status or 'lease lost'}): {project.get('error') or 'no data'}")
+
+    def run(self):
+        logger.info(f"Worker {self.worker_id} polling the job queue")
+        self.scraper = self._start_scraper()
+        started = time.time()
+        try:
+            while True:
+                job = self.queue.lease(self.worker_id, self.visibility_timeout)
+                if job is None:
+                    # Nothing is ready yet: the coordinator may still be harvesting or a failed job is backing off.
+                    if self.queue.drained():
+                        break
+                    time.sleep(self.idle_poll)
+                    continue
+                self.process(job)
+        finally:
+            logger.info(f"Worker {self.worker_id} finished: {self.completed} completed, {self.failed} failed, "
+                        f"{self.lost} lost leases in {time.time() - started:.0f}s")
+            self.scraper.metrics.log_summary()
+            self.scraper.close()
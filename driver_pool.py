@@ -0,0 +1,301 @@
+import argparse
+import json
+import logging
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+
+from browser_profile import PROFILES, BrowserProfile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_PORT = 8766
+DEFAULT_POOL_URL = f"http://127.0.0.1:{DEFAULT_POOL_PORT}"
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_LEASES = 50
+DEFAULT_LEASE_TIMEOUT = 1800
+DEFAULT_LEASE_WAIT = 60
+MAINTENANCE_INTERVAL = 10
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class WarmBrowser:
+    def __init__(self, profile, headless=True):
+        self.port = free_port()
+        self.debugger_address = f"127.0.0.1:{self.port}"
+        self.driver = webdriver.Chrome(options=profile.chrome_options(headless, debugging_port=self.port))
+        self.driver.get("about:blank")
+        self.leases = 0
+        self.lease_id = None
+        self.leased_at = None
+
+    def healthy(self):
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def reset(self):
+        # Leave the browser as a fresh session would find it: one blank tab, no cookies, no storage.
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+        origin = urlsplit(self.driver.current_url)
+        if origin.scheme in ('http', 'https'):
+            self.driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': f"{origin.scheme}://{origin.netloc}", 'storageTypes': 'all'})
+        self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        self.driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        self.driver.get("about:blank")
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.debug(f"Error closing pooled browser: {e}")
+
+
+class DriverPool:
+    def __init__(self, size=DEFAULT_POOL_SIZE, profile=None, headless=True, max_leases=DEFAULT_MAX_LEASES,
+                 lease_timeout=DEFAULT_LEASE_TIMEOUT):
+        self.size = size
+        self.profile = profile or BrowserProfile()
+        self.headless = headless
+        self.max_leases = max_leases
+        self.lease_timeout = lease_timeout
+        self.idle = []
+        self.leased = {}
+        self.launches = 0
+        self.recycles = 0
+        self.expired = 0
+        self._starting = 0
+        self._closed = False
+        self._available = threading.Condition()
+
+    def _launch(self):
+        try:
+            start = time.perf_counter()
+            browser = WarmBrowser(self.profile, self.headless)
+            logger.info(f"Warmed browser on {browser.debugger_address} in {time.perf_counter() - start:.1f}s")
+        except Exception as e:
+            logger.error(f"Failed to start pooled browser: {e}")
+            browser = None
+        with self._available:
+            self._starting -= 1
+            if browser is None:
+                return
+            if self._closed:
+                browser.quit()
+                return
+            self.launches += 1
+            self.idle.append(browser)
+            self._available.notify()
+
+    def _top_up(self):
+        with self._available:
+            missing = self.size - len(self.idle) - len(self.leased) - self._starting
+            self._starting += max(missing, 0)
+        for _ in range(max(missing, 0)):
+            threading.Thread(target=self._launch, name="pool-launch", daemon=True).start()
+
+    def start(self):
+        self._top_up()
+        threading.Thread(target=self._maintain, name="pool-maintenance", daemon=True).start()
+
+    def lease(self, wait=DEFAULT_LEASE_WAIT):
+        deadline = time.monotonic() + wait
+        with self._available:
+            while not self.idle:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closed:
+                    return None
+                self._available.wait(remaining)
+            browser = self.idle.pop()
+            browser.lease_id = uuid.uuid4().hex
+            browser.leased_at = time.monotonic()
+            browser.leases += 1
+            self.leased[browser.lease_id] = browser
+        return {'lease': browser.lease_id, 'debugger_address': browser.debugger_address,
+                'profile': self.profile.as_dict()}
+
+    def release(self, lease_id):
+        with self._available:
+            browser = self.leased.pop(lease_id, None)
+        if browser is None:
+            return False
+        threading.Thread(target=self._recycle_or_return, args=(browser,), name="pool-reset", daemon=True).start()
+        return True
+
+    def _recycle_or_return(self, browser):
+        browser.lease_id = None
+        reusable = browser.leases < self.max_leases and browser.healthy()
+        if reusable:
+            try:
+                browser.reset()
+            except Exception as e:
+                logger.warning(f"Could not reset pooled browser: {e}")
+                reusable = False
+        if reusable:
+            with self._available:
+                if not self._closed:
+                    self.idle.append(browser)
+                    self._available.notify()
+                    return
+        browser.quit()
+        with self._available:
+            self.recycles += 1
+        self._top_up()
+
+    def _maintain(self):
+        while not self._closed:
+            time.sleep(MAINTENANCE_INTERVAL)
+            now = time.monotonic()
+            with self._available:
+                stale = [lease_id for lease_id, browser in self.leased.items()
+                         if now - browser.leased_at > self.lease_timeout]
+                idle = list(self.idle)
+            for lease_id in stale:
+                logger.warning(f"Lease {lease_id} expired, reclaiming its browser")
+                if self.release(lease_id):
+                    with self._available:
+                        self.expired += 1
+            for browser in idle:
+                if not browser.healthy():
+                    with self._available:
+                        if browser not in self.idle:
+                            continue
+                        self.idle.remove(browser)
+                        self.recycles += 1
+                    logger.warning(f"Pooled browser on {browser.debugger_address} stopped responding")
+                    browser.quit()
+            self._top_up()
+
+    def stats(self):
+        with self._available:
+            return {
+                'size': self.size,
+                'idle': len(self.idle),
+                'leased': len(self.leased),
+                'starting': self._starting,
+                'launches': self.launches,
+                'recycles': self.recycles,
+                'expired_leases': self.expired,
+            }
+
+    def close(self):
+        with self._available:
+            self._closed = True
+            browsers = self.idle + list(self.leased.values())
+            self.idle = []
+            self.leased = {}
+            self._available.notify_all()
+        for browser in browsers:
+            browser.quit()
+
+
+class DriverPoolHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    pool = None
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/status':
+            self._reply(200, self.pool.stats())
+        else:
+            self._reply(404, {'error': 'not found'})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        parts = self.path.strip('/').split('/')
+        if parts[0] == 'lease':
+            lease = self.pool.lease()
+            self._reply(200, lease) if lease else self._reply(503, {'error': 'no browser available'})
+        elif parts[0] == 'release' and len(parts) == 2:
+            released = self.pool.release(parts[1])
+            self._reply(200 if released else 404, {'released': released})
+        else:
+            self._reply(404, {'error': 'not found'})
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def make_server(pool, host="127.0.0.1", port=DEFAULT_POOL_PORT):
+    handler = type('Handler', (DriverPoolHandler,), {'pool': pool})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+class PoolClient:
+    def __init__(self, url=DEFAULT_POOL_URL, timeout=DEFAULT_LEASE_WAIT + 5):
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+
+    def _post(self, path):
+        request = urllib.request.Request(f"{self.url}{path}", data=b'', method='POST')
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+    def lease(self):
+        try:
+            return self._post('/lease')
+        except urllib.error.HTTPError as e:
+            raise RuntimeError(f"Driver pool at {self.url} has no free browser ({e.code})")
+
+    def release(self, lease_id):
+        try:
+            self._post(f'/release/{lease_id}')
+        except Exception as e:
+            logger.warning(f"Could not release lease {lease_id}: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep warm Chrome sessions alive and lease them to scrapers.")
+    parser.add_argument("--size", type=int, default=DEFAULT_POOL_SIZE, help="number of browsers kept warm")
+    parser.add_argument("--port", type=int, default=DEFAULT_POOL_PORT)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--profile", choices=PROFILES, default="full")
+    parser.add_argument("--visible", action="store_true", help="show the browser windows")
+    parser.add_argument("--max-leases", type=int, default=DEFAULT_MAX_LEASES,
+                        help="leases before a browser is replaced with a fresh one")
+    parser.add_argument("--lease-timeout", type=int, default=DEFAULT_LEASE_TIMEOUT,
+                        help="seconds before an unreleased lease is reclaimed")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    pool = DriverPool(size=args.size, profile=BrowserProfile(args.profile), headless=not args.visible,
+                      max_leases=args.max_leases, lease_timeout=args.lease_timeout)
+    pool.start()
+    server = make_server(pool, args.host, args.port)
+    logger.info(f"Driver pool listening on http://{args.host}:{args.port} with {args.size} browsers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+from fields import complete_record
+from rules import OVERVIEW_FIELDS, PROMOTER_FIELDS, default_engine
+from scheduler import DEFAULT_MAX_ATTEMPTS, AdaptiveLimiter, backoff_delay
+from snapshot import SnapshotDocument
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_REQUEST_RATE = 4.0
+DEFAULT_TIMEOUT = 30
+DEFAULT_LATENCY_TARGET = 3.0
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# By default both tabs are read from the detail page itself. The SPA loads the promoter tab by XHR,
+# so a project whose page carries no promoter fields falls back to the browser. When the portal's
+# XHR endpoints are known (copy them from the browser's network panel), pass them in a JSON file, e.g.
+# {"overview": "/api/project/{project_id}", "promoter": "/api/project/{project_id}/promoter"}
+DEFAULT_ENDPOINTS = {
+    'overview': '{detail_url}',
+    'promoter': '{detail_url}',
+}
+
+# Normalised (lower-case, alphanumeric only) JSON keys that carry each field, in priority order.
+FIELD_KEYS = {
+    'RERA_Regd_No': ['reraregdno', 'reraregno', 'reraregistrationno', 'registrationno', 'regno', 'reranumber'],
+    'Project_Name': ['projectname', 'nameofproject', 'projecttitle'],
+    'Promoter_Name': ['promotername', 'companyname', 'nameofpromoter', 'promoter'],
+    'Promoter_Address': ['registeredofficeaddress', 'officeaddress', 'promoteraddress', 'address'],
+    'GST_No': ['gstno', 'gstin', 'gstnumber', 'gst'],
+}
+
+def project_id_from_url(detail_url):
+    parts = urlsplit(detail_url)
+    query = parse_qs(parts.query)
+    for key in ('id', 'projectId', 'project_id'):
+        if query.get(key):
+            return query[key][0]
+    return parts.path.rstrip('/').rsplit('/', 1)[-1]
+
+
+def _normalise_key(key):
+    return re.sub(r'[^a-z0-9]', '', str(key).lower())
+
+
+def find_json_field(payload, keys):
+    queue = [payload]
+    while queue:
+        node = queue.pop(0)
+        if isinstance(node, dict):
+            normalised = {_normalise_key(k): v for k, v in node.items()}
+            for key in keys:
+                value = normalised.get(key)
+                if isinstance(value, (str, int)) and str(value).strip():
+                    return str(value).strip()
+            queue.extend(v for v in node.values() if isinstance(v, (dict, list)))
+        elif isinstance(node, list):
+            queue.extend(v for v in node if isinstance(v, (dict, list)))
+    return ''
+
+
+def parse_response(body, content_type, fields, rules):
+    if 'json' not in content_type and body.lstrip()[:1] not in ('{', '['):
+        return rules.extract(SnapshotDocument(body), fields)
+
+    data = {}
+    payload = json.loads(body)
+    for field in fields:
+        value = find_json_field(payload, FIELD_KEYS[field])
+        value = rules.validate(field, value, data) if value else None
+        if value:
+            data[field] = value
+    return data
+
+
+def is_transient(error):
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500 or error.status == 429
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+def is_complete(data, promoter_answered=False):
+    # A separate promoter endpoint that answered is trusted even when it has no GST number or name;
+    # a page shared with the overview must show promoter fields itself, or the browser has to load the tab.
+    if not (data.get('RERA_Regd_No') and data.get('Project_Name')):
+        return False
+    return bool(promoter_answered or data.get('Promoter_Name') or data.get('GST_No'))
+
+
+class FastPathClient:
+    def __init__(self, base_url=None, endpoints=None, concurrency=DEFAULT_CONCURRENCY, rate=None,
+                 timeout=DEFAULT_TIMEOUT, record_dir=None, rules=None, max_attempts=DEFAULT_MAX_ATTEMPTS,
+                 latency_target=DEFAULT_LATENCY_TARGET):
+        if aiohttp is None:
+            raise RuntimeError("The HTTP engine needs aiohttp: pip install aiohttp")
+        self.base_url = base_url
+        self.endpoints = dict(DEFAULT_ENDPOINTS)
+        if endpoints:
+            self.endpoints.update(endpoints)
+        self.concurrency = concurrency
+        self.limiter = AdaptiveLimiter(rate, concurrency=concurrency, latency_target=latency_target)
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.record_dir = record_dir
+        self.rules = rules or default_engine()
+        self.requests = 0
+        self.bytes_received = 0
+        self.retries = 0
+
+    @classmethod
+    def load_endpoints(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _rebase(self, url):
+        if not self.base_url:
+            return url
+        base = urlsplit(self.base_url)
+        parts = urlsplit(url)
+        return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, ''))
+
+    def endpoint_url(self, tab, project):
+        template = self.endpoints[tab]
+        url = template.format(detail_url=project['detail_url'], project_id=project_id_from_url(project['detail_url']),
+                              rera_no=project.get('rera_no', ''))
+        if url.startswith('/'):
+            parts = urlsplit(project['detail_url'])
+            url = f"{parts.scheme}://{parts.netloc}{url}"
+        return self._rebase(url)
+
+    async def _throttle(self):
+        delay = self.limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _record(self, url, body):
+        parts = urlsplit(url)
+        path = parts.path.lstrip('/') or 'index.html'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        target = os.path.join(self.record_dir, path)
+        os.makedirs(os.path.dirname(target) or self.record_dir, exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(body)
+
+    async def _get(self, session, url, cache):
+        if url in cache:
+            return await cache[url]
+        future = asyncio.get_running_loop().create_future()
+        cache[url] = future
+        try:
+            for attempt in range(self.max_attempts):
+                await self._throttle()
+                started = time.monotonic()
+                try:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        body = await response.text()
+                        result = (body, response.headers.get('Content-Type', ''))
+                    self.limiter.record(time.monotonic() - started)
+                    break
+                except Exception as e:
+                    self.limiter.record(time.monotonic() - started, ok=False)
+                    if not is_transient(e) or attempt + 1 >= self.max_attempts:
+                        raise
+                    self.retries += 1
+                    delay = backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+                    logger.debug(f"Retrying {url} in {delay:.1f}s after {e}")
+                    await asyncio.sleep(delay)
+            self.requests += 1
+            self.bytes_received += len(body)
+            if self.record_dir:
+                self._record(url, body)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved; the caller that issued the request re-raises it.
+            future.exception()
+            raise
+
+    async def fetch_project(self, session, semaphore, project):
+        if not project.get('detail_url'):
+            return None
+        async with semaphore:
+            # The semaphore caps concurrency; the limiter narrows it further while the portal struggles.
+            while not self.limiter.try_acquire_slot():
+                await asyncio.sleep(0.05)
+            data = {}
+            responses = {}
+            promoter_answered = False
+            try:
+                for tab, fields in (('overview', OVERVIEW_FIELDS), ('promoter', PROMOTER_FIELDS)):
+                    url = self.endpoint_url(tab, project)
+                    separate = url not in responses
+                    body, content_type = await self._get(session, url, responses)
+                    data.update(parse_response(body, content_type, fields, self.rules))
+                    if tab == 'promoter':
+                        promoter_answered = separate and bool(body.strip())
+            except Exception as e:
+                logger.debug(f"Fast path failed for {project['detail_url']}: {e}")
+                return None
+            finally:
+                self.limiter.release_slot()
+
+            if not is_complete(data, promoter_answered):
+                logger.debug(f"Fast path could not parse {project['detail_url']}: {data}")
+                return None
+            return complete_record(data)
+
+    async def fetch_all(self, projects):
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=60)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        headers = {'User-Agent': USER_AGENT}
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+            return await asyncio.gather(*(self.fetch_project(session, semaphore, project) for project in projects))
+
+    def fetch_projects(self, projects):
+        projects = list(projects)
+        start = time.monotonic()
+        results = asyncio.run(self.fetch_all(projects))
+        elapsed = time.monotonic() - start
+        parsed = sum(1 for data in results if data)
+        logger.info(f"Fast path fetched {parsed}/{len(projects)} projects in {elapsed:.1f}s "
+                    f"({self.requests} requests, {self.retries} retries, {self.bytes_received} bytes; "
+                    f"{self.limiter.describe()})")
+        return list(zip(projects, results))
+
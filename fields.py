@@ -0,0 +1,9 @@
+import re
+
+FIELD_NAMES = ['RERA_Regd_No', 'Project_Name', 'Promoter_Name', 'Promoter_Address', 'GST_No']
+
+RERA_PATTERN = re.compile(r'(RP|PS)/\d{1,2}/\d{4}/\d{4,6}')
+
+
+def complete_record(data):
+    return {field: data.get(field, '') for field in FIELD_NAMES}
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from crawler import project_key
+from fields import FIELD_NAMES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = "project_index.sqlite"
+DEFAULT_CHANGES_PATH = "changes.jsonl"
+DEFAULT_REVALIDATE = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    key TEXT PRIMARY KEY,
+    rera_no TEXT,
+    detail_url TEXT,
+    content_hash TEXT,
+    record TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    last_scraped REAL
+)
+"""
+
+
+def content_hash(record):
+    content = json.dumps({field: record.get(field, '') for field in FIELD_NAMES}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class ProjectIndex:
+    def __init__(self, path=DEFAULT_INDEX_PATH, changes_path=DEFAULT_CHANGES_PATH, revalidate=DEFAULT_REVALIDATE,
+                 stop_after_known=None):
+        self.path = path
+        self.changes_path = changes_path
+        self.revalidate = revalidate
+        self.stop_after_known = stop_after_known
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(SCHEMA)
+        self.conn.commit()
+        self.counts = {'new': 0, 'known': 0, 'revalidated': 0, 'added': 0, 'changed': 0, 'unchanged': 0}
+        self._lock = threading.Lock()
+
+    def known_keys(self):
+        with self._lock:
+            return {row[0] for row in self.conn.execute("SELECT key FROM projects")}
+
+    def touch(self, keys):
+        now = time.time()
+        with self._lock:
+            self.conn.executemany("UPDATE projects SET last_seen = ? WHERE key = ?", [(now, key) for key in keys])
+            self.conn.commit()
+
+    def stalest(self, limit, scraped_before):
+        with self._lock:
+            return self.conn.execute("SELECT key, rera_no, detail_url FROM projects WHERE detail_url != '' "
+                                     "AND last_scraped < ? ORDER BY last_scraped ASC LIMIT ?",
+                                     (scraped_before, limit)).fetchall()
+
+    def plan(self, projects, on_stop=None):
+        # Yields new projects from the list harvest, then a sample of the least recently scraped
+        # known projects; known projects found in the harvest are only marked as still listed.
+        started = time.time()
+        known = self.known_keys()
+        seen = set()
+        streak = 0
+        index = 0
+        for project in projects:
+            index = max(index, project.get('index', index) + 1)
+            key = project_key(project)
+            if key in known:
+                self.counts['known'] += 1
+                seen.add(key)
+                streak += 1
+                if self.stop_after_known and streak >= self.stop_after_known:
+                    logger.info(f"Stopping the list harvest after {streak} consecutive known projects")
+                    if on_stop:
+                        on_stop()
+                    break
+                continue
+            streak = 0
+            self.counts['new'] += 1
+            yield project
+        self.touch(seen)
+
+        new = self.counts['new']
+        for key, rera_no, detail_url in self.stalest(self.revalidate, started):
+            self.counts['revalidated'] += 1
+            yield {'index': index, 'rera_no': rera_no, 'detail_url': detail_url, 'revalidation': True}
+            index += 1
+        logger.info(f"Incremental plan: {new} new projects, {self.counts['known']} already indexed, "
+                    f"{self.counts['revalidated']} revalidated")
+
+    def record(self, project, data):
+        key = project_key(project) or data.get('RERA_Regd_No', '')
+        if not key:
+            return None
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute("SELECT content_hash, record FROM projects WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                change = {'change': 'added', 'fields': {field: {'old': '', 'new': data.get(field, '')}
+                                                        for field in FIELD_NAMES if data.get(field)}}
+                merged = {field: data.get(field, '') for field in FIELD_NAMES}
+            else:
+                previous = json.loads(row[1]) if row[1] else {}
+                # A blank field is an extraction miss, not a registry change, so keep the old value.
+                merged = {field: data.get(field) or previous.get(field, '') for field in FIELD_NAMES}
+                changed = {field: {'old': previous.get(field, ''), 'new': merged[field]}
+                           for field in FIELD_NAMES if merged[field] != previous.get(field, '')}
+                change = {'change': 'changed', 'fields': changed} if changed else None
+            digest = content_hash(merged)
+            self.conn.execute(
+                "INSERT INTO projects (key, rera_no, detail_url, content_hash, record, first_seen, last_seen, "
+                "last_scraped) VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "rera_no = excluded.rera_no, detail_url = COALESCE(NULLIF(excluded.detail_url, ''), detail_url), "
+                "content_hash = excluded.content_hash, record = excluded.record, last_seen = excluded.last_seen, "
+                "last_scraped = excluded.last_scraped",
+                (key, project.get('rera_no', ''), project.get('detail_url', ''),
+                 digest, json.dumps(merged, ensure_ascii=False), now, now, now))
+            self.conn.commit()
+            if change is None:
+                self.counts['unchanged'] += 1
+                return None
+            self.counts[change['change']] += 1
+            entry = {'time': datetime.now(timezone.utc).isoformat(timespec='seconds'), 'key': key,
+                     'hash': digest, **change}
+            if self.changes_path:
+                with open(self.changes_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        if change['change'] == 'changed':
+            logger.info(f"Project {key} changed: {', '.join(change['fields'])}")
+        return entry
+
+    def log_summary(self):
+        logger.info(f"Project index: {self.counts['added']} added, {self.counts['changed']} changed, "
+                    f"{self.counts['unchanged']} unchanged"
+                    + (f"; change log in {self.changes_path}" if self.changes_path else ""))
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,379 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from scheduler import DEFAULT_MAX_ATTEMPTS, backoff_delay
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_PATH = "jobs.sqlite"
+DEFAULT_REDIS_PREFIX = "rera:queue"
+DEFAULT_VISIBILITY_TIMEOUT = 300
+RETRY_BASE_DELAY = 5.0
+RETRY_MAX_DELAY = 300.0
+
+STATUS_PENDING = 'pending'
+STATUS_LEASED = 'leased'
+STATUS_DONE = 'done'
+STATUS_DEAD = 'dead'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue_jobs (
+    seq INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    position INTEGER NOT NULL,
+    project TEXT NOT NULL,
+    status TEXT NOT NULL,
+    worker TEXT,
+    available_at REAL NOT NULL DEFAULT 0,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    record TEXT,
+    last_error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS queue_jobs_status ON queue_jobs (status, available_at);
+CREATE TABLE IF NOT EXISTS queue_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def retry_delay(attempts):
+    return backoff_delay(attempts - 1, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+
+
+class SQLiteJobQueue:
+    # Leases are claimed inside BEGIN IMMEDIATE transactions, so any number of worker processes on
+    # hosts sharing the file can poll the same queue. Network filesystems without reliable locking
+    # should use the Redis backend instead.
+    def __init__(self, path=DEFAULT_QUEUE_PATH, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def _transaction(self, operation, *args):
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = operation(*args)
+                self.conn.execute("COMMIT")
+                return result
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def reset(self):
+        self._transaction(lambda: (self.conn.execute("DELETE FROM queue_jobs"),
+                                   self.conn.execute("DELETE FROM queue_meta")))
+
+    def _push(self, jobs, now):
+        rows = [(key, position, json.dumps(project, ensure_ascii=False)) for position, key, project in jobs]
+        added = self.conn.executemany("INSERT OR IGNORE INTO queue_jobs (key, position, project, status, updated_at) "
+                                      "VALUES (?, ?, ?, ?, ?)",
+                                      [row + (STATUS_PENDING, now) for row in rows]).rowcount
+        # A project seen again keeps its status and attempts; only its place in the list moves.
+        self.conn.executemany("UPDATE queue_jobs SET position = ?, project = ? WHERE key = ?",
+                              [(position, project, key) for key, position, project in rows])
+        return added
+
+    def push(self, jobs):
+        # jobs are (position, key, project): the key identifies the project across harvests and the
+        # position orders leases and results the way the list does.
+        return self._transaction(self._push, jobs, time.time())
+
+    def close_intake(self):
+        self._transaction(self.conn.execute,
+                          "INSERT OR REPLACE INTO queue_meta (key, value) VALUES ('intake_closed', '1')")
+
+    def intake_closed(self):
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM queue_meta WHERE key = 'intake_closed'").fetchone()
+        return bool(row)
+
+    def _requeue_expired(self, now):
+        expired = self.conn.execute("SELECT seq, attempts FROM queue_jobs WHERE status = ? AND lease_expires < ?",
+                                    (STATUS_LEASED, now)).fetchall()
+        for seq, attempts in expired:
+            status = STATUS_DEAD if attempts >= self.max_attempts else STATUS_PENDING
+            self.conn.execute("UPDATE queue_jobs SET status = ?, worker = NULL, lease_expires = NULL, "
+                              "available_at = ?, last_error = 'lease expired', updated_at = ? WHERE seq = ?",
+                              (status, now, now, seq))
+        return len(expired)
+
+    def requeue_expired(self):
+        requeued = self._transaction(self._requeue_expired, time.time())
+        if requeued:
+            logger.warning(f"Re-queued {requeued} jobs whose leases expired")
+        return requeued
+
+    def _lease(self, worker, visibility_timeout):
+        now = time.time()
+        self._requeue_expired(now)
+        row = self.conn.execute("SELECT seq, project, attempts FROM queue_jobs WHERE status = ? AND available_at <= ? "
+                                "ORDER BY position, seq LIMIT 1", (STATUS_PENDING, now)).fetchone()
+        if row is None:
+            return None
+        seq, project, attempts = row
+        self.conn.execute("UPDATE queue_jobs SET status = ?, worker = ?, lease_expires = ?, attempts = attempts + 1, "
+                          "updated_at = ? WHERE seq = ?", (STATUS_LEASED, worker, now + visibility_timeout, now, seq))
+        return {'seq': seq, 'project': json.loads(project), 'attempts': attempts + 1}
+
+    def lease(self, worker, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT):
+        return self._transaction(self._lease, worker, visibility_timeout)
+
+    def heartbeat(self, seq, worker, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT):
+        cursor = self._transaction(self.conn.execute,
+                                   "UPDATE queue_jobs SET lease_expires = ?, updated_at = ? "
+                                   "WHERE seq = ? AND worker = ? AND status = ?",
+                                   (time.time() + visibility_timeout, time.time(), seq, worker, STATUS_LEASED))
+        return cursor.rowcount == 1
+
+    def complete(self, seq, worker, record):
+        cursor = self._transaction(self.conn.execute,
+                                   "UPDATE queue_jobs SET status = ?, worker = NULL, lease_expires = NULL, record = ?, "
+                                   "last_error = NULL, updated_at = ? WHERE seq = ? AND worker = ? AND status = ?",
+                                   (STATUS_DONE, json.dumps(record, ensure_ascii=False), time.time(), seq, worker,
+                                    STATUS_LEASED))
+        return cursor.rowcount == 1
+
+    def _fail(self, seq, worker, error):
+        row = self.conn.execute("SELECT attempts FROM queue_jobs WHERE seq = ? AND worker = ? AND status = ?",
+                                (seq, worker, STATUS_LEASED)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        status = STATUS_DEAD if row[0] >= self.max_attempts else STATUS_PENDING
+        available_at = now if status == STATUS_DEAD else now + retry_delay(row[0])
+        self.conn.execute("UPDATE queue_jobs SET status = ?, worker = NULL, lease_expires = NULL, available_at = ?, "
+                          "last_error = ?, updated_at = ? WHERE seq = ?", (status, available_at, error, now, seq))
+        return status
+
+    def fail(self, seq, worker, error=None):
+        return self._transaction(self._fail, seq, worker, str(error or 'no data'))
+
+    def counts(self):
+        with self._lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM queue_jobs GROUP BY status").fetchall()
+        counts = {STATUS_PENDING: 0, STATUS_LEASED: 0, STATUS_DONE: 0, STATUS_DEAD: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def drained(self):
+        counts = self.counts()
+        return self.intake_closed() and not counts[STATUS_PENDING] and not counts[STATUS_LEASED]
+
+    def results(self):
+        with self._lock:
+            rows = self.conn.execute("SELECT seq, project, status, record, last_error, attempts FROM queue_jobs "
+                                     "ORDER BY position, seq").fetchall()
+        for seq, project, status, record, error, attempts in rows:
+            project = json.loads(project)
+            project['attempts'] = attempts
+            if error:
+                project['error'] = error
+            yield seq, project, json.loads(record) if status == STATUS_DONE else None
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+# A job is enqueued only the first time its key is seen, so a resumed harvest never puts done,
+# leased or dead jobs back in pending. ARGV holds (position, key, project) triples.
+PUSH_SCRIPT = """
+local added = 0
+for i = 1, #ARGV, 3 do
+    local seq = redis.call('HGET', KEYS[1], ARGV[i + 1])
+    if not seq then
+        seq = redis.call('HINCRBY', KEYS[5], 'next_seq', 1)
+        redis.call('HSET', KEYS[1], ARGV[i + 1], seq)
+        redis.call('ZADD', KEYS[3], 0, seq)
+        added = added + 1
+    end
+    redis.call('HSET', KEYS[2], seq, ARGV[i + 2])
+    redis.call('HSET', KEYS[4], seq, ARGV[i])
+end
+return added
+"""
+
+LEASE_SCRIPT = """
+local item = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 1)[1]
+if not item then return nil end
+redis.call('ZREM', KEYS[1], item)
+redis.call('ZADD', KEYS[2], ARGV[2], item)
+redis.call('HSET', KEYS[3], item, ARGV[3])
+local attempts = redis.call('HINCRBY', KEYS[4], item, 1)
+return {item, redis.call('HGET', KEYS[5], item), attempts}
+"""
+
+HEARTBEAT_SCRIPT = """
+if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then return 0 end
+if not redis.call('ZSCORE', KEYS[1], ARGV[1]) then return 0 end
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+return 1
+"""
+
+COMPLETE_SCRIPT = """
+if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then return 0 end
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 0 then return 0 end
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('HSET', KEYS[3], ARGV[1], ARGV[3])
+redis.call('HDEL', KEYS[4], ARGV[1])
+return 1
+"""
+
+FAIL_SCRIPT = """
+if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then return nil end
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 0 then return nil end
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('HSET', KEYS[4], ARGV[1], ARGV[3])
+if tonumber(redis.call('HGET', KEYS[5], ARGV[1]) or '0') >= tonumber(ARGV[4]) then
+    redis.call('SADD', KEYS[6], ARGV[1])
+    return 'dead'
+end
+redis.call('ZADD', KEYS[3], ARGV[5], ARGV[1])
+return 'pending'
+"""
+
+REQUEUE_EXPIRED_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+for _, item in ipairs(expired) do
+    redis.call('ZREM', KEYS[1], item)
+    redis.call('HDEL', KEYS[2], item)
+    redis.call('HSET', KEYS[4], item, 'lease expired')
+    if tonumber(redis.call('HGET', KEYS[5], item) or '0') >= tonumber(ARGV[2]) then
+        redis.call('SADD', KEYS[6], item)
+    else
+        redis.call('ZADD', KEYS[3], ARGV[1], item)
+    end
+end
+return #expired
+"""
+
+
+class RedisJobQueue:
+    # Same contract as SQLiteJobQueue, with each state change done atomically in a Lua script.
+    def __init__(self, url, max_attempts=DEFAULT_MAX_ATTEMPTS, prefix=DEFAULT_REDIS_PREFIX):
+        if redis is None:
+            raise RuntimeError("The Redis job queue needs redis-py: pip install redis")
+        self.url = url
+        self.max_attempts = max_attempts
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.keys = {name: f"{prefix}:{name}" for name in
+                     ('index', 'jobs', 'positions', 'pending', 'leased', 'owner', 'attempts', 'results', 'errors',
+                      'dead', 'meta')}
+        self._push_script = self.client.register_script(PUSH_SCRIPT)
+        self._lease_script = self.client.register_script(LEASE_SCRIPT)
+        self._heartbeat_script = self.client.register_script(HEARTBEAT_SCRIPT)
+        self._complete_script = self.client.register_script(COMPLETE_SCRIPT)
+        self._fail_script = self.client.register_script(FAIL_SCRIPT)
+        self._requeue_script = self.client.register_script(REQUEUE_EXPIRED_SCRIPT)
+
+    def reset(self):
+        self.client.delete(*self.keys.values())
+
+    def push(self, jobs):
+        if not jobs:
+            return 0
+        keys = self.keys
+        args = []
+        for position, key, project in jobs:
+            args.extend([position, key, json.dumps(project, ensure_ascii=False)])
+        return self._push_script(keys=[keys['index'], keys['jobs'], keys['pending'], keys['positions'], keys['meta']],
+                                 args=args)
+
+    def close_intake(self):
+        self.client.hset(self.keys['meta'], 'intake_closed', 1)
+
+    def intake_closed(self):
+        return bool(self.client.hget(self.keys['meta'], 'intake_closed'))
+
+    def _expired_keys(self):
+        keys = self.keys
+        return [keys['leased'], keys['owner'], keys['pending'], keys['errors'], keys['attempts'], keys['dead']]
+
+    def requeue_expired(self):
+        requeued = self._requeue_script(keys=self._expired_keys(), args=[time.time(), self.max_attempts])
+        if requeued:
+            logger.warning(f"Re-queued {requeued} jobs whose leases expired")
+        return requeued
+
+    def lease(self, worker, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT):
+        now = time.time()
+        self._requeue_script(keys=self._expired_keys(), args=[now, self.max_attempts])
+        keys = self.keys
+        leased = self._lease_script(keys=[keys['pending'], keys['leased'], keys['owner'], keys['attempts'],
+                                          keys['jobs']], args=[now, now + visibility_timeout, worker])
+        if not leased:
+            return None
+        seq, project, attempts = leased
+        return {'seq': int(seq), 'project': json.loads(project), 'attempts': int(attempts)}
+
+    def heartbeat(self, seq, worker, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT):
+        return bool(self._heartbeat_script(keys=[self.keys['leased'], self.keys['owner']],
+                                           args=[seq, worker, time.time() + visibility_timeout]))
+
+    def complete(self, seq, worker, record):
+        keys = self.keys
+        return bool(self._complete_script(keys=[keys['leased'], keys['owner'], keys['results'], keys['errors']],
+                                          args=[seq, worker, json.dumps(record, ensure_ascii=False)]))
+
+    def fail(self, seq, worker, error=None):
+        keys = self.keys
+        attempts = int(self.client.hget(keys['attempts'], seq) or 0)
+        return self._fail_script(keys=[keys['leased'], keys['owner'], keys['pending'], keys['errors'],
+                                       keys['attempts'], keys['dead']],
+                                 args=[seq, worker, str(error or 'no data'), self.max_attempts,
+                                       time.time() + retry_delay(max(attempts, 1))])
+
+    def counts(self):
+        keys = self.keys
+        pipe = self.client.pipeline()
+        pipe.zcard(keys['pending'])
+        pipe.zcard(keys['leased'])
+        pipe.hlen(keys['results'])
+        pipe.scard(keys['dead'])
+        pending, leased, done, dead = pipe.execute()
+        return {STATUS_PENDING: pending, STATUS_LEASED: leased, STATUS_DONE: done, STATUS_DEAD: dead}
+
+    def drained(self):
+        counts = self.counts()
+        return self.intake_closed() and not counts[STATUS_PENDING] and not counts[STATUS_LEASED]
+
+    def results(self):
+        keys = self.keys
+        jobs = self.client.hgetall(keys['jobs'])
+        positions = self.client.hgetall(keys['positions'])
+        records = self.client.hgetall(keys['results'])
+        errors = self.client.hgetall(keys['errors'])
+        attempts = self.client.hgetall(keys['attempts'])
+        for seq in sorted(jobs, key=lambda seq: (int(positions.get(seq, 0)), int(seq))):
+            project = json.loads(jobs[seq])
+            project['attempts'] = int(attempts.get(seq, 0))
+            if seq in errors:
+                project['error'] = errors[seq]
+            yield int(seq), project, json.loads(records[seq]) if seq in records else None
+
+    def close(self):
+        self.client.close()
+
+
+def open_queue(url=DEFAULT_QUEUE_PATH, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisJobQueue(url, max_attempts)
+    if url.startswith('sqlite:///'):
+        url = url[len('sqlite:///'):]
+    return SQLiteJobQueue(url, max_attempts)
@@ -0,0 +1,192 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Runs every field's rule cascade and validators inside the page and returns one result per field,
+# so a tab costs a single WebDriver round-trip. Mirrors Rule.candidates and the VALIDATORS in
+# rules.py; a field whose rules or validators cannot be evaluated here is marked for fallback.
+BATCH_EXTRACT_SCRIPT = """
+var fields = arguments[0], context = arguments[1] || {}, results = [];
+
+function hidden(el) {
+    return !el.getClientRects().length || getComputedStyle(el).visibility === 'hidden';
+}
+
+function textOf(el) {
+    if (hidden(el)) return '';
+    return (el.innerText || '').split('\\n').map(function (line) {
+        return line.replace(/\\s+/g, ' ').trim();
+    }).filter(function (line) { return line; }).join('\\n');
+}
+
+function elements(selector, root) {
+    var result = document.evaluate(selector, root || document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < result.snapshotLength; i++) {
+        var node = result.snapshotItem(i);
+        // WebDriver rejects XPath results that are not elements, which fails the whole rule.
+        if (node.nodeType !== 1) throw new Error('XPath result is not an element: ' + selector);
+        nodes.push(node);
+    }
+    return nodes;
+}
+
+function containsAny(text, values) {
+    return values.some(function (value) { return text.indexOf(value) >= 0; });
+}
+
+var VALIDATORS = {
+    min_length: function (spec) {
+        return function (text) { return text.length >= spec.value ? text : null; };
+    },
+    not_numeric: function () {
+        return function (text) { return /^[\\p{Nd}\\s.\\/-]+$/u.test(text) ? null : text; };
+    },
+    exclude: function (spec) {
+        return function (text) { return containsAny(text, spec.values) ? null : text; };
+    },
+    not_equal: function (spec) {
+        return function (text) { return spec.values.indexOf(text) >= 0 ? null : text; };
+    },
+    contains_any: function (spec) {
+        if (spec.ignore_case) {
+            var upper = spec.values.map(function (value) { return value.toUpperCase(); });
+            return function (text) { return containsAny(text.toUpperCase(), upper) ? text : null; };
+        }
+        return function (text) { return containsAny(text, spec.values) ? text : null; };
+    },
+    regex: function (spec) {
+        var pattern = new RegExp(spec.pattern, 'u');
+        return function (text) {
+            var match = pattern.exec(text);
+            if (!match) return null;
+            return spec.extract ? match[0] : text;
+        };
+    },
+    exclude_field: function (spec) {
+        return function (text, record) {
+            return record[spec.field] && text.indexOf(record[spec.field]) >= 0 ? null : text;
+        };
+    },
+    gstin: function (spec) {
+        return function (text) {
+            var clean = text.toUpperCase().replace(/[^A-Z0-9]/g, '');
+            if (clean.length === 15 && /^[0-9]{2}[A-Z]{5}/.test(clean)) return clean;
+            if (spec.loose && text.length >= 15 && /\\p{L}/u.test(text) && /\\p{N}/u.test(text)) return text;
+            return null;
+        };
+    }
+};
+
+function compile(specs) {
+    return specs.map(function (spec) {
+        if (!VALIDATORS[spec.type]) throw new Error('Unknown validator type: ' + spec.type);
+        return VALIDATORS[spec.type](spec);
+    });
+}
+
+function candidates(rule, record) {
+    if (rule.type === 'xpath') return elements(rule.xpath).map(textOf);
+    if (rule.type === 'near_field') {
+        var value = record[rule.field];
+        if (!value) return [];
+        var texts = [];
+        elements("//*[contains(text(), '" + value + "')]").forEach(function (anchor) {
+            var parent = anchor.parentElement;
+            if (!parent) throw new Error('No parent element');
+            for (var i = 0; i < parent.children.length; i++) texts.push(textOf(parent.children[i]));
+        });
+        return texts;
+    }
+    if (rule.type === 'title') {
+        var title = document.title;
+        if (!title || (rule.requires && title.indexOf(rule.requires) < 0)) return [];
+        var parts = title.split(rule.separator);
+        if (rule.split === 'last' && parts.length > 2) {
+            parts = [parts.slice(0, -1).join(rule.separator), parts[parts.length - 1]];
+        }
+        return parts.map(function (part) { return part.trim(); });
+    }
+    throw new Error('Unknown rule type: ' + rule.type);
+}
+
+for (var f = 0; f < fields.length; f++) {
+    var field = fields[f], compiled = [];
+    try {
+        for (var c = 0; c < field.rules.length; c++) compiled.push(compile(field.rules[c].validators));
+    } catch (e) {
+        results.push({fallback: true, error: String(e)});
+        continue;
+    }
+    var value = null, hit = -1, probes = 0, timings = [];
+    for (var r = 0; r < field.rules.length; r++) {
+        var start = performance.now(), found = null;
+        probes++;
+        try {
+            var texts = candidates(field.rules[r], context);
+            for (var t = 0; t < texts.length && !found; t++) {
+                var text = texts[t];
+                for (var v = 0; text && v < compiled[r].length; v++) text = compiled[r][v](text, context);
+                found = text || null;
+            }
+        } catch (e) {
+            found = null;
+        }
+        timings.push([performance.now() - start, !!found]);
+        if (found) {
+            value = found;
+            hit = r;
+            break;
+        }
+    }
+    if (value) context[field.name] = value;
+    results.push({value: value, hit: hit, probes: probes, timings: timings});
+}
+return results;
+"""
+
+
+def field_spec(field, rules):
+    return {
+        'name': field.name,
+        'rules': [{**rule.spec, 'type': rule.type, 'validators': rule.spec.get('validators', field.spec.get('validators', []))}
+                  for rule in rules],
+    }
+
+
+class BatchDocument:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def extract_fields(self, fields, record, observe=None):
+        # Rule order can be rebound by a concurrent reorder, so pin the order the script will use.
+        orders = [field.rules for field in fields]
+        try:
+            results = self.driver.execute_script(BATCH_EXTRACT_SCRIPT,
+                                                 [field_spec(field, rules) for field, rules in zip(fields, orders)],
+                                                 record)
+        except Exception as e:
+            logger.warning(f"Batched extraction failed, querying selectors one by one: {e}")
+            results = [None] * len(fields)
+
+        outcomes = []
+        context = dict(record)
+        fallback = False
+        for field, rules, result in zip(fields, orders, results):
+            # Once one field falls back, later fields depend on its value, so they fall back too.
+            fallback = fallback or result is None or result.get('fallback', False)
+            if fallback:
+                if result and result.get('error'):
+                    logger.debug(f"{field.name} cannot be extracted in the browser: {result['error']}")
+                value, probes = field.extract(self.driver, context, observe)
+            else:
+                value, probes = result['value'], result['probes']
+                if result['hit'] >= 0:
+                    rules[result['hit']].hits += 1
+                if observe:
+                    for rule, (ms, matched) in zip(rules, result['timings']):
+                        observe(field.name, rule.describe(), ms / 1000, matched)
+            if value:
+                context[field.name] = value
+            outcomes.append((value, probes))
+        return outcomes
@@ -0,0 +1,198 @@
+import collections
+import contextlib
+import functools
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scheduler import percentile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPORT_PATH = "run_report.json"
+SAMPLE_LIMIT = 10000
+QUANTILES = [0.5, 0.95, 0.99]
+METRIC_PREFIX = "rera_scraper"
+
+
+def distribution(samples):
+    samples = list(samples)
+    summary = {'count': len(samples), 'mean': round(sum(samples) / len(samples), 4) if samples else 0.0}
+    for fraction in QUANTILES:
+        summary[f"p{int(fraction * 100)}"] = round(percentile(samples, fraction), 4)
+    summary['max'] = round(max(samples), 4) if samples else 0.0
+    return summary
+
+
+def timed(stage):
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.span(stage):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class Metrics:
+    def __init__(self):
+        self.started_at = time.time()
+        self.stages = collections.defaultdict(lambda: collections.deque(maxlen=SAMPLE_LIMIT))
+        self.stage_totals = collections.defaultdict(lambda: [0, 0.0, 0])
+        self.round_trips = collections.deque(maxlen=SAMPLE_LIMIT)
+        self.counters = collections.Counter()
+        self.probes = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    @contextlib.contextmanager
+    def span(self, stage):
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.observe(stage, time.perf_counter() - start, failed)
+
+    def observe(self, stage, seconds, failed=False):
+        with self._lock:
+            self.stages[stage].append(seconds)
+            totals = self.stage_totals[stage]
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += failed
+
+    def observe_probe(self, field, selector, seconds, matched):
+        with self._lock:
+            probe = self.probes.setdefault((field, selector), [0, 0, 0.0])
+            probe[0] += 1
+            probe[1] += matched
+            probe[2] += seconds
+
+    def observe_round_trips(self, commands):
+        with self._lock:
+            self.round_trips.append(commands)
+            self.counters['webdriver_commands'] += commands
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+
+    @staticmethod
+    def instrument_driver(driver):
+        # Every WebDriver command goes through driver.execute, so counting there counts round-trips.
+        if hasattr(driver, 'round_trips'):
+            return
+        execute = driver.execute
+        driver.round_trips = 0
+
+        def counting_execute(command, params=None):
+            driver.round_trips += 1
+            return execute(command, params)
+
+        driver.execute = counting_execute
+
+    def report(self):
+        elapsed = time.time() - self.started_at
+        with self._lock:
+            stages = {stage: {**distribution(samples), 'total_count': self.stage_totals[stage][0],
+                              'total_seconds': round(self.stage_totals[stage][1], 3),
+                              'errors': self.stage_totals[stage][2]}
+                      for stage, samples in self.stages.items()}
+            selectors = collections.defaultdict(list)
+            for (field, selector), (probes, matches, seconds) in self.probes.items():
+                selectors[field].append({'selector': selector, 'probes': probes, 'matches': matches,
+                                         'mean_ms': round(seconds / probes * 1000, 3) if probes else 0.0})
+            for probes in selectors.values():
+                probes.sort(key=lambda probe: -probe['probes'])
+            counters = dict(self.counters)
+            round_trips = distribution(self.round_trips)
+        items = counters.get('items', 0)
+        return {
+            'started': datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(timespec='seconds'),
+            'elapsed_s': round(elapsed, 1),
+            'items': items,
+            'failures': counters.get('failures', 0),
+            'items_per_min': round(items / elapsed * 60, 2) if elapsed else 0.0,
+            'stages': stages,
+            'round_trips_per_page': round_trips,
+            'selectors': dict(selectors),
+            'counters': counters,
+        }
+
+    def write_report(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+        logger.info(f"Run report written to {path}")
+
+    def log_summary(self):
+        report = self.report()
+        logger.info(f"Run: {report['items']} items in {report['elapsed_s']}s ({report['items_per_min']} items/min), "
+                    f"{report['round_trips_per_page']['mean']} WebDriver round-trips per page")
+        for stage, summary in sorted(report['stages'].items(), key=lambda item: -item[1]['total_seconds']):
+            logger.info(f"Stage {stage}: {summary['total_count']} calls, p50 {summary['p50']:.3f}s, "
+                        f"p95 {summary['p95']:.3f}s, p99 {summary['p99']:.3f}s, {summary['total_seconds']}s total")
+
+    def prometheus_text(self):
+        report = self.report()
+        lines = [f"# TYPE {METRIC_PREFIX}_stage_seconds summary"]
+        for stage, summary in report['stages'].items():
+            for fraction in QUANTILES:
+                lines.append(f'{METRIC_PREFIX}_stage_seconds{{stage="{stage}",quantile="{fraction}"}} '
+                             f'{summary[f"p{int(fraction * 100)}"]}')
+            lines.append(f'{METRIC_PREFIX}_stage_seconds_count{{stage="{stage}"}} {summary["total_count"]}')
+            lines.append(f'{METRIC_PREFIX}_stage_seconds_sum{{stage="{stage}"}} {summary["total_seconds"]}')
+        lines.append(f"# TYPE {METRIC_PREFIX}_round_trips_per_page summary")
+        for fraction in QUANTILES:
+            lines.append(f'{METRIC_PREFIX}_round_trips_per_page{{quantile="{fraction}"}} '
+                         f'{report["round_trips_per_page"][f"p{int(fraction * 100)}"]}')
+        for name, key in (('selector_probes', 'probes'), ('selector_matches', 'matches')):
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name}_total counter")
+            for field, probes in report['selectors'].items():
+                for probe in probes:
+                    selector = probe['selector'].replace('\\', '\\\\').replace('"', '\\"')
+                    lines.append(f'{METRIC_PREFIX}_{name}_total{{field="{field}",selector="{selector}"}} {probe[key]}')
+        for name, value in sorted(report['counters'].items()):
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name}_total counter")
+            lines.append(f"{METRIC_PREFIX}_{name}_total {value}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_items_per_minute gauge")
+        lines.append(f"{METRIC_PREFIX}_items_per_minute {report['items_per_min']}")
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port, host="127.0.0.1"):
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] == '/metrics':
+                    body, content_type = metrics.prometheus_text().encode('utf-8'), 'text/plain; version=0.0.4'
+                elif self.path.split('?', 1)[0] == '/report':
+                    body, content_type = json.dumps(metrics.report()).encode('utf-8'), 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True).start()
+        logger.info(f"Serving metrics on http://{host}:{self._server.server_port}/metrics")
+        return self._server
+
+    def close(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,248 @@
+import argparse
+import logging
+import os
+import time
+
+import numpy as np
+
+from fields import FIELD_NAMES, RERA_PATTERN
+from sinks import DEFAULT_OUTPUT, EXTENSIONS
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NORMALIZED_OUTPUT = "odisha_rera_projects.normalized.csv"
+NORMALIZED_FIELDS = FIELD_NAMES + ['Promoter_District', 'Promoter_PIN', 'GST_Valid', 'Promoter_Key', 'Flags']
+
+GSTIN_ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+GSTIN_FORMAT = r'\d{2}[A-Z]{5}\d{4}[A-Z][1-9A-Z]Z[0-9A-Z]'
+GST_PLACEHOLDERS = r'(?i)^(?:N/?A|NIL|NONE|NULL|NOT\s+(?:AVAILABLE|APPLICABLE)|-+)?$'
+
+ODISHA_DISTRICTS = ['Angul', 'Balangir', 'Balasore', 'Bargarh', 'Bhadrak', 'Boudh', 'Cuttack', 'Deogarh', 'Dhenkanal',
+                    'Gajapati', 'Ganjam', 'Jagatsinghpur', 'Jajpur', 'Jharsuguda', 'Kalahandi', 'Kandhamal',
+                    'Kendrapara', 'Keonjhar', 'Khordha', 'Koraput', 'Malkangiri', 'Mayurbhanj', 'Nabarangpur',
+                    'Nayagarh', 'Nuapada', 'Puri', 'Rayagada', 'Sambalpur', 'Subarnapur', 'Sundargarh']
+DISTRICT_ALIASES = {'Bolangir': 'Balangir', 'Baleswar': 'Balasore', 'Baleshwar': 'Balasore', 'Debagarh': 'Deogarh',
+                    'Jagatsingpur': 'Jagatsinghpur', 'Kendujhar': 'Keonjhar', 'Khurda': 'Khordha', 'Khurdha': 'Khordha',
+                    'Nawarangpur': 'Nabarangpur', 'Sonepur': 'Subarnapur', 'Baudh': 'Boudh'}
+
+# Each pattern is applied to the whole column at once; the leading greedy .* makes the match the last
+# one in the address, which is where the district and PIN usually sit. The patterns stay within RE2
+# syntax (named groups, no lookaround) so Arrow can run them without a per-row Python call.
+DISTRICT_NAMES = {name.upper(): name for name in ODISHA_DISTRICTS}
+DISTRICT_NAMES.update({alias.upper(): name for alias, name in DISTRICT_ALIASES.items()})
+_DISTRICT_ALTERNATION = '|'.join(sorted(DISTRICT_NAMES, key=len, reverse=True))
+DISTRICT_LABELLED = rf'(?is)^.*\bDist(?:rict)?\b[.:\-\s]*(?P<district>{_DISTRICT_ALTERNATION})\b'
+DISTRICT_ANYWHERE = rf'(?is)^.*\b(?P<district>{_DISTRICT_ALTERNATION})\b'
+PIN_PATTERN = r'(?s)^.*(?:^|\D)(?P<head>[1-9]\d{2}) ?(?P<tail>\d{3})(?:\D|$)'
+
+# Legal-form spellings folded together so "M/S. X PVT. LTD" and "X Private Limited" share a key.
+PROMOTER_REPLACEMENTS = [
+    (r'^\s*(?:M/S\.?|MESSRS\.?|M/S)\s*', ''),
+    (r'&', ' AND '),
+    (r'[^\w\s]', ' '),
+    (r'\bPVT\b', 'PRIVATE'),
+    (r'\b(?:LTD|LIMITED|LIMTED)\b', 'LIMITED'),
+    (r'\bCO\b', 'COMPANY'),
+    (r'\bCORP\b', 'CORPORATION'),
+    (r'\s+', ' '),
+]
+
+PROJECT_NAME_LABELS = r'(?i)^(?:RERA\s+Regd\.?\s+No\.?|Project\s+Name|Promoter\s+Name|Name)$'
+
+
+def require_pandas():
+    if pd is None:
+        raise RuntimeError("Normalization needs pandas: pip install pandas")
+
+
+def arrow_strings(column):
+    # pandas only hands str.extract to Arrow's RE2 engine for Arrow-typed columns.
+    return column.astype(pd.ArrowDtype(pyarrow.string())) if pyarrow is not None else column
+
+
+def extract(column, pattern):
+    return column.str.extract(pattern, expand=True).fillna('').astype(str)
+
+
+def gstin_checksum_valid(values):
+    # Mod-36 GSTIN check digit over a (rows x 15) code matrix: odd positions are doubled and each
+    # product contributes its base-36 digits, all as numpy array arithmetic.
+    valid = np.zeros(len(values), dtype=bool)
+    if not len(values):
+        return valid
+    codes = np.frombuffer(''.join(values).encode('ascii'), dtype=np.uint8).reshape(-1, 15).astype(np.int64)
+    digits = np.where(codes <= ord('9'), codes - ord('0'), codes - ord('A') + 10)
+    products = digits[:, :14] * np.tile([1, 2], 7)
+    total = (products // 36 + products % 36).sum(axis=1)
+    return (36 - total % 36) % 36 == digits[:, 14]
+
+
+def load_records(path, format=None):
+    require_pandas()
+    format = format or EXTENSIONS.get(os.path.splitext(path)[1].lower(), 'csv')
+    if format == 'csv':
+        frame = pd.read_csv(path, dtype=str, keep_default_na=False)
+    elif format == 'jsonl':
+        frame = pd.read_json(path, lines=True, dtype=str)
+    elif format == 'parquet':
+        frame = pd.read_parquet(path)
+    else:
+        raise ValueError(f"Unknown input format: {format}")
+    for field in FIELD_NAMES:
+        if field not in frame:
+            frame[field] = ''
+    return frame[FIELD_NAMES].fillna('').astype(str)
+
+
+def save_records(frame, path, format=None):
+    format = format or EXTENSIONS.get(os.path.splitext(path)[1].lower(), 'csv')
+    if format == 'csv':
+        frame.to_csv(path, index=False)
+    elif format == 'jsonl':
+        frame.to_json(path, orient='records', lines=True, force_ascii=False)
+    elif format == 'parquet':
+        frame.to_parquet(path, index=False)
+    else:
+        raise ValueError(f"Unknown output format: {format}")
+
+
+def clean_text(column):
+    return column.str.replace(r'\s+', ' ', regex=True).str.strip()
+
+
+def normalize_gst(column):
+    raw = clean_text(column)
+    missing = raw.str.fullmatch(GST_PLACEHOLDERS)
+    compact = raw.str.upper().str.replace(r'[^0-9A-Z]', '', regex=True)
+    # Only trust the compacted form when it is GSTIN-shaped; anything else is kept as scraped and flagged.
+    shaped = compact.str.len() == 15
+    gst = compact.where(shaped, raw).mask(missing, '')
+    well_formed = gst.str.fullmatch(GSTIN_FORMAT)
+    checked = np.zeros(len(gst), dtype=bool)
+    checked[well_formed.to_numpy()] = gstin_checksum_valid(gst[well_formed].tolist())
+    return gst, missing, well_formed, pd.Series(checked, index=gst.index)
+
+
+def normalize_address(column):
+    address = clean_text(column)
+    address = address.str.replace(r'\s*,[\s,]*', ', ', regex=True)
+    address = address.str.replace(r'^[\s,]+|[\s,.;:-]+$', '', regex=True)
+    searchable = arrow_strings(address)
+    district = extract(searchable, DISTRICT_LABELLED)['district']
+    unlabelled = district == ''
+    district = district.mask(unlabelled, extract(searchable[unlabelled.to_numpy()], DISTRICT_ANYWHERE)['district'])
+    district = district.str.upper().map(DISTRICT_NAMES).fillna('').astype(str)
+    pin = extract(searchable, PIN_PATTERN)
+    return address, district, pin['head'] + pin['tail']
+
+
+def promoter_key(column):
+    # Promoters repeat across many projects, so the replacement passes run once per distinct name.
+    codes, names = pd.factorize(column)
+    key = pd.Series(names, dtype=str).str.upper()
+    for pattern, replacement in PROMOTER_REPLACEMENTS:
+        key = key.str.replace(pattern, replacement, regex=True)
+    return pd.Series(key.str.strip().to_numpy()[codes], index=column.index, dtype=str)
+
+
+def join_flags(flags, index):
+    # Pack each row's flags into a bitmask so the label string is built once per distinct combination.
+    names = list(flags)
+    bits = np.zeros(len(index), dtype=np.int64)
+    for position, mask in enumerate(flags.values()):
+        bits |= mask.to_numpy(dtype=bool).astype(np.int64) << position
+    codes, combinations = pd.factorize(bits)
+    labels = np.array([';'.join(name for position, name in enumerate(names) if combination >> position & 1)
+                       for combination in combinations], dtype=object)
+    return pd.Series(labels[codes], index=index, dtype=str)
+
+
+def normalize_frame(frame, dedupe=False):
+    require_pandas()
+    frame = frame.reset_index(drop=True)
+    rera = clean_text(frame['RERA_Regd_No']).str.upper().str.replace(r'\s*/\s*', '/', regex=True)
+    project_name = clean_text(frame['Project_Name'])
+    promoter_name = clean_text(frame['Promoter_Name'])
+    address, district, pin = normalize_address(frame['Promoter_Address'])
+    gst, gst_missing, gst_format, gst_checksum = normalize_gst(frame['GST_No'])
+    key = promoter_key(promoter_name)
+
+    duplicate = (rera != '') & rera.duplicated(keep='first')
+    flags = {
+        'missing_rera': rera == '',
+        'bad_rera': (rera != '') & ~rera.str.fullmatch(RERA_PATTERN.pattern),
+        'duplicate_rera': duplicate,
+        'missing_project_name': project_name == '',
+        'numeric_project_name': project_name.str.fullmatch(r'[\d\s./-]+'),
+        'label_as_project_name': project_name.str.fullmatch(PROJECT_NAME_LABELS) | ((project_name != '') & (project_name == rera)),
+        'missing_promoter': promoter_name == '',
+        'missing_address': address == '',
+        'missing_district': (address != '') & (district == ''),
+        'missing_pin': (address != '') & (pin == ''),
+        'missing_gst': gst_missing,
+        'bad_gst_format': ~gst_missing & ~gst_format,
+        'bad_gst_checksum': gst_format & ~gst_checksum,
+    }
+
+    result = pd.DataFrame({
+        'RERA_Regd_No': rera,
+        'Project_Name': project_name,
+        'Promoter_Name': promoter_name,
+        'Promoter_Address': address,
+        'GST_No': gst,
+        'Promoter_District': district,
+        'Promoter_PIN': pin,
+        'GST_Valid': gst_checksum,
+        'Promoter_Key': key,
+        'Flags': join_flags(flags, frame.index),
+    }, columns=NORMALIZED_FIELDS)
+    if dedupe:
+        result = result[~duplicate.to_numpy()].reset_index(drop=True)
+    counts = {name: int(mask.sum()) for name, mask in flags.items()}
+    return result, counts
+
+
+def log_summary(rows, counts, elapsed):
+    logger.info(f"Normalized {rows} records in {elapsed:.2f}s ({rows / elapsed if elapsed else 0:,.0f} rows/s)")
+    for name, count in counts.items():
+        if count:
+            logger.info(f"  {name}: {count} ({count / rows:.1%})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate and normalize scraped project records in batched, "
+                                                 "column-wide passes.")
+    parser.add_argument("input", nargs="?", default=DEFAULT_OUTPUT, help="scraper output (CSV, JSON Lines or Parquet)")
+    parser.add_argument("--output", default=DEFAULT_NORMALIZED_OUTPUT,
+                        help="normalized output; the format follows the extension")
+    parser.add_argument("--format", choices=["csv", "jsonl", "parquet"], help="input format (default: from extension)")
+    parser.add_argument("--dedupe", action="store_true", help="drop repeated RERA numbers, keeping the first row")
+    parser.add_argument("--flagged", help="also write only the flagged rows to this file")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    started = time.perf_counter()
+    frame = load_records(args.input, args.format)
+    loaded = time.perf_counter()
+    result, counts = normalize_frame(frame, dedupe=args.dedupe)
+    normalized = time.perf_counter()
+    save_records(result, args.output)
+    if args.flagged:
+        save_records(result[result['Flags'] != ''], args.flagged)
+    logger.info(f"Read {len(frame)} records in {loaded - started:.2f}s, wrote {len(result)} to {args.output} "
+                f"in {time.perf_counter() - normalized:.2f}s")
+    log_summary(len(frame), counts, normalized - loaded)
+
+
+if __name__ == "__main__":
+    main()
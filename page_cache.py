@@ -0,0 +1,161 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = ".page_cache"
+DEFAULT_TTL_HOURS = 24
+DEFAULT_MAX_MB = 512
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT NOT NULL,
+    tab TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_bytes INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (url, tab)
+)
+"""
+
+
+class PageCache:
+    # Pages are stored once per distinct content (gzip'd JSON named by its SHA-256) and looked up
+    # through an SQLite index keyed by URL and tab, which also drives TTL expiry and LRU eviction.
+    def __init__(self, root=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL_HOURS * 3600, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(root, 'index.sqlite'), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(SCHEMA)
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.stores = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], digest + '.json.gz')
+
+    def _fresh(self, stored_at):
+        return self.ttl is None or time.time() - stored_at <= self.ttl
+
+    def get(self, url, tab):
+        pages = self.get_tabs(url, [tab])
+        return pages[tab] if pages else None
+
+    def get_tabs(self, url, tabs):
+        # All-or-nothing: a project is only served from the cache when every tab it needs is fresh.
+        with self._lock:
+            rows = {}
+            for tab in tabs:
+                row = self.conn.execute("SELECT digest, stored_at, content_bytes FROM entries WHERE url = ? AND tab = ?",
+                                        (url, tab)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                if not self._fresh(row[1]):
+                    self.expired += 1
+                    self.misses += 1
+                    return None
+                rows[tab] = row
+            pages = {}
+            for tab, (digest, stored_at, content_bytes) in rows.items():
+                try:
+                    with gzip.open(self._object_path(digest), 'rt', encoding='utf-8') as f:
+                        pages[tab] = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.debug(f"Dropping unreadable cache entry for {url} [{tab}]: {e}")
+                    self.conn.execute("DELETE FROM entries WHERE url = ? AND tab = ?", (url, tab))
+                    self.conn.commit()
+                    self.misses += 1
+                    return None
+            now = time.time()
+            self.conn.executemany("UPDATE entries SET accessed_at = ? WHERE url = ? AND tab = ?",
+                                  [(now, url, tab) for tab in tabs])
+            self.conn.commit()
+            self.hits += 1
+            self.bytes_saved += sum(row[2] for row in rows.values())
+            return pages
+
+    def put(self, url, tab, content):
+        if not url:
+            return
+        data = json.dumps(content, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        with self._lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temporary = path + '.tmp'
+                with gzip.open(temporary, 'wb') as f:
+                    f.write(data)
+                os.replace(temporary, path)
+            now = time.time()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (url, tab, digest, size, content_bytes, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", (url, tab, digest, os.path.getsize(path), len(data), now, now))
+            self.conn.commit()
+            self.stores += 1
+            self._evict()
+
+    def _evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, tab, digest, size in self.conn.execute(
+                "SELECT url, tab, digest, size FROM entries ORDER BY accessed_at ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM entries WHERE url = ? AND tab = ?", (url, tab))
+            if not self.conn.execute("SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+                try:
+                    os.remove(self._object_path(digest))
+                except OSError:
+                    pass
+            total -= size
+            self.evictions += 1
+        self.conn.commit()
+
+    def urls(self, tab):
+        with self._lock:
+            return [row[0] for row in self.conn.execute("SELECT url FROM entries WHERE tab = ? ORDER BY url", (tab,))]
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries, size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'expired': self.expired,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'stores': self.stores,
+            'evictions': self.evictions,
+            'bytes_saved': self.bytes_saved,
+            'entries': entries,
+            'size_bytes': size,
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        logger.info(f"Page cache: {stats['hits']} hits, {stats['misses']} misses ({stats['expired']} expired), "
+                    f"hit rate {stats['hit_rate']:.1%}, {stats['bytes_saved'] / 1024 / 1024:.1f} MB saved, "
+                    f"{stats['entries']} entries using {stats['size_bytes'] / 1024 / 1024:.1f} MB, "
+                    f"{stats['evictions']} evicted")
+
+    def close(self):
+        self.conn.close()
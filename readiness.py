@@ -0,0 +1,191 @@
+import json
+import logging
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEADLINES = {
+    'list_network': 20,
+    'list_render': 10,
+    'list_scroll': 5,
+    'detail_network': 15,
+    'overview_fields': 10,
+    'overview_render': 5,
+    'promoter_fields': 10,
+    'promoter_render': 5,
+}
+DEFAULT_DEADLINE = 10
+
+HISTOGRAM_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30]
+
+# Resolves once no DOM mutation has been observed for quietMs, or with false
+# once deadlineMs has elapsed.
+DOM_QUIET_SCRIPT = """
+var quietMs = arguments[0], deadlineMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var start = Date.now(), last = start;
+var observer = new MutationObserver(function() { last = Date.now(); });
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+(function check() {
+    var now = Date.now();
+    if (now - last >= quietMs) { observer.disconnect(); done(true); }
+    else if (now - start >= deadlineMs) { observer.disconnect(); done(false); }
+    else { setTimeout(check, Math.min(50, quietMs)); }
+})();
+"""
+
+
+class WaitHistogram:
+    def __init__(self, buckets=HISTOGRAM_BUCKETS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.timeouts = 0
+
+    def observe(self, seconds, timed_out=False):
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if timed_out:
+            self.timeouts += 1
+
+    def summary(self):
+        labels = [f"<={bound}s" for bound in self.buckets] + [f">{self.buckets[-1]}s"]
+        return {
+            'count': self.count,
+            'timeouts': self.timeouts,
+            'total_s': round(self.total, 3),
+            'mean_s': round(self.total / self.count, 3) if self.count else 0.0,
+            'max_s': round(self.max, 3),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class ReadinessEngine:
+    def __init__(self, driver, deadlines=None, quiet_ms=300, idle_ms=500, poll_interval=0.1):
+        self.driver = driver
+        self.deadlines = dict(DEFAULT_DEADLINES)
+        if deadlines:
+            self.deadlines.update(deadlines)
+        self.quiet_ms = quiet_ms
+        self.idle_ms = idle_ms
+        self.poll_interval = poll_interval
+        self.histograms = {}
+        self._inflight = set()
+        self._network_log_available = True
+
+    def deadline_for(self, step, deadline=None):
+        if deadline is not None:
+            return deadline
+        return self.deadlines.get(step, DEFAULT_DEADLINE)
+
+    def record(self, step, seconds, timed_out=False):
+        if step not in self.histograms:
+            self.histograms[step] = WaitHistogram()
+        self.histograms[step].observe(seconds, timed_out)
+        if timed_out:
+            logger.warning(f"Readiness step '{step}' hit its deadline after {seconds:.2f}s")
+        else:
+            logger.debug(f"Readiness step '{step}' ready after {seconds:.3f}s")
+
+    def wait_for(self, step, condition, deadline=None):
+        deadline = self.deadline_for(step, deadline)
+        start = time.monotonic()
+        try:
+            result = WebDriverWait(self.driver, deadline, poll_frequency=self.poll_interval).until(condition)
+            self.record(step, time.monotonic() - start)
+            return result
+        except TimeoutException:
+            self.record(step, time.monotonic() - start, timed_out=True)
+            return None
+
+    def wait_for_element(self, step, locator, deadline=None):
+        return self.wait_for(step, EC.presence_of_element_located(locator), deadline)
+
+    def wait_for_clickable(self, step, element, deadline=None):
+        return self.wait_for(step, EC.element_to_be_clickable(element), deadline)
+
+    def wait_for_dom_quiet(self, step, quiet_ms=None, deadline=None):
+        quiet_ms = self.quiet_ms if quiet_ms is None else quiet_ms
+        deadline = self.deadline_for(step, deadline)
+        start = time.monotonic()
+        try:
+            self.driver.set_script_timeout(deadline + 1)
+            quiet = bool(self.driver.execute_async_script(DOM_QUIET_SCRIPT, quiet_ms, int(deadline * 1000)))
+        except WebDriverException as e:
+            logger.debug(f"DOM quiescence check failed for '{step}': {e}")
+            quiet = False
+        self.record(step, time.monotonic() - start, timed_out=not quiet)
+        return quiet
+
+    def reset_network(self):
+        self._inflight.clear()
+        self._drain_network_log()
+
+    def _drain_network_log(self):
+        if not self._network_log_available:
+            return False
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            logger.debug(f"CDP performance log unavailable, falling back to DOM quiescence: {e}")
+            self._network_log_available = False
+            return False
+
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method', '')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                if params.get('type') not in ('WebSocket', 'EventSource'):
+                    self._inflight.add(params.get('requestId'))
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                self._inflight.discard(params.get('requestId'))
+        return True
+
+    def wait_for_network_idle(self, step, idle_ms=None, deadline=None):
+        idle_ms = self.idle_ms if idle_ms is None else idle_ms
+        if not self._drain_network_log():
+            return self.wait_for_dom_quiet(step, quiet_ms=idle_ms, deadline=deadline)
+
+        deadline = self.deadline_for(step, deadline)
+        start = time.monotonic()
+        idle_since = start if not self._inflight else None
+        while True:
+            now = time.monotonic()
+            if idle_since is not None and (now - idle_since) * 1000 >= idle_ms:
+                self.record(step, now - start)
+                return True
+            if now - start >= deadline:
+                logger.debug(f"{len(self._inflight)} requests still in flight for '{step}'")
+                self.record(step, now - start, timed_out=True)
+                return False
+            time.sleep(self.poll_interval)
+            self._drain_network_log()
+            if self._inflight:
+                idle_since = None
+            elif idle_since is None:
+                idle_since = time.monotonic()
+
+    def summary(self):
+        return {step: histogram.summary() for step, histogram in sorted(self.histograms.items())}
+
+    def log_summary(self):
+        for step, stats in self.summary().items():
+            logger.info(f"Wait '{step}': n={stats['count']} mean={stats['mean_s']}s "
+                        f"max={stats['max_s']}s timeouts={stats['timeouts']}")
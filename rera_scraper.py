@@ -1,68 +1,184 @@
 import time
-import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.action_chains import ActionChains
+import argparse
 import logging
 import re
+from urllib.parse import urljoin
+
+from browser_profile import BLOCKED_RESOURCES, DEFAULT_ALLOWED_HOSTS, HIDE_WEBDRIVER_SCRIPT, PROFILES, BrowserProfile
+from checkpoint import DEFAULT_STATE_PATH, CheckpointStore
+from crawler import DEFAULT_FRONTIER_SIZE, RegistryCrawler
+from distributed import Coordinator, Worker
+from driver_pool import DEFAULT_POOL_URL, PoolClient
+from fast_path import DEFAULT_CONCURRENCY, DEFAULT_REQUEST_RATE, FastPathClient
+from fields import RERA_PATTERN, complete_record
+from job_queue import DEFAULT_QUEUE_PATH, DEFAULT_VISIBILITY_TIMEOUT, open_queue
+from incremental import DEFAULT_CHANGES_PATH, DEFAULT_INDEX_PATH, DEFAULT_REVALIDATE, ProjectIndex
+from js_extraction import BatchDocument
+from metrics import DEFAULT_REPORT_PATH, Metrics, timed
+from page_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_MB, DEFAULT_TTL_HOURS, PageCache
+from readiness import ReadinessEngine
+from rules import OVERVIEW_FIELDS, PROMOTER_FIELDS, RuleEngine, default_engine
+from sinks import DEFAULT_OUTPUT, open_sink
+from scheduler import (DEFAULT_DEAD_LETTER_PATH, DEFAULT_LATENCY_TARGET, DEFAULT_MAX_ATTEMPTS, AdaptiveLimiter,
+                       RetryScheduler)
+from snapshot import SnapshotDocument
+from worker_pool import DEFAULT_RATE, DEFAULT_RECYCLE_AFTER, ScraperWorkerPool
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+FAST_PATH_BATCH_SIZE = 100
+
+OVERVIEW_READY = (By.XPATH, "//*[contains(text(), 'RP/') or contains(text(), 'PS/') or contains(text(), 'Project Name')]")
+PROMOTER_READY = (By.XPATH, "//*[contains(text(), 'Company Name') or contains(text(), 'Registered Office Address') or contains(text(), 'GST')]")
+
+PROJECT_LIST_URL = "https://rera.odisha.gov.in/projects/project-list"
+LIST_PAGE_CACHE_KEY = "{list_url}?page={page}"
+DETAIL_TABS = ['overview', 'promoter']
+VIEW_DETAILS_XPATH = "//button[contains(text(), 'View Details')] | //a[contains(text(), 'View Details')]"
+DETAIL_URL_PATTERN = re.compile(r"""['"]([^'"]*project[^'"]*)['"]""", re.IGNORECASE)
+
+# Walks every visible View Details control in one round-trip and returns the link target
+# plus the text of the enclosing list row, so no per-row WebDriver calls are needed.
+HARVEST_LIST_SCRIPT = """
+var result = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+var rows = [];
+for (var i = 0; i < result.snapshotLength; i++) {
+    var el = result.snapshotItem(i);
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) continue;
+    var link = el.closest('a[href]');
+    var row = el.parentElement;
+    for (var depth = 0; row && depth < 8; depth++) {
+        if (/(RP|PS)\//.test(row.innerText || '')) break;
+        row = row.parentElement;
+    }
+    rows.push({
+        href: link ? link.href : '',
+        data_href: el.getAttribute('data-href') || el.getAttribute('routerlink') || el.getAttribute('ng-reflect-router-link') || '',
+        onclick: el.getAttribute('onclick') || '',
+        text: row ? row.innerText : ''
+    });
+}
+return rows;
+"""
+
+NEXT_PAGE_SELECTORS = [
+    "//ul[contains(@class, 'pagination')]//a[contains(@aria-label, 'Next')]",
+    "//ul[contains(@class, 'pagination')]//li[contains(@class, 'next')]/a",
+    "//*[@aria-label='Next page' or @aria-label='Next']",
+    "//a[normalize-space()='Next' or normalize-space()='›' or normalize-space()='»']",
+    "//button[normalize-space()='Next' or normalize-space()='›' or normalize-space()='»']"
+]
+PAGE_NUMBER_XPATH = "//ul[contains(@class, 'pagination')]//*[self::a or self::button][normalize-space()='{page}']"
+
 class OdishaRERAScraper:
-    def __init__(self, headless=False):
-        self.setup_driver(headless)
-        self.projects_data = []
+    def __init__(self, headless=False, deadlines=None, extraction_mode='live', rules=None, sink=None, checkpoint=None,
+                 index=None, cache=None, offline=False, profile=None, driver=None, driver_pool=None,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS, dead_letter_path=None, latency_target=DEFAULT_LATENCY_TARGET,
+                 metrics=None, list_url=PROJECT_LIST_URL):
+        self.headless = headless
+        self.list_url = list_url
+        self.profile = profile or BrowserProfile()
+        self.driver_pool = driver_pool
+        self.lease = None
+        self.owns_driver = driver is None
+        self.deadlines = deadlines
+        self.extraction_mode = extraction_mode
+        self.rules = rules or default_engine()
+        self.sink = sink
+        self.checkpoint = checkpoint
+        self.index = index
+        self.cache = cache
+        self.offline = offline
+        self.current_url = ''
+        self.retries = RetryScheduler(max_attempts, dead_letter_path=dead_letter_path)
+        self.latency_target = latency_target
+        self.metrics = metrics or Metrics()
+        self._unsaved = []
+        if offline:
+            # Offline runs replay the page cache and never start a browser.
+            self.readiness = None
+        elif driver is not None:
+            self.attach_driver(driver)
+        else:
+            self.setup_driver(headless)
         
     def setup_driver(self, headless=False):
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        start = time.perf_counter()
+        if self.driver_pool:
+            self.lease = self.driver_pool.lease()
+            if 'profile' in self.lease:
+                # The leased browser was launched with the daemon's profile; follow it so the session's
+                # page load strategy and request blocking match the browser we attach to.
+                leased_profile = BrowserProfile.from_dict(self.lease['profile'])
+                if leased_profile.name != self.profile.name:
+                    logger.info(f"Driver pool runs the {leased_profile.name} profile; using it instead of "
+                                f"{self.profile.name}")
+                self.profile = leased_profile
+            chrome_options = self.profile.attach_options(self.lease['debugger_address'])
+        else:
+            chrome_options = self.profile.chrome_options(headless)
+        
+        try:
+            driver = webdriver.Chrome(options=chrome_options)
+        except Exception:
+            if self.lease:
+                self.driver_pool.release(self.lease['lease'])
+                self.lease = None
+            raise
+        self.attach_driver(driver)
+        source = f"leased from {self.lease['debugger_address']}" if self.lease else "started"
+        logger.info(f"Browser {source} in {(time.perf_counter() - start) * 1000:.0f} ms")
+    
+    def attach_driver(self, driver):
+        self.driver = driver
+        Metrics.instrument_driver(self.driver)
+        self.profile.attach(self.driver)
+        self.driver.execute_script(HIDE_WEBDRIVER_SCRIPT)
         self.wait = WebDriverWait(self.driver, 20)
+        self.readiness = ReadinessEngine(self.driver, self.deadlines)
         
+    @timed('navigate_list')
     def navigate_to_projects_page(self):
         try:
             logger.info("Navigating to RERA projects page...")
-            self.driver.get("https://rera.odisha.gov.in/projects/project-list")
+            self.readiness.reset_network()
+            self.driver.get(self.list_url)
             
-            self.wait.until(EC.presence_of_element_located((By.XPATH, "//button[contains(text(), 'View Details')] | //a[contains(text(), 'View Details')]")))
-            time.sleep(5)
+            self.wait.until(EC.presence_of_element_located((By.XPATH, VIEW_DETAILS_XPATH)))
+            self.readiness.wait_for_network_idle('list_network')
             logger.info("Successfully loaded projects page")
             
         except Exception as e:
             logger.error(f"Failed to load projects page: {e}")
             raise
     
+    def scroll_project_list(self, max_rounds=3):
+        self.readiness.wait_for_dom_quiet('list_render')
+        
+        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        rounds = 0
+        while max_rounds is None or rounds < max_rounds:
+            rounds += 1
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            self.readiness.wait_for_dom_quiet('list_scroll')
+            new_height = self.driver.execute_script("return document.body.scrollHeight")
+            if new_height == last_height:
+                break
+            last_height = new_height
+        
+        self.driver.execute_script("window.scrollTo(0, 0);")
+    
+    @timed('find_buttons')
     def find_all_view_details_buttons(self):
         try:
-            time.sleep(3)
-            
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            for i in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                last_height = new_height
-            
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            self.scroll_project_list()
             
             buttons = []
             selectors = [
@@ -80,126 +196,240 @@ class OdishaRERAScraper:
                     continue
             
             logger.info(f"Found {len(buttons)} View Details buttons")
-            return buttons[:6]
+            return buttons
             
         except Exception as e:
             logger.error(f"Error finding View Details buttons: {e}")
             return []
     
-    def extract_project_overview_data(self):
-        project_data = {}
+    def parse_list_row(self, index, row, page=1):
+        project = {'index': index, 'page': page, 'row': index, 'rera_no': '', 'detail_url': ''}
+        
+        rera_match = RERA_PATTERN.search(row.get('text') or '')
+        if rera_match:
+            project['rera_no'] = rera_match.group()
         
+        if row.get('href') and not row['href'].startswith('javascript'):
+            project['detail_url'] = row['href']
+        else:
+            for candidate in (row.get('data_href'), row.get('onclick')):
+                url_match = DETAIL_URL_PATTERN.search(candidate or '') if candidate else None
+                if url_match:
+                    project['detail_url'] = urljoin(self.list_url, url_match.group(1))
+                    break
+                if candidate and candidate.startswith('/'):
+                    project['detail_url'] = urljoin(self.list_url, candidate)
+                    break
+        return project
+    
+    def resolve_detail_url(self, index):
         try:
-            time.sleep(5)
-            
-            rera_selectors = [
-                "//*[contains(text(), 'RP/') or contains(text(), 'PS/')]",
-                "//*[contains(text(), 'RERA Regd')]//following-sibling::*//*[contains(text(), 'RP/') or contains(text(), 'PS/')]",
-                "//*[contains(text(), 'Registration')]//following-sibling::*//*[contains(text(), 'RP/') or contains(text(), 'PS/')]",
-                "//span[contains(text(), 'RP/') or contains(text(), 'PS/')]",
-                "//div[contains(text(), 'RP/') or contains(text(), 'PS/')]",
-                "//p[contains(text(), 'RP/') or contains(text(), 'PS/')]"
-            ]
+            buttons = [b for b in self.driver.find_elements(By.XPATH, VIEW_DETAILS_XPATH) if b.is_displayed()]
+            if index >= len(buttons):
+                return ''
             
-            for selector in rera_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and ('RP/' in text or 'PS/' in text):
-                            rera_pattern = r'(RP|PS)/\d{1,2}/\d{4}/\d{4,6}'
-                            rera_match = re.search(rera_pattern, text)
-                            if rera_match:
-                                project_data['RERA_Regd_No'] = rera_match.group()
-                                logger.info(f"Found RERA number: {rera_match.group()}")
-                                break
-                    if 'RERA_Regd_No' in project_data:
-                        break
-                except Exception as e:
-                    logger.debug(f"RERA selector failed: {e}")
-                    continue
+            list_url = self.driver.current_url
+            self.driver.execute_script("arguments[0].click();", buttons[index])
+            self.wait.until(EC.url_changes(list_url))
+            detail_url = self.driver.current_url
             
-            name_selectors = [
-                "//*[contains(text(), 'Project Name')]//following-sibling::*[1]",
-                "//*[contains(text(), 'Project Name')]//parent::*//following-sibling::*[1]",
-                "//*[contains(text(), 'Project Name')]//following::text()[normalize-space()][1]",
-                "//h1[not(contains(text(), 'Details')) and not(contains(text(), 'Overview')) and not(contains(text(), 'Project')) and string-length(normalize-space()) > 3]",
-                "//h2[not(contains(text(), 'Details')) and not(contains(text(), 'Overview')) and not(contains(text(), 'Project')) and string-length(normalize-space()) > 3]",
-                "//h3[not(contains(text(), 'Details')) and not(contains(text(), 'Overview')) and not(contains(text(), 'Project')) and string-length(normalize-space()) > 3]",
-                "//*[contains(@class, 'card-title')][not(contains(text(), 'Details'))][not(contains(text(), 'Overview'))]",
-                "//*[contains(@class, 'project-title')]",
-                "//*[contains(@class, 'project-name')]",
-                "//strong[not(contains(text(), 'Details')) and not(contains(text(), 'Overview')) and string-length(normalize-space()) > 5]",
-                "//b[not(contains(text(), 'Details')) and not(contains(text(), 'Overview')) and string-length(normalize-space()) > 5]"
-            ]
+            self.driver.back()
+            self.wait.until(EC.presence_of_element_located((By.XPATH, VIEW_DETAILS_XPATH)))
+            self.readiness.wait_for_dom_quiet('list_render')
+            return detail_url
             
-            for selector in name_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if (text and len(text) > 3 and 
-                            'Details' not in text and 
-                            'Overview' not in text and 
-                            'Project' not in text and
-                            'RERA' not in text and
-                            'Registration' not in text and
-                            text != 'Projects'):
-                            project_data['Project_Name'] = text
-                            logger.info(f"Found project name: {text}")
-                            break
-                    if 'Project_Name' in project_data:
-                        break
-                except Exception as e:
-                    logger.debug(f"Name selector failed: {e}")
-                    continue
+        except Exception as e:
+            logger.debug(f"Could not resolve detail URL for row {index}: {e}")
+            return ''
+    
+    @timed('harvest_list')
+    def harvest_current_page(self, page=1, max_scroll_rounds=3):
+        if self.offline:
+            cached = self.cache.get(LIST_PAGE_CACHE_KEY.format(list_url=self.list_url, page=page), 'list')
+            rows = cached['rows'] if cached else []
+        else:
+            self.scroll_project_list(max_rounds=max_scroll_rounds)
+            rows = self.driver.execute_script(HARVEST_LIST_SCRIPT, VIEW_DETAILS_XPATH) or []
+            if self.cache and rows:
+                self.cache.put(LIST_PAGE_CACHE_KEY.format(list_url=self.list_url, page=page), 'list', {'rows': rows})
+        return [self.parse_list_row(i, row, page) for i, row in enumerate(rows)]
+    
+    def first_list_row_text(self):
+        rows = self.driver.execute_script(HARVEST_LIST_SCRIPT, VIEW_DETAILS_XPATH) or []
+        return rows[0]['text'] if rows else ''
+    
+    def _click_and_wait_for_new_rows(self, element):
+        before = self.first_list_row_text()
+        self.readiness.reset_network()
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+        self.driver.execute_script("arguments[0].click();", element)
+        changed = self.readiness.wait_for('list_page', lambda d: self.first_list_row_text() not in ('', before))
+        self.readiness.wait_for_network_idle('list_network')
+        return bool(changed)
+    
+    def click_next_page(self):
+        for selector in NEXT_PAGE_SELECTORS:
+            try:
+                for element in self.driver.find_elements(By.XPATH, selector):
+                    if not element.is_displayed():
+                        continue
+                    disabled = element.get_attribute('disabled') or element.get_attribute('aria-disabled') == 'true'
+                    classes = (element.get_attribute('class') or '') + ' ' + (element.find_element(By.XPATH, "./..").get_attribute('class') or '')
+                    if disabled or 'disabled' in classes:
+                        return False
+                    return self._click_and_wait_for_new_rows(element)
+            except Exception as e:
+                logger.debug(f"Next page selector failed: {selector} - {e}")
+                continue
+        return False
+    
+    def go_to_page(self, page):
+        if page <= 1:
+            return True
+        try:
+            for element in self.driver.find_elements(By.XPATH, PAGE_NUMBER_XPATH.format(page=page)):
+                if element.is_displayed():
+                    return self._click_and_wait_for_new_rows(element)
+        except Exception as e:
+            logger.debug(f"Direct jump to page {page} failed: {e}")
+        
+        for current in range(1, page):
+            if not self.click_next_page():
+                logger.warning(f"Could not advance past list page {current}")
+                return False
+        return True
+    
+    def cached_detail_projects(self):
+        urls = self.cache.urls('overview')
+        logger.info(f"No cached list pages, replaying {len(urls)} cached detail pages instead")
+        return [{'index': i, 'page': 1, 'row': i, 'rera_no': '', 'detail_url': url} for i, url in enumerate(urls)]
+    
+    def iter_list_pages(self, start_page=1):
+        if self.offline:
+            page = start_page
+            while True:
+                projects = self.harvest_current_page(page)
+                if not projects and page == start_page:
+                    projects = self.cached_detail_projects()
+                    if projects:
+                        yield page, projects
+                    return
+                if not projects:
+                    logger.info(f"No cached list page {page}")
+                    return
+                yield page, projects
+                page += 1
+        
+        self.navigate_to_projects_page()
+        if not self.go_to_page(start_page):
+            return
+        
+        page = start_page
+        while True:
+            projects = self.harvest_current_page(page, max_scroll_rounds=None)
+            logger.info(f"Harvested {len(projects)} rows from list page {page}")
+            yield page, projects
+            
+            if not self.click_next_page():
+                logger.info(f"No further list pages after page {page}")
+                return
+            page += 1
+    
+    def harvest_project_list(self, limit=6):
+        try:
+            if not self.offline:
+                self.navigate_to_projects_page()
+            projects = self.harvest_current_page()
+            if not projects and self.offline:
+                projects = self.cached_detail_projects()
+            projects = projects[:limit]
             
-            if 'Project_Name' not in project_data:
-                try:
-                    if 'RERA_Regd_No' in project_data:
-                        rera_elements = self.driver.find_elements(By.XPATH, f"//*[contains(text(), '{project_data['RERA_Regd_No']}')]")
-                        for rera_elem in rera_elements:
-                            parent = rera_elem.find_element(By.XPATH, "./..")
-                            siblings = parent.find_elements(By.XPATH, "./*")
-                            for sibling in siblings:
-                                text = sibling.text.strip()
-                                if (text and len(text) > 5 and 
-                                    project_data['RERA_Regd_No'] not in text and
-                                    'Details' not in text and 
-                                    'Overview' not in text and
-                                    text != 'Projects'):
-                                    project_data['Project_Name'] = text
-                                    logger.info(f"Found project name near RERA: {text}")
-                                    break
-                            if 'Project_Name' in project_data:
-                                break
-                except Exception as e:
-                    logger.debug(f"Alternative name search failed: {e}")
+            for project in projects:
+                if not project['detail_url'] and not self.offline:
+                    project['detail_url'] = self.resolve_detail_url(project['index'])
             
-            if 'Project_Name' not in project_data:
-                try:
-                    page_title = self.driver.title
-                    if page_title and 'RERA' in page_title:
-                        title_parts = page_title.split('-')
-                        for part in title_parts:
-                            part = part.strip()
-                            if (part and len(part) > 3 and 
-                                'RERA' not in part and 
-                                'Odisha' not in part and
-                                'Details' not in part):
-                                project_data['Project_Name'] = part
-                                logger.info(f"Found project name in title: {part}")
-                                break
-                except Exception as e:
-                    logger.debug(f"Title extraction failed: {e}")
+            resolved = sum(1 for project in projects if project['detail_url'])
+            logger.info(f"Harvested {len(projects)} projects from list ({resolved} with detail URLs)")
+            return projects
             
+        except Exception as e:
+            logger.error(f"Error harvesting project list: {e}")
+            return []
+    
+    @timed('open_detail')
+    def open_project(self, project):
+        if project.get('detail_url'):
+            self.readiness.reset_network()
+            self.driver.get(project['detail_url'])
+            self.readiness.wait_for_network_idle('detail_network')
+            self.current_url = project['detail_url']
+            return True
+        
+        logger.info(f"No detail URL for project {project['index'] + 1}, opening it from the list")
+        self.navigate_to_projects_page()
+        if not self.go_to_page(project.get('page', 1)):
+            return False
+        
+        view_details_buttons = self.find_all_view_details_buttons()
+        row = project.get('row', project['index'])
+        
+        if row >= len(view_details_buttons):
+            logger.warning(f"Button index {row} out of range")
+            return False
+        
+        button = view_details_buttons[row]
+        
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+        
+        with self.metrics.span('click'):
+            try:
+                self.wait.until(EC.element_to_be_clickable(button))
+                self.readiness.reset_network()
+                button.click()
+            except:
+                self.driver.execute_script("arguments[0].click();", button)
+            
+            self.readiness.wait_for_network_idle('detail_network')
+        self.current_url = self.driver.current_url
+        return True
+    
+    def page_document(self, tab=None):
+        if self.cache is None:
+            if self.extraction_mode == 'snapshot':
+                return SnapshotDocument.from_driver(self.driver)
+        else:
+            snapshot = SnapshotDocument.capture(self.driver)
+            self.cache.put(self.current_url, tab, snapshot)
+            if self.extraction_mode == 'snapshot':
+                return SnapshotDocument.from_snapshot(snapshot)
+        if self.extraction_mode == 'js':
+            return BatchDocument(self.driver)
+        return self.driver
+    
+    @timed('extract_overview')
+    def extract_project_overview_data(self):
+        self.readiness.wait_for_element('overview_fields', OVERVIEW_READY)
+        self.readiness.wait_for_dom_quiet('overview_render')
+        
+        try:
+            document = self.page_document('overview')
+        except Exception as e:
+            logger.error(f"Error reading overview page: {e}")
+            return {}
+        return self.extract_overview_fields(document, self.rules, self.metrics.observe_probe)
+    
+    @staticmethod
+    def extract_overview_fields(document, rules=None, observe=None):
+        try:
+            project_data = (rules or default_engine()).extract(document, OVERVIEW_FIELDS, observe=observe)
             logger.info(f"Extracted overview data: {project_data}")
             return project_data
             
         except Exception as e:
             logger.error(f"Error extracting overview data: {e}")
-            return project_data
+            return {}
     
+    @timed('promoter_tab')
     def click_promoter_tab(self):
         try:
             tab_selectors = [
@@ -224,7 +454,7 @@ class OdishaRERAScraper:
                             except:
                                 self.driver.execute_script("arguments[0].click();", tab_element)
                             
-                            time.sleep(4)
+                            self.readiness.wait_for_element('promoter_fields', PROMOTER_READY)
                             logger.info("Successfully clicked Promoter Details tab")
                             return True
                 except Exception as e:
@@ -238,215 +468,289 @@ class OdishaRERAScraper:
             logger.error(f"Error clicking promoter tab: {e}")
             return False
     
+    @timed('extract_promoter')
     def extract_promoter_details(self):
-        promoter_data = {}
+        if not self.click_promoter_tab():
+            logger.warning("Could not access promoter details tab")
+            return {}
+        
+        self.readiness.wait_for_dom_quiet('promoter_render')
         
         try:
-            if not self.click_promoter_tab():
-                logger.warning("Could not access promoter details tab")
-                return promoter_data
-            
-            time.sleep(4)
-            
-            company_selectors = [
-                "//*[contains(text(), 'Company Name')]//following-sibling::*[1]",
-                "//*[contains(text(), 'Company Name')]//following-sibling::*/text()[normalize-space()][1]",
-                "//*[contains(text(), 'Company Name')]//parent::*//following-sibling::*[1]",
-                "//*[contains(text(), 'Company Name')]//following::*[contains(text(), 'M/S') or contains(text(), 'PVT') or contains(text(), 'LTD')][1]",
-                "//*[contains(text(), 'M/S') and (contains(text(), 'PVT') or contains(text(), 'LTD') or contains(text(), 'PRIVATE'))]",
-                "//*[contains(text(), 'DEVELOPERS') or contains(text(), 'BUILDERS') or contains(text(), 'CONSTRUCTION')][contains(text(), 'PVT') or contains(text(), 'LTD')]",
-                "//strong[contains(text(), 'M/S')]",
-                "//b[contains(text(), 'M/S')]",
-                "//span[contains(text(), 'M/S')]",
-                "//div[contains(text(), 'M/S')]",
-                "//p[contains(text(), 'M/S')]"
-            ]
-            
-            for selector in company_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and len(text) > 5:
-                            company_keywords = ['M/S', 'PVT', 'LTD', 'PRIVATE', 'DEVELOPERS', 'BUILDERS', 'CONSTRUCTION', 'INFRA']
-                            if any(keyword in text.upper() for keyword in company_keywords):
-                                promoter_data['Promoter_Name'] = text
-                                logger.info(f"Found company name: {text}")
-                                break
-                    if 'Promoter_Name' in promoter_data:
-                        break
-                except Exception as e:
-                    logger.debug(f"Company selector failed: {e}")
-                    continue
-            
-            address_selectors = [
-                "//*[contains(text(), 'Registered Office Address')]//following-sibling::*[1]",
-                "//*[contains(text(), 'Registered Office Address')]//following-sibling::*/text()[normalize-space()][1]",
-                "//*[contains(text(), 'Registered Office Address')]//parent::*//following-sibling::*[1]",
-                "//*[contains(text(), 'Office Address')]//following-sibling::*[1]",
-                "//*[contains(text(), 'Address')]//following-sibling::*[contains(text(), 'PO-') or contains(text(), 'PIN') or contains(text(), 'Dist')]",
-                "//*[contains(text(), 'PO-') and (contains(text(), 'PIN') or contains(text(), 'Dist'))]",
-                "//*[contains(text(), 'Dist.') and (contains(text(), 'PIN') or contains(text(), 'PO-') or contains(text(), 'Odisha'))]",
-                "//*[contains(text(), 'Odisha') and contains(text(), '-') and string-length(normalize-space()) > 20]"
-            ]
-            
-            for selector in address_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and len(text) > 15:
-                            address_keywords = ['PO-', 'PIN', 'Dist', 'Odisha', 'Plot', 'Road', 'Street']
-                            if any(keyword in text for keyword in address_keywords):
-                                promoter_data['Promoter_Address'] = text
-                                logger.info(f"Found address: {text}")
-                                break
-                    if 'Promoter_Address' in promoter_data:
-                        break
-                except Exception as e:
-                    logger.debug(f"Address selector failed: {e}")
-                    continue
-            
-            gst_selectors = [
-                "//*[contains(text(), 'GST No')]//following-sibling::*[1]",
-                "//*[contains(text(), 'GST No')]//following-sibling::*/text()[normalize-space()][1]",
-                "//*[contains(text(), 'GST No')]//parent::*//following-sibling::*[1]",
-                "//*[contains(text(), 'GST')]//following-sibling::*[1]",
-                "//*[text()[matches(., '^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}[Z]{1}[0-9A-Z]{1}$')]]",
-                "//span[string-length(normalize-space(text())) = 15 and contains(text(), 'A')]",
-                "//div[string-length(normalize-space(text())) = 15 and contains(text(), 'A')]",
-                "//p[string-length(normalize-space(text())) = 15 and contains(text(), 'A')]"
-            ]
-            
-            for selector in gst_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and len(text) >= 10:
-                            gst_clean = re.sub(r'[^A-Z0-9]', '', text.upper())
-                            if len(gst_clean) == 15 and gst_clean[2:7].isalpha() and gst_clean[:2].isdigit():
-                                promoter_data['GST_No'] = gst_clean
-                                logger.info(f"Found GST number: {gst_clean}")
-                                break
-                            elif len(text) >= 15 and any(char.isalpha() for char in text) and any(char.isdigit() for char in text):
-                                promoter_data['GST_No'] = text
-                                logger.info(f"Found GST number: {text}")
-                                break
-                    if 'GST_No' in promoter_data:
-                        break
-                except Exception as e:
-                    logger.debug(f"GST selector failed: {e}")
-                    continue
-            
+            document = self.page_document('promoter')
+        except Exception as e:
+            logger.error(f"Error reading promoter tab: {e}")
+            return {}
+        return self.extract_promoter_fields(document, self.rules, self.metrics.observe_probe)
+    
+    @staticmethod
+    def extract_promoter_fields(document, rules=None, observe=None):
+        try:
+            promoter_data = (rules or default_engine()).extract(document, PROMOTER_FIELDS, observe=observe)
             logger.info(f"Extracted promoter data: {promoter_data}")
             return promoter_data
             
         except Exception as e:
             logger.error(f"Error extracting promoter details: {e}")
-            return promoter_data
+            return {}
     
-    def scrape_project_details(self, button_index):
+    def scrape_cached_project(self, project):
+        pages = self.cache.get_tabs(project['detail_url'], DETAIL_TABS)
+        if pages is None:
+            return None
+        
+        project_data = self.extract_overview_fields(SnapshotDocument.from_snapshot(pages['overview']), self.rules,
+                                                    self.metrics.observe_probe)
+        promoter_data = self.extract_promoter_fields(SnapshotDocument.from_snapshot(pages['promoter']), self.rules,
+                                                     self.metrics.observe_probe)
+        
+        complete_data = complete_record({**project_data, **promoter_data})
+        project['cached'] = True
+        logger.info(f"Scraped project {project['index'] + 1} from the page cache: {complete_data}")
+        return complete_data
+    
+    @timed('project')
+    def scrape_project_details(self, project):
         try:
-            self.navigate_to_projects_page()
-            
-            view_details_buttons = self.find_all_view_details_buttons()
+            if self.cache and project.get('detail_url'):
+                complete_data = self.scrape_cached_project(project)
+                if complete_data:
+                    return complete_data
             
-            if button_index >= len(view_details_buttons):
-                logger.warning(f"Button index {button_index} out of range")
+            if self.offline:
+                project['error'] = "not in the page cache" if project.get('detail_url') else "no detail URL to replay"
                 return None
             
-            button = view_details_buttons[button_index]
-            
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-            time.sleep(2)
-            
-            try:
-                self.wait.until(EC.element_to_be_clickable(button))
-                button.click()
-            except:
-                self.driver.execute_script("arguments[0].click();", button)
-            
-            time.sleep(6)
+            round_trips = self.driver.round_trips
+            if not self.open_project(project):
+                project['error'] = "could not open the detail page"
+                return None
             
             project_data = self.extract_project_overview_data()
             
             promoter_data = self.extract_promoter_details()
+            self.metrics.observe_round_trips(self.driver.round_trips - round_trips)
             
-            complete_data = {**project_data, **promoter_data}
-            
-            required_fields = ['RERA_Regd_No', 'Project_Name', 'Promoter_Name', 'Promoter_Address', 'GST_No']
-            for field in required_fields:
-                if field not in complete_data:
-                    complete_data[field] = ''
+            complete_data = complete_record({**project_data, **promoter_data})
             
-            logger.info(f"Scraped project {button_index + 1}: {complete_data}")
+            logger.info(f"Scraped project {project['index'] + 1}: {complete_data}")
             return complete_data
             
         except Exception as e:
-            logger.error(f"Error scraping project details for index {button_index}: {e}")
+            logger.error(f"Error scraping project details for index {project['index']}: {e}")
+            project['error'] = str(e)
             return None
     
-    def scrape_all_projects(self):
-        try:
-            self.navigate_to_projects_page()
+    def output_sink(self):
+        if self.sink is None:
+            self.sink = open_sink(DEFAULT_OUTPUT)
+        return self.sink
+    
+    def record_result(self, project, project_data):
+        sink = self.output_sink()
+        self.metrics.count('items' if project_data else 'failures')
+        if project_data:
+            sink.write(project_data)
+            logger.info(f"Successfully scraped project {project['index'] + 1}")
+            if self.index:
+                self.index.record(project, project_data)
+            if self.checkpoint:
+                # Only mark projects done once their batch is on disk, so a crash never skips unsaved rows.
+                self._unsaved.append(project)
+                if not sink.pending:
+                    self.commit_checkpoint()
+        else:
+            logger.warning(f"Failed to scrape project {project['index'] + 1}")
+            if self.checkpoint:
+                self.checkpoint.mark_failed(project, project.get('error'))
+    
+    def commit_checkpoint(self):
+        if self.checkpoint and self._unsaved:
+            self.checkpoint.mark_done(self._unsaved)
+            self._unsaved = []
+    
+    def flush_output(self):
+        if self.sink:
+            self.sink.flush()
+        self.commit_checkpoint()
+    
+    def log_run_stats(self, elapsed):
+        if self.readiness:
+            self.readiness.log_summary()
+        self.rules.log_stats()
+        self.retries.log_summary()
+        if self.cache:
+            self.cache.log_stats()
+        if self.index:
+            self.index.log_summary()
+        if self.checkpoint:
+            self.checkpoint.log_overhead(elapsed)
+        self.metrics.log_summary()
+    
+    def spawn_worker(self):
+        return OdishaRERAScraper(headless=True, deadlines=self.deadlines, extraction_mode=self.extraction_mode,
+                                 rules=self.rules, cache=self.cache, profile=self.profile,
+                                 driver_pool=self.driver_pool, metrics=self.metrics, list_url=self.list_url)
+    
+    def _scrape_fast_batch(self, batch, fast_path):
+        for project, project_data in fast_path.fetch_projects(batch):
+            if project_data is None:
+                logger.info(f"Fast path could not parse project {project['index'] + 1}, falling back to the browser")
+                project_data = self.scrape_project_details(project)
+                if project_data is None:
+                    project['attempts'] = project.get('attempts', 0) + 1
+                    self.retries.give_up(project, project.get('error'))
+            self.record_result(project, project_data)
+            yield project, project_data
+    
+    def scrape_projects_fast(self, projects, fast_path, batch_size=FAST_PATH_BATCH_SIZE):
+        batch = []
+        for project in projects:
+            batch.append(project)
+            if len(batch) >= batch_size:
+                yield from self._scrape_fast_batch(batch, fast_path)
+                batch = []
+        if batch:
+            yield from self._scrape_fast_batch(batch, fast_path)
+    
+    def scrape_projects(self, projects, total=None, workers=1, rate=DEFAULT_RATE, recycle_after=DEFAULT_RECYCLE_AFTER,
+                        fast_path=None):
+        if self.checkpoint:
+            projects = self.checkpoint.skip_completed(projects)
+        
+        if fast_path is not None:
+            logger.info(f"Scraping over HTTP with up to {fast_path.concurrency} concurrent requests")
+            yield from self.scrape_projects_fast(projects, fast_path)
+            return
+        
+        if workers > 1 and not self.offline:
+            logger.info(f"Scraping with {workers} parallel browsers at up to {rate} pages/sec")
+            pool = ScraperWorkerPool(self.spawn_worker, workers=workers, rate=rate, recycle_after=recycle_after,
+                                     latency_target=self.latency_target, retries=self.retries)
+            for project, project_data in pool.run(projects):
+                self.record_result(project, project_data)
+                yield project, project_data
+            return
+        
+        limiter = None if self.offline else AdaptiveLimiter(rate, latency_target=self.latency_target)
+        total_label = total if total is not None else '?'
+        pending = iter(projects)
+        done = 0
+        while True:
+            project = self.retries.pop_ready() or next(pending, None)
+            if project is None:
+                delay = self.retries.next_delay()
+                if delay is None:
+                    break
+                time.sleep(min(delay, 1.0))
+                continue
+            
+            logger.info(f"Scraping project {done + 1}/{total_label}...")
+            if limiter:
+                limiter.acquire()
+            started = time.monotonic()
+            project_data = self.scrape_project_details(project)
+            if limiter:
+                limiter.record(time.monotonic() - started, ok=project_data is not None)
+            
+            if project_data is None:
+                if self.offline:
+                    # The page cache does not change between attempts, so an offline miss is final.
+                    project['attempts'] = project.get('attempts', 0) + 1
+                    self.retries.give_up(project, project.get('error'))
+                elif self.retries.requeue(project, project, project.get('error')):
+                    continue
             
-            view_details_buttons = self.find_all_view_details_buttons()
+            done += 1
+            self.record_result(project, project_data)
+            yield project, project_data
+        
+        if limiter:
+            limiter.log_stats()
+    
+    def scrape_all_projects(self, limit=6, workers=1, rate=DEFAULT_RATE, fast_path=None, incremental=False):
+        started = time.time()
+        try:
+            projects = self.harvest_project_list(limit=limit)
             
-            if not view_details_buttons:
+            if not projects:
                 logger.error("No View Details buttons found")
                 return
             
-            logger.info(f"Found {len(view_details_buttons)} projects to scrape")
-            
-            for i in range(min(6, len(view_details_buttons))):
-                logger.info(f"Scraping project {i + 1}/6...")
-                
-                project_data = self.scrape_project_details(i)
-                
-                if project_data:
-                    self.projects_data.append(project_data)
-                    logger.info(f"Successfully scraped project {i + 1}")
-                else:
-                    logger.warning(f"Failed to scrape project {i + 1}")
-                    empty_data = {
-                        'RERA_Regd_No': '',
-                        'Project_Name': '',
-                        'Promoter_Name': '',
-                        'Promoter_Address': '',
-                        'GST_No': ''
-                    }
-                    self.projects_data.append(empty_data)
-                
-                time.sleep(3)
-            
-            logger.info(f"Completed scraping {len(self.projects_data)} projects")
+            if incremental and self.index:
+                projects = list(self.index.plan(projects))
+            
+            logger.info(f"Found {len(projects)} projects to scrape")
+            
+            for _ in self.scrape_projects(projects, total=len(projects), workers=workers, rate=rate, fast_path=fast_path):
+                pass
+            
+            self.flush_output()
+            logger.info(f"Completed scraping {self.output_sink().count} projects")
+            self.log_run_stats(time.time() - started)
             
         except Exception as e:
             logger.error(f"Error in main scraping process: {e}")
     
-    def save_to_csv(self, filename="odisha_rera_projects.csv"):
-        if self.projects_data:
-            df = pd.DataFrame(self.projects_data)
-            column_order = ['RERA_Regd_No', 'Project_Name', 'Promoter_Name', 'Promoter_Address', 'GST_No']
-            df = df.reindex(columns=column_order)
-            df.to_csv(filename, index=False)
-            logger.info(f"Data saved to {filename}")
-            print(f"\nData saved to {filename}")
-            print(f"Total projects scraped: {len(self.projects_data)}")
-            return df
+    def crawl_registry(self, limit=None, start_page=1, frontier_size=DEFAULT_FRONTIER_SIZE, workers=1,
+                       rate=DEFAULT_RATE, fast_path=None, incremental=False):
+        list_scraper = None
+        crawler = None
+        started = time.time()
+        try:
+            # The crawler may only share this scraper's driver when detail pages go to the worker pool;
+            # the sequential path and the HTTP engine's browser fallback drive it from this thread.
+            if fast_path is None and workers > 1 and not self.offline:
+                crawler = RegistryCrawler(self, limit=limit, start_page=start_page, frontier_size=frontier_size)
+            else:
+                list_scraper = OdishaRERAScraper(headless=self.headless, deadlines=self.deadlines,
+                                                 extraction_mode=self.extraction_mode, rules=self.rules,
+                                                 cache=self.cache, offline=self.offline, profile=self.profile,
+                                                 driver_pool=self.driver_pool, metrics=self.metrics,
+                                                 list_url=self.list_url)
+                crawler = RegistryCrawler(list_scraper, limit=limit, start_page=start_page, frontier_size=frontier_size)
+            crawler.start()
+            
+            projects = crawler
+            if incremental and self.index:
+                projects = self.index.plan(crawler, on_stop=crawler.stop)
+            
+            for _ in self.scrape_projects(projects, total=limit, workers=workers, rate=rate, fast_path=fast_path):
+                crawler.record_completed()
+            
+            crawler.join()
+            crawler.log_stats()
+            self.flush_output()
+            logger.info(f"Completed crawling {self.output_sink().count} projects")
+            self.log_run_stats(time.time() - started)
+            
+        except Exception as e:
+            logger.error(f"Error in registry crawl: {e}")
+        
+        finally:
+            if crawler:
+                crawler.stop()
+            if list_scraper:
+                list_scraper.close()
+    
+    def save_output(self):
+        if self.sink and self.sink.count:
+            self.flush_output()
+            logger.info(f"Data saved to {self.sink.path}")
+            print(f"\nData saved to {self.sink.path}")
+            print(f"Total projects scraped: {self.sink.count}")
+            return self.sink.path
         else:
             logger.warning("No data to save")
             return None
     
     def display_data(self):
-        if self.projects_data:
-            df = pd.DataFrame(self.projects_data)
+        if self.sink and self.sink.count:
             print("\n" + "="*100)
             print("SCRAPED ODISHA RERA PROJECTS DATA")
             print("="*100)
             
-            for i, project in enumerate(self.projects_data, 1):
+            for i, project in enumerate(self.sink.read_records(), 1):
                 print(f"\nProject {i}:")
                 print("-" * 50)
                 print(f"RERA Regd. No: {project.get('RERA_Regd_No', 'N/A')}")
@@ -455,29 +759,194 @@ class OdishaRERAScraper:
                 print(f"Promoter Address: {project.get('Promoter_Address', 'N/A')}")
                 print(f"GST No: {project.get('GST_No', 'N/A')}")
             
-            return df
+            return self.sink.count
         else:
             print("No data available to display")
             return None
     
     def close(self):
-        if hasattr(self, 'driver'):
+        if self.sink:
+            self.sink.close()
+        if self.checkpoint:
+            self.commit_checkpoint()
+            self.checkpoint.close()
+        if self.index:
+            self.index.close()
+        if hasattr(self, 'driver') and self.owns_driver:
+            # Quitting a session attached to a leased browser only ends the ChromeDriver session.
             self.driver.quit()
             logger.info("WebDriver closed")
+        if self.lease:
+            self.driver_pool.release(self.lease['lease'])
+            self.lease = None
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape registered projects from the Odisha RERA portal.")
+    parser.add_argument("--headless", action="store_true", help="run Chrome without a window")
+    parser.add_argument("--crawl", action="store_true", help="walk every list page instead of the first page only")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="maximum number of projects to scrape (default: 6, or all with --crawl)")
+    parser.add_argument("--start-page", type=int, default=1, help="list page to start crawling from")
+    parser.add_argument("--frontier-size", type=int, default=DEFAULT_FRONTIER_SIZE,
+                        help="maximum number of discovered projects buffered ahead of the detail scraper")
+    parser.add_argument("--workers", type=int, default=1, help="number of parallel headless browsers for detail pages")
+    parser.add_argument("--rate", type=float, default=None,
+                        help=f"starting limit on detail pages opened per second across all workers, or on requests "
+                             f"per second with --engine http (default: {DEFAULT_RATE} for browsers, "
+                             f"{DEFAULT_REQUEST_RATE} for HTTP)")
+    parser.add_argument("--extraction", choices=["live", "snapshot", "js"], default="live",
+                        help="query the live DOM per selector, snapshot each tab once and query it locally, or run "
+                             "every field's rules inside the page in one call per tab")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="output file (a directory for parquet)")
+    parser.add_argument("--format", choices=["csv", "jsonl", "parquet"],
+                        help="output format (default: inferred from the --output extension)")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="records buffered between fsync'd writes to the output")
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH,
+                        help="SQLite file recording which projects are done or failed")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip projects completed in --state, retry failed ones, and append to --output")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only scrape projects missing from --index, plus a revalidation sample of known ones")
+    parser.add_argument("--index", default=DEFAULT_INDEX_PATH,
+                        help="SQLite index of every scraped project and its content hash, kept across runs")
+    parser.add_argument("--changes", default=DEFAULT_CHANGES_PATH,
+                        help="JSON Lines log of added and changed projects")
+    parser.add_argument("--revalidate", type=int, default=DEFAULT_REVALIDATE,
+                        help="known projects re-scraped per incremental run, least recently scraped first")
+    parser.add_argument("--stop-after-known", type=int, default=None,
+                        help="end an incremental list harvest after this many consecutive known projects")
+    parser.add_argument("--cache", nargs="?", const=DEFAULT_CACHE_DIR,
+                        help=f"cache list pages and detail tabs on disk (default directory: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_TTL_HOURS,
+                        help="hours a cached page stays fresh")
+    parser.add_argument("--cache-size", type=float, default=DEFAULT_MAX_MB,
+                        help="maximum cache size in MB; least recently used pages are evicted first")
+    parser.add_argument("--offline", action="store_true",
+                        help="replay the page cache without a browser, ignoring the TTL")
+    parser.add_argument("--profile", choices=PROFILES, default="full",
+                        help="lean blocks images, fonts, media, stylesheets and third-party hosts, loads pages eagerly "
+                             "and uses the new headless mode")
+    parser.add_argument("--allow-host", action="append",
+                        help=f"host the lean profile may contact; repeatable (default: {', '.join(DEFAULT_ALLOWED_HOSTS)})")
+    parser.add_argument("--block", default=",".join(BLOCKED_RESOURCES),
+                        help="comma-separated resource categories the lean profile blocks")
+    parser.add_argument("--driver-pool", nargs="?", const=DEFAULT_POOL_URL,
+                        help="lease warm browsers from a running driver_pool.py daemon instead of starting Chrome")
+    parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help="attempts per project, with exponential backoff, before it goes to the dead-letter file")
+    parser.add_argument("--dead-letter", default=DEFAULT_DEAD_LETTER_PATH,
+                        help="JSON Lines file of projects that failed every attempt")
+    parser.add_argument("--latency-target", type=float, default=DEFAULT_LATENCY_TARGET,
+                        help="seconds per detail page above which the scheduler slows down")
+    parser.add_argument("--report", default=DEFAULT_REPORT_PATH,
+                        help="JSON run report with per-stage p50/p95/p99 timings, selector hit rates, WebDriver "
+                             "round-trips per page and items/min")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="serve live metrics in the Prometheus text format on this port at /metrics")
+    parser.add_argument("--list-url", default=PROJECT_LIST_URL,
+                        help="project list page to start from (e.g. a local fixture portal)")
+    parser.add_argument("--distributed", choices=["coordinator", "worker"],
+                        help="coordinator harvests the registry into --queue and writes the output once workers drain "
+                             "it; worker leases projects from --queue until it is empty")
+    parser.add_argument("--queue", default=DEFAULT_QUEUE_PATH,
+                        help="job queue shared by the coordinator and workers: a SQLite file on shared storage or a "
+                             "redis:// URL")
+    parser.add_argument("--visibility-timeout", type=float, default=DEFAULT_VISIBILITY_TIMEOUT,
+                        help="seconds a leased project stays invisible to other workers without a heartbeat")
+    parser.add_argument("--worker-id", help="name this worker reports to the queue (default: host-pid)")
+    parser.add_argument("--rules", help="JSON file of field extraction rules (default: extraction_rules.json)")
+    parser.add_argument("--engine", choices=["browser", "http"], default="browser",
+                        help="read detail pages through Chrome, or over HTTP with a browser fallback")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="maximum concurrent requests for the HTTP engine; --rate still caps requests per second")
+    parser.add_argument("--endpoints", help="JSON file of detail endpoint templates for the HTTP engine")
+    parser.add_argument("--base-url", help="send HTTP engine requests to this host instead (e.g. a local stub server)")
+    parser.add_argument("--record-dir", help="save every HTTP engine response under this directory")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
     scraper = None
+    sink = None
+    checkpoint = None
+    index = None
+    cache = None
+    job_queue = None
+    metrics = Metrics()
     try:
         print("Starting Odisha RERA Projects Scraper...")
-        print("This will scrape the first 6 projects from the RERA website.")
+        if args.crawl:
+            print(f"This will crawl {args.limit or 'all'} projects from list page {args.start_page} onwards.")
+        else:
+            print(f"This will scrape the first {args.limit or 6} projects from the RERA website.")
+        
+        if args.rate is None:
+            args.rate = DEFAULT_REQUEST_RATE if args.engine == "http" else DEFAULT_RATE
+        
+        fast_path = None
+        if args.engine == "http":
+            endpoints = FastPathClient.load_endpoints(args.endpoints) if args.endpoints else None
+            fast_path = FastPathClient(base_url=args.base_url, endpoints=endpoints, concurrency=args.concurrency,
+                                       rate=args.rate, record_dir=args.record_dir)
+        
+        rules = RuleEngine.load(args.rules) if args.rules else None
+        
+        if args.metrics_port is not None:
+            metrics.serve(args.metrics_port)
+        
+        if args.cache or args.offline:
+            cache = PageCache(args.cache or DEFAULT_CACHE_DIR, ttl=None if args.offline else args.cache_ttl * 3600,
+                              max_bytes=int(args.cache_size * 1024 * 1024))
         
-        scraper = OdishaRERAScraper(headless=False)
+        profile = BrowserProfile(args.profile, allowed_hosts=args.allow_host,
+                                 blocked=[category for category in args.block.split(',') if category])
         
-        scraper.scrape_all_projects()
+        driver_pool = PoolClient(args.driver_pool) if args.driver_pool else None
         
-        df = scraper.display_data()
+        if args.distributed:
+            job_queue = open_queue(args.queue, args.max_attempts)
         
-        scraper.save_to_csv()
+        if args.distributed == "worker":
+            # Workers only report records to the queue; the coordinator owns the output, state and index.
+            worker = Worker(lambda: OdishaRERAScraper(headless=args.headless, extraction_mode=args.extraction,
+                                                      rules=rules, cache=cache, offline=args.offline, profile=profile,
+                                                      driver_pool=driver_pool, latency_target=args.latency_target,
+                                                      metrics=metrics, list_url=args.list_url),
+                            job_queue, worker_id=args.worker_id, visibility_timeout=args.visibility_timeout)
+            worker.run()
+            return
+        
+        checkpoint = CheckpointStore(args.state)
+        if not args.resume:
+            checkpoint.reset()
+        
+        index = ProjectIndex(args.index, args.changes, revalidate=args.revalidate,
+                             stop_after_known=args.stop_after_known)
+        
+        sink = open_sink(args.output, args.format, batch_size=args.batch_size, append=args.resume)
+        
+        scraper = OdishaRERAScraper(headless=args.headless, extraction_mode=args.extraction, rules=rules, sink=sink,
+                                    checkpoint=checkpoint, index=index, cache=cache, offline=args.offline,
+                                    profile=profile, driver_pool=driver_pool, max_attempts=args.max_attempts,
+                                    dead_letter_path=args.dead_letter, latency_target=args.latency_target,
+                                    metrics=metrics, list_url=args.list_url)
+        
+        if args.distributed == "coordinator":
+            Coordinator(scraper, job_queue).run(limit=args.limit, start_page=args.start_page,
+                                                frontier_size=args.frontier_size, incremental=args.incremental,
+                                                resume=args.resume)
+        elif args.crawl:
+            scraper.crawl_registry(limit=args.limit, start_page=args.start_page, frontier_size=args.frontier_size,
+                                   workers=args.workers, rate=args.rate, fast_path=fast_path,
+                                   incremental=args.incremental)
+        else:
+            scraper.scrape_all_projects(limit=args.limit or 6, workers=args.workers, rate=args.rate,
+                                        fast_path=fast_path, incremental=args.incremental)
+        
+        scraper.save_output()
+        
+        scraper.display_data()
         
         print("\nScraping completed successfully!")
         
@@ -486,8 +955,27 @@ def main():
         logger.error(f"Main function error: {e}")
     
     finally:
+        if args.report:
+            try:
+                metrics.write_report(args.report)
+            except Exception as e:
+                logger.error(f"Could not write run report: {e}")
+        metrics.close()
+        if job_queue:
+            job_queue.close()
         if scraper:
             scraper.close()
+            if cache:
+                cache.close()
+        else:
+            if sink:
+                sink.close()
+            if checkpoint:
+                checkpoint.close()
+            if index:
+                index.close()
+            if cache:
+                cache.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
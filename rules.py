@@ -0,0 +1,258 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+from selenium.webdriver.common.by import By
+
+from snapshot import compile_xpath
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extraction_rules.json')
+OVERVIEW_FIELDS = ['RERA_Regd_No', 'Project_Name']
+PROMOTER_FIELDS = ['Promoter_Name', 'Promoter_Address', 'GST_No']
+
+
+def _min_length(spec):
+    minimum = spec['value']
+    return lambda text, record: text if len(text) >= minimum else None
+
+
+def _not_numeric(spec):
+    return lambda text, record: None if re.fullmatch(r'[\d\s./-]+', text) else text
+
+
+def _exclude(spec):
+    values = spec['values']
+    return lambda text, record: None if any(value in text for value in values) else text
+
+
+def _not_equal(spec):
+    values = set(spec['values'])
+    return lambda text, record: None if text in values else text
+
+
+def _contains_any(spec):
+    if spec.get('ignore_case'):
+        values = [value.upper() for value in spec['values']]
+        return lambda text, record: text if any(value in text.upper() for value in values) else None
+    values = spec['values']
+    return lambda text, record: text if any(value in text for value in values) else None
+
+
+def _regex(spec):
+    pattern = re.compile(spec['pattern'])
+    extract = spec.get('extract', False)
+
+    def validate(text, record):
+        match = pattern.search(text)
+        if not match:
+            return None
+        return match.group() if extract else text
+    return validate
+
+
+def _exclude_field(spec):
+    field = spec['field']
+    return lambda text, record: None if record.get(field) and record[field] in text else text
+
+
+def _gstin(spec):
+    loose = spec.get('loose', False)
+
+    def validate(text, record):
+        gst_clean = re.sub(r'[^A-Z0-9]', '', text.upper())
+        if len(gst_clean) == 15 and gst_clean[2:7].isalpha() and gst_clean[:2].isdigit():
+            return gst_clean
+        if loose and len(text) >= 15 and any(char.isalpha() for char in text) and any(char.isdigit() for char in text):
+            return text
+        return None
+    return validate
+
+
+VALIDATORS = {
+    'min_length': _min_length,
+    'not_numeric': _not_numeric,
+    'exclude': _exclude,
+    'not_equal': _not_equal,
+    'contains_any': _contains_any,
+    'regex': _regex,
+    'exclude_field': _exclude_field,
+    'gstin': _gstin,
+}
+
+
+def compile_validators(specs):
+    compiled = []
+    for spec in specs:
+        if spec['type'] not in VALIDATORS:
+            raise ValueError(f"Unknown validator type: {spec['type']}")
+        compiled.append(VALIDATORS[spec['type']](spec))
+    return compiled
+
+
+def run_validators(validators, text, record):
+    for validate in validators:
+        text = validate(text, record)
+        if text is None:
+            return None
+    return text
+
+
+class Rule:
+    def __init__(self, index, spec, field_validators):
+        self.index = index
+        self.spec = spec
+        self.type = spec.get('type', 'xpath')
+        self.xpath = spec.get('xpath')
+        self.field = spec.get('field')
+        self.requires = spec.get('requires')
+        self.separator = spec.get('separator', '-')
+        self.split = spec.get('split', 'all')
+        self.fallback = spec.get('fallback', False)
+        self.validators = compile_validators(spec['validators']) if 'validators' in spec else field_validators
+        self.hits = 0
+        if self.xpath:
+            try:
+                compile_xpath(self.xpath)
+            except Exception as e:
+                # Still valid for the live DOM path, which reports the failure per probe.
+                logger.debug(f"Rule {self.xpath!r} does not compile for snapshots: {e}")
+
+    def describe(self):
+        return self.xpath or f"{self.type}:{self.field or self.requires}"
+
+    def candidates(self, document, record):
+        if self.type == 'xpath':
+            return [element.text.strip() for element in document.find_elements(By.XPATH, self.xpath)]
+        if self.type == 'near_field':
+            value = record.get(self.field)
+            if not value:
+                return []
+            texts = []
+            for anchor in document.find_elements(By.XPATH, f"//*[contains(text(), '{value}')]"):
+                parent = anchor.find_element(By.XPATH, "./..")
+                texts.extend(sibling.text.strip() for sibling in parent.find_elements(By.XPATH, "./*"))
+            return texts
+        if self.type == 'title':
+            title = document.title
+            if not title or (self.requires and self.requires not in title):
+                return []
+            # "last" only cuts off the site suffix, so a name containing the separator stays whole.
+            parts = title.rsplit(self.separator, 1) if self.split == 'last' else title.split(self.separator)
+            return [part.strip() for part in parts]
+        raise ValueError(f"Unknown rule type: {self.type}")
+
+    def evaluate(self, document, record):
+        for text in self.candidates(document, record):
+            if not text:
+                continue
+            value = run_validators(self.validators, text, record)
+            if value:
+                return value
+        return None
+
+
+class FieldRules:
+    def __init__(self, name, spec):
+        self.name = name
+        self.spec = spec
+        self.tab = spec.get('tab')
+        self.validators = compile_validators(spec.get('validators', []))
+        self.rules = [Rule(i, rule, self.validators) for i, rule in enumerate(spec['rules'])]
+        self.extractions = 0
+        self.probes = 0
+        self.misses = 0
+
+    def reorder(self):
+        # Rebind rather than sort in place so concurrent extractions keep iterating a complete list.
+        self.rules = sorted(self.rules, key=lambda rule: (rule.fallback, 0 if rule.fallback else -rule.hits, rule.index))
+
+    def extract(self, document, record, observe=None):
+        probes = 0
+        value = None
+        for rule in self.rules:
+            probes += 1
+            start = time.perf_counter()
+            try:
+                value = rule.evaluate(document, record)
+            except Exception as e:
+                logger.debug(f"{self.name} rule failed: {rule.describe()} - {e}")
+                value = None
+            if observe:
+                observe(self.name, rule.describe(), time.perf_counter() - start, bool(value))
+            if value:
+                rule.hits += 1
+                break
+        return value, probes
+
+
+class RuleEngine:
+    def __init__(self, config):
+        self.adaptive = config.get('adaptive', True)
+        self.reorder_every = config.get('reorder_every', 25)
+        self.fields = {name: FieldRules(name, spec) for name, spec in config['fields'].items()}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=DEFAULT_RULES_PATH):
+        with open(path, encoding='utf-8') as f:
+            engine = cls(json.load(f))
+        logger.debug(f"Loaded extraction rules for {len(engine.fields)} fields from {path}")
+        return engine
+
+    def validate(self, field, text, record=None):
+        return run_validators(self.fields[field].validators, text.strip(), record or {})
+
+    def extract(self, document, field_names, record=None, observe=None):
+        data = {}
+        context = dict(record or {})
+        fields = [self.fields[name] for name in field_names]
+        # Batched documents evaluate every field in one call instead of one query per rule.
+        outcomes = document.extract_fields(fields, context, observe) if hasattr(document, 'extract_fields') else None
+        for i, field in enumerate(fields):
+            name = field.name
+            value, probes = outcomes[i] if outcomes is not None else field.extract(document, context, observe)
+            with self._lock:
+                field.extractions += 1
+                field.probes += probes
+                if value:
+                    data[name] = value
+                    context[name] = value
+                    logger.info(f"Found {name}: {value}")
+                else:
+                    field.misses += 1
+                if self.adaptive and self.reorder_every and field.extractions % self.reorder_every == 0:
+                    field.reorder()
+        return data
+
+    def stats(self):
+        stats = {}
+        for name, field in self.fields.items():
+            stats[name] = {
+                'extractions': field.extractions,
+                'misses': field.misses,
+                'mean_probes': round(field.probes / field.extractions, 2) if field.extractions else 0.0,
+                'rule_hits': {rule.describe(): rule.hits for rule in field.rules if rule.hits},
+            }
+        return stats
+
+    def log_stats(self):
+        for name, stats in self.stats().items():
+            logger.info(f"Rules for {name}: {stats['extractions']} pages, {stats['misses']} misses, "
+                        f"{stats['mean_probes']} probes/page")
+
+
+_default_engine = None
+_default_engine_lock = threading.Lock()
+
+
+def default_engine():
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = RuleEngine.load()
+        return _default_engine
@@ -0,0 +1,210 @@
+import heapq
+import itertools
+import json
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BASE_DELAY = 2.0
+DEFAULT_MAX_DELAY = 120.0
+DEFAULT_LATENCY_TARGET = 10.0
+DEFAULT_DEAD_LETTER_PATH = "dead_letter.jsonl"
+DECREASE_FACTOR = 0.5
+DECREASE_COOLDOWN = 5.0
+MAX_RATE_MULTIPLIER = 4
+LATENCY_WINDOW = 200
+
+
+def backoff_delay(attempt, base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY):
+    # Full jitter: spread retries uniformly so failed requests do not return in lockstep.
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class AdaptiveLimiter:
+    # AIMD control of both request rate and in-flight requests: every clean window of responses
+    # adds one step, while an error or a response slower than the latency target halves both.
+    def __init__(self, rate, concurrency=1, min_rate=0.05, max_rate=None, latency_target=DEFAULT_LATENCY_TARGET):
+        self.max_rate = max_rate or (rate * MAX_RATE_MULTIPLIER if rate and rate > 0 else None)
+        self.rate = rate if rate and rate > 0 else None
+        self.min_rate = min_rate
+        self.rate_step = rate / 10 if self.rate else 0.0
+        self.max_concurrency = max(1, concurrency)
+        self.concurrency = self.max_concurrency
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.increases = 0
+        self.decreases = 0
+        self.latencies = []
+        self._clean = 0
+        self._next_slot = 0.0
+        self._last_decrease = 0.0
+        self._lock = threading.Condition()
+
+    def reserve(self):
+        with self._lock:
+            if not self.rate:
+                return 0.0
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate
+        return slot - now
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def try_acquire_slot(self):
+        with self._lock:
+            if self.in_flight >= self.concurrency:
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire_slot(self, timeout=None):
+        with self._lock:
+            if not self._lock.wait_for(lambda: self.in_flight < self.concurrency, timeout):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release_slot(self):
+        with self._lock:
+            self.in_flight -= 1
+            self._lock.notify_all()
+
+    def record(self, latency, ok=True):
+        with self._lock:
+            self.requests += 1
+            self.latencies.append(latency)
+            if len(self.latencies) > LATENCY_WINDOW:
+                del self.latencies[0]
+            if not ok:
+                self.errors += 1
+            if not ok or (self.latency_target and latency > self.latency_target):
+                self._clean = 0
+                now = time.monotonic()
+                if now - self._last_decrease >= DECREASE_COOLDOWN:
+                    self._last_decrease = now
+                    self.decreases += 1
+                    self.concurrency = max(1, int(self.concurrency * DECREASE_FACTOR))
+                    if self.rate:
+                        self.rate = max(self.min_rate, self.rate * DECREASE_FACTOR)
+                    logger.info(f"Backing off: {self.describe()}")
+                return
+            self._clean += 1
+            if self._clean >= self.concurrency * 2:
+                self._clean = 0
+                grew = False
+                if self.concurrency < self.max_concurrency:
+                    self.concurrency += 1
+                    grew = True
+                if self.rate and self.rate < self.max_rate:
+                    self.rate = min(self.max_rate, self.rate + self.rate_step)
+                    grew = True
+                if grew:
+                    self.increases += 1
+                    self._lock.notify_all()
+
+    def describe(self):
+        rate = f"{self.rate:.2f}/s" if self.rate else "unlimited"
+        return f"rate {rate}, concurrency {self.concurrency}/{self.max_concurrency}"
+
+    def stats(self):
+        with self._lock:
+            return {
+                'rate': round(self.rate, 3) if self.rate else None,
+                'concurrency': self.concurrency,
+                'requests': self.requests,
+                'errors': self.errors,
+                'error_rate': round(self.errors / self.requests, 3) if self.requests else 0.0,
+                'latency_p50': round(percentile(self.latencies, 0.5), 3),
+                'latency_p95': round(percentile(self.latencies, 0.95), 3),
+                'increases': self.increases,
+                'decreases': self.decreases,
+            }
+
+    def log_stats(self):
+        stats = self.stats()
+        logger.info(f"Scheduler: {stats['requests']} requests, {stats['error_rate']:.1%} errors, "
+                    f"p50 {stats['latency_p50']}s, p95 {stats['latency_p95']}s; ended at {self.describe()} "
+                    f"after {stats['increases']} increases and {stats['decreases']} decreases")
+
+
+class RetryScheduler:
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS, base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY,
+                 dead_letter_path=None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.dead_letter_path = dead_letter_path
+        self.dead_letter = []
+        self.retried = 0
+        self._heap = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+
+    def requeue(self, item, project, error=None):
+        attempts = project.get('attempts', 0) + 1
+        project['attempts'] = attempts
+        if attempts >= self.max_attempts:
+            self.give_up(project, error)
+            return False
+        delay = backoff_delay(attempts - 1, self.base_delay, self.max_delay)
+        logger.info(f"Retrying project {project['index'] + 1} in {delay:.1f}s (attempt {attempts + 1} "
+                    f"of {self.max_attempts}): {error or 'no data'}")
+        with self._lock:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._order), item))
+            self.retried += 1
+        return True
+
+    def give_up(self, project, error):
+        entry = {
+            'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'rera_no': project.get('rera_no', ''),
+            'detail_url': project.get('detail_url', ''),
+            'attempts': project.get('attempts', 0),
+            'error': str(error or 'no data'),
+        }
+        logger.warning(f"Giving up on project {project['index'] + 1} after {entry['attempts']} attempts: "
+                       f"{entry['error']}")
+        with self._lock:
+            self.dead_letter.append(entry)
+            if self.dead_letter_path:
+                with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def pop_ready(self):
+        with self._lock:
+            if self._heap and self._heap[0][0] <= time.monotonic():
+                return heapq.heappop(self._heap)[2]
+        return None
+
+    def next_delay(self):
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - time.monotonic())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._heap)
+
+    def log_summary(self):
+        logger.info(f"Retries: {self.retried} requeued, {len(self.dead_letter)} dead-lettered"
+                    + (f" (see {self.dead_letter_path})" if self.dead_letter and self.dead_letter_path else ""))
@@ -0,0 +1,184 @@
+import csv
+import glob
+import json
+import logging
+import os
+
+from fields import FIELD_NAMES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT = "odisha_rera_projects.csv"
+DEFAULT_BATCH_SIZE = 10
+
+
+class RecordSink:
+    format = None
+
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE, append=False, fields=FIELD_NAMES):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.append = append
+        self.fields = list(fields)
+        self.count = 0
+        self.batches = 0
+        self._buffer = []
+        self._closed = False
+
+    def write(self, record):
+        self._buffer.append({field: record.get(field, '') for field in self.fields})
+        self.count += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    @property
+    def pending(self):
+        return len(self._buffer)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        self._write_batch(self._buffer)
+        self._buffer = []
+        self.batches += 1
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        self._close()
+        self._closed = True
+        logger.info(f"Wrote {self.count} records to {self.path}")
+
+    def read_records(self):
+        raise NotImplementedError
+
+    def _write_batch(self, records):
+        raise NotImplementedError
+
+    def _close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _AppendFileSink(RecordSink):
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE, append=False, fields=FIELD_NAMES):
+        super().__init__(path, batch_size, append, fields)
+        self._existing = append and os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'a' if append else 'w', newline='', encoding='utf-8')
+
+    def _write_lines(self, records):
+        raise NotImplementedError
+
+    def _write_batch(self, records):
+        self._write_lines(records)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _close(self):
+        self._file.close()
+
+
+class CsvSink(_AppendFileSink):
+    format = 'csv'
+
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE, append=False, fields=FIELD_NAMES):
+        super().__init__(path, batch_size, append, fields)
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fields)
+        if not self._existing:
+            self._writer.writeheader()
+            self._file.flush()
+
+    def _write_lines(self, records):
+        self._writer.writerows(records)
+
+    def read_records(self):
+        self.flush()
+        with open(self.path, newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+
+
+class JsonLinesSink(_AppendFileSink):
+    format = 'jsonl'
+
+    def _write_lines(self, records):
+        self._file.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records))
+
+    def read_records(self):
+        self.flush()
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class ParquetSink(RecordSink):
+    format = 'parquet'
+
+    # Parquet files are only readable once their footer is written, so each batch becomes its own
+    # fsync'd part file inside the output directory; a crash loses at most the unflushed batch.
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE * 10, append=False, fields=FIELD_NAMES):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Parquet output needs pyarrow: pip install pyarrow")
+        super().__init__(path, batch_size, append, fields)
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._schema = pyarrow.schema([(field, pyarrow.string()) for field in self.fields])
+        os.makedirs(path, exist_ok=True)
+        existing = self._parts()
+        if not append:
+            for part in existing:
+                os.remove(part)
+            existing = []
+        self._next_part = len(existing)
+
+    def _parts(self):
+        return sorted(glob.glob(os.path.join(self.path, 'part-*.parquet')))
+
+    def _write_batch(self, records):
+        table = self._pa.Table.from_pylist(records, schema=self._schema)
+        target = os.path.join(self.path, f"part-{self._next_part:05d}.parquet")
+        temporary = target + '.tmp'
+        self._pq.write_table(table, temporary)
+        with open(temporary, 'rb') as f:
+            os.fsync(f.fileno())
+        os.replace(temporary, target)
+        self._next_part += 1
+
+    def read_records(self):
+        self.flush()
+        for part in self._parts():
+            yield from self._pq.read_table(part).to_pylist()
+
+
+SINKS = {
+    'csv': CsvSink,
+    'jsonl': JsonLinesSink,
+    'parquet': ParquetSink,
+}
+
+EXTENSIONS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.parquet': 'parquet',
+}
+
+
+def open_sink(path=DEFAULT_OUTPUT, format=None, batch_size=None, append=False):
+    if format is None:
+        format = EXTENSIONS.get(os.path.splitext(path)[1].lower(), 'csv')
+    if format not in SINKS:
+        raise ValueError(f"Unknown output format: {format}")
+    kwargs = {'append': append}
+    if batch_size:
+        kwargs['batch_size'] = batch_size
+    return SINKS[format](path, **kwargs)
@@ -0,0 +1,158 @@
+import logging
+
+from lxml import etree, html as lxml_html
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException
+
+logger = logging.getLogger(__name__)
+
+HIDDEN_ATTRIBUTE = 'data-snapshot-hidden'
+
+# Serialises the page in one round-trip. Elements the browser does not render are tagged first so
+# that SnapshotElement.text can return '' for them, the same as WebElement.text does.
+SNAPSHOT_SCRIPT = """
+var attr = arguments[0], hidden = [];
+var all = document.body ? document.body.getElementsByTagName('*') : [];
+for (var i = 0; i < all.length; i++) {
+    var el = all[i];
+    if (!el.getClientRects().length || getComputedStyle(el).visibility === 'hidden') {
+        el.setAttribute(attr, '1');
+        hidden.push(el);
+    }
+}
+var html = document.documentElement.outerHTML;
+for (var j = 0; j < hidden.length; j++) {
+    hidden[j].removeAttribute(attr);
+}
+return {html: html, title: document.title};
+"""
+
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'caption', 'dd', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr',
+    'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'tbody', 'tfoot', 'thead', 'tr', 'ul',
+}
+CELL_TAGS = {'td', 'th'}
+SKIPPED_TAGS = {'script', 'style', 'head', 'template', 'noscript', 'title', 'meta', 'link'}
+
+_compiled_xpaths = {}
+
+
+def compile_xpath(selector):
+    compiled = _compiled_xpaths.get(selector)
+    if compiled is None:
+        try:
+            compiled = etree.XPath(selector)
+        except etree.XPathSyntaxError as e:
+            compiled = e
+        _compiled_xpaths[selector] = compiled
+    if isinstance(compiled, Exception):
+        raise InvalidSelectorException(f"Invalid XPath {selector!r}: {compiled}")
+    return compiled
+
+
+def _is_hidden(element):
+    if element.get(HIDDEN_ATTRIBUTE) is not None or element.get('hidden') is not None:
+        return True
+    style = (element.get('style') or '').replace(' ', '').lower()
+    return 'display:none' in style or 'visibility:hidden' in style
+
+
+def _collect_text(element, parts):
+    if not isinstance(element.tag, str) or element.tag in SKIPPED_TAGS or _is_hidden(element):
+        return
+    block = element.tag in BLOCK_TAGS
+    if block:
+        parts.append('\n')
+    if element.tag == 'br':
+        parts.append('\n')
+    if element.text:
+        parts.append(element.text)
+    for child in element:
+        _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+    if block:
+        parts.append('\n')
+    elif element.tag in CELL_TAGS:
+        parts.append(' ')
+
+
+def visible_text(element):
+    if _is_hidden(element):
+        return ''
+    parts = []
+    _collect_text(element, parts)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+class SnapshotElement:
+    def __init__(self, document, element):
+        self.document = document
+        self.element = element
+
+    @property
+    def text(self):
+        return self.document.text_of(self.element)
+
+    def is_displayed(self):
+        return not any(_is_hidden(node) for node in self.element.iterancestors()) and not _is_hidden(self.element)
+
+    def find_elements(self, by, selector):
+        return self.document.evaluate(selector, self.element)
+
+    def find_element(self, by, selector):
+        elements = self.find_elements(by, selector)
+        if not elements:
+            raise NoSuchElementException(f"No element matches {selector!r}")
+        return elements[0]
+
+
+class SnapshotDocument:
+    def __init__(self, page_source, title=''):
+        self.tree = lxml_html.fromstring(page_source or '<html></html>')
+        self.title = title or self.tree.findtext('.//title') or ''
+        self._texts = {}
+
+    @staticmethod
+    def capture(driver):
+        return driver.execute_script(SNAPSHOT_SCRIPT, HIDDEN_ATTRIBUTE)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        return cls(snapshot['html'], snapshot['title'])
+
+    @classmethod
+    def from_driver(cls, driver):
+        return cls.from_snapshot(cls.capture(driver))
+
+    def text_of(self, element):
+        text = self._texts.get(element)
+        if text is None:
+            text = visible_text(element)
+            self._texts[element] = text
+        return text
+
+    def evaluate(self, selector, context=None):
+        try:
+            results = compile_xpath(selector)(self.tree if context is None else context)
+        except etree.XPathEvalError as e:
+            raise InvalidSelectorException(f"Cannot evaluate XPath {selector!r}: {e}")
+        if not isinstance(results, list):
+            raise InvalidSelectorException(f"XPath {selector!r} did not return elements")
+        elements = []
+        for result in results:
+            # WebDriver rejects expressions that select text or attribute nodes; mirror that.
+            if not isinstance(result, etree._Element) or not isinstance(result.tag, str):
+                raise InvalidSelectorException(f"XPath {selector!r} selected a non-element node")
+            elements.append(SnapshotElement(self, result))
+        return elements
+
+    def find_elements(self, by, selector):
+        return self.evaluate(selector)
+
+    def find_element(self, by, selector):
+        elements = self.evaluate(selector)
+        if not elements:
+            raise NoSuchElementException(f"No element matches {selector!r}")
+        return elements[0]
@@ -0,0 +1,114 @@
+import argparse
+import logging
+import mimetypes
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+
+
+def parse_delay(value):
+    low, _, high = str(value).partition('-')
+    return float(low), float(high or low)
+
+
+class RecordedResponseHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    root = "."
+    # Fault injection: a delay range in seconds, and the share of requests answered with error_status.
+    delay = (0.0, 0.0)
+    error_rate = 0.0
+    error_status = 503
+    faults = None
+
+    def resolve(self):
+        parts = urlsplit(self.path)
+        path = unquote(parts.path).lstrip('/') or 'index.html'
+        candidates = []
+        if parts.query:
+            candidates.append(f"{path}?{unquote(parts.query)}")
+        candidates.extend([path, os.path.join(path, 'index.html'), f"{path}.html", f"{path}.json"])
+
+        root = os.path.realpath(self.root)
+        for candidate in candidates:
+            target = os.path.realpath(os.path.join(root, candidate))
+            if target.startswith(root + os.sep) and os.path.isfile(target):
+                return target
+        return None
+
+    def inject_faults(self):
+        if self.delay[1] > 0:
+            time.sleep(random.uniform(*self.delay))
+        if self.error_rate and random.random() < self.error_rate:
+            with self.faults['lock']:
+                self.faults['errors'] += 1
+            self.send_error(self.error_status)
+            return True
+        return False
+
+    def do_GET(self):
+        if self.inject_faults():
+            return
+        target = self.resolve()
+        if target is None:
+            self.send_error(404)
+            return
+
+        with open(target, 'rb') as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(target.split('?', 1)[0])[0]
+        if content_type is None:
+            content_type = 'application/json' if body.lstrip()[:1] in (b'{', b'[') else 'text/html'
+
+        self.send_response(200)
+        self.send_header('Content-Type', f"{content_type}; charset=utf-8")
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def make_server(root, host="127.0.0.1", port=DEFAULT_PORT, delay=0.0, error_rate=0.0, error_status=503):
+    faults = {'errors': 0, 'lock': threading.Lock()}
+    handler = type('Handler', (RecordedResponseHandler,), {
+        'root': root, 'delay': parse_delay(delay), 'error_rate': error_rate, 'error_status': error_status,
+        'faults': faults,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.faults = faults
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded portal responses for offline runs.")
+    parser.add_argument("root", help="directory of recorded responses (see --record-dir in rera_scraper.py)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--delay", default="0", help="seconds to wait before each response, or a range like 0.2-2")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=503, help="status code of injected errors")
+    args = parser.parse_args()
+
+    server = make_server(args.root, args.host, args.port, delay=args.delay, error_rate=args.error_rate,
+                         error_status=args.error_status)
+    logger.info(f"Serving {args.root} on http://{args.host}:{server.server_port}")
+    if args.error_rate or server.RequestHandlerClass.delay[1]:
+        logger.info(f"Injecting {args.delay}s delays and {args.error_rate:.0%} HTTP {args.error_status} errors")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import os
+import sys
+import threading
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import stub_server
+
+
+@pytest.fixture
+def stub(tmp_path):
+    # Starts stub_server.py over a temporary directory of recorded responses; call it with the fault options.
+    servers = []
+
+    def start(**faults):
+        root = tmp_path / 'recordings'
+        root.mkdir(exist_ok=True)
+        server = stub_server.make_server(str(root), port=0, **faults)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        server.root = root
+        server.url = f"http://127.0.0.1:{server.server_port}"
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
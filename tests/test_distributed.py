@@ -0,0 +1,85 @@
+import pytest
+
+import distributed
+import job_queue
+from distributed import Coordinator, job_key
+from job_queue import STATUS_PENDING, SQLiteJobQueue
+
+
+class ListCrawler:
+    def __init__(self, projects):
+        self.projects = projects
+
+    def __iter__(self):
+        return iter(self.projects)
+
+    def start(self):
+        pass
+
+    def join(self):
+        pass
+
+    def log_stats(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class Scraper:
+    index = None
+
+
+def keyless(index):
+    return {'index': index, 'rera_no': '', 'detail_url': ''}
+
+
+@pytest.fixture(params=['sqlite', 'redis'])
+def queue(request, tmp_path, monkeypatch):
+    if request.param == 'sqlite':
+        q = SQLiteJobQueue(str(tmp_path / 'jobs.sqlite'))
+    else:
+        pytest.importorskip('redis')
+        fakeredis = pytest.importorskip('fakeredis')
+        pytest.importorskip('lupa')
+        monkeypatch.setattr(job_queue.redis.Redis, 'from_url', lambda url, **kw: fakeredis.FakeRedis(**kw))
+        q = job_queue.RedisJobQueue('redis://fake')
+        q.reset()
+    yield q
+    q.close()
+
+
+def harvest(q, projects, monkeypatch):
+    monkeypatch.setattr(distributed, 'RegistryCrawler', lambda scraper, **kw: ListCrawler(projects))
+    coordinator = Coordinator(Scraper(), q)
+    coordinator.harvest()
+    return coordinator
+
+
+def test_job_key_falls_back_to_position():
+    assert job_key({'rera_no': 'RP/1'}, 3) == 'RP/1'
+    assert job_key({'detail_url': 'http://x/1'}, 3) == 'http://x/1'
+    assert job_key(keyless(0), 3) == 'pos:3'
+
+
+def test_duplicate_empty_keys_are_all_queued(queue, monkeypatch):
+    projects = [keyless(0), keyless(1), {'index': 2, 'rera_no': 'RP/1', 'detail_url': ''}]
+    coordinator = harvest(queue, projects, monkeypatch)
+
+    assert coordinator.added == 3
+    assert queue.counts()[STATUS_PENDING] == 3
+    assert [project['index'] for _, project, _ in queue.results()] == [0, 1, 2]
+
+
+def test_resumed_harvest_only_adds_new_projects(queue, monkeypatch):
+    a, b = {'index': 0, 'rera_no': 'RP/A'}, {'index': 1, 'rera_no': 'RP/B'}
+    harvest(queue, [a, b], monkeypatch)
+    job = queue.lease('w1')
+    assert queue.complete(job['seq'], 'w1', {'RERA_Regd_No': job['project']['rera_no']})
+
+    new = {'index': 0, 'rera_no': 'RP/NEW'}
+    coordinator = harvest(queue, [new, dict(a, index=1), dict(b, index=2)], monkeypatch)
+
+    assert coordinator.added == 1
+    assert queue.counts()[STATUS_PENDING] == 2
+    assert [project['rera_no'] for _, project, _ in queue.results()] == ['RP/NEW', 'RP/A', 'RP/B']
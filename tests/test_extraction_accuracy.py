@@ -0,0 +1,24 @@
+import pytest
+
+from bench_end_to_end import below_threshold, run
+from fixture_portal import DEFAULT_PAGE_SIZE, DEFAULT_SEED, LAYOUTS, NAME_SUFFIXES, make_project
+
+PROJECTS = 300
+
+
+def test_fixture_projects_cover_every_variant():
+    projects = [make_project(project_id) for project_id in range(1, PROJECTS + 1)]
+    assert {project['layout'] for project in projects} == set(LAYOUTS)
+    assert {name.split(' ', 1)[1] for name in (project['record']['Project_Name'].title() for project in projects)} \
+        >= {suffix.title() for suffix in NAME_SUFFIXES}
+
+
+@pytest.mark.parametrize('extraction', ['live', 'snapshot'])
+def test_replay_extracts_every_field(extraction):
+    config = {'mode': 'replay', 'projects': PROJECTS, 'limit': None, 'page_size': DEFAULT_PAGE_SIZE,
+              'seed': DEFAULT_SEED, 'delay': 0.0, 'workers': 1, 'rate': 0, 'profile': None,
+              'extraction': extraction}
+    result = run(config)
+
+    assert result['projects_scraped'] == PROJECTS
+    assert below_threshold(result['accuracy'], 1.0) == {}, result['mismatches']
@@ -0,0 +1,80 @@
+import pytest
+
+import fast_path
+from fast_path import FastPathClient
+from fixture_portal import DETAIL_PATH, FixturePortal, detail_html, promoter_html
+from page_cache import PageCache
+from rera_scraper import OdishaRERAScraper
+from sinks import open_sink
+
+PORTAL = "http://portal.example"
+PROJECT_ID = 6
+
+
+def write(root, path, body):
+    target = root / path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(body, encoding='utf-8')
+
+
+def detail_project(project_id):
+    return {'index': project_id - 1, 'detail_url': f"{PORTAL}{DETAIL_PATH}{project_id}"}
+
+
+@pytest.fixture
+def portal():
+    return FixturePortal(projects=PROJECT_ID)
+
+
+@pytest.fixture
+def scraper(tmp_path, portal):
+    # An offline scraper stands in for the browser: its fallback replays the project's tabs from the page cache.
+    cache = PageCache(str(tmp_path / 'cache'), ttl=None)
+    for tab in ('overview', 'promoter'):
+        cache.put(f"{PORTAL}{DETAIL_PATH}{PROJECT_ID}", tab, portal.snapshot(PROJECT_ID, tab))
+    scraper = OdishaRERAScraper(offline=True, cache=cache, sink=open_sink(str(tmp_path / 'out.jsonl')))
+    yield scraper
+    scraper.close()
+    cache.close()
+
+
+def test_page_without_promoter_data_falls_back_to_the_browser(stub, portal, scraper):
+    server = stub()
+    write(server.root, f"{DETAIL_PATH}{PROJECT_ID}".lstrip('/'), detail_html(portal.project(PROJECT_ID)))
+    client = FastPathClient(base_url=server.url)
+
+    [(project, record)] = list(scraper.scrape_projects([detail_project(PROJECT_ID)], fast_path=client))
+
+    assert client.requests == 1
+    assert project.get('cached') is True
+    assert record == portal.project(PROJECT_ID)['record']
+
+
+def test_separate_promoter_endpoint_stays_on_the_http_path(stub, portal, scraper):
+    server = stub()
+    project = portal.project(PROJECT_ID)
+    write(server.root, f"{DETAIL_PATH}{PROJECT_ID}".lstrip('/'), detail_html(project))
+    write(server.root, f"api/{PROJECT_ID}/promoter", promoter_html(project))
+    client = FastPathClient(base_url=server.url, endpoints={'promoter': '/api/{project_id}/promoter'})
+
+    [(scraped, record)] = list(scraper.scrape_projects([detail_project(PROJECT_ID)], fast_path=client))
+
+    assert client.requests == 2
+    assert 'cached' not in scraped
+    assert record == project['record']
+
+
+def test_rate_limited_responses_slow_the_client_down(stub, portal, monkeypatch):
+    monkeypatch.setattr(fast_path, 'RETRY_BASE_DELAY', 0.01)
+    server = stub(error_rate=1.0, error_status=429)
+    write(server.root, f"{DETAIL_PATH}{PROJECT_ID}".lstrip('/'), detail_html(portal.project(PROJECT_ID)))
+    client = FastPathClient(base_url=server.url, rate=20, max_attempts=3)
+
+    [(project, record)] = client.fetch_projects([detail_project(PROJECT_ID)])
+
+    assert record is None
+    assert server.faults['errors'] == 3
+    assert client.retries == 2
+    assert client.limiter.decreases == 1
+    assert client.limiter.rate == 10
+    assert client.limiter.concurrency == client.limiter.max_concurrency // 2
@@ -0,0 +1,40 @@
+import json
+
+from page_cache import PageCache
+from rera_scraper import OdishaRERAScraper
+from scheduler import RetryScheduler
+from sinks import open_sink
+
+
+def test_offline_miss_is_dead_lettered_on_the_first_attempt(tmp_path):
+    cache = PageCache(str(tmp_path / 'cache'), ttl=None)
+    dead_letter = tmp_path / 'dead_letter.jsonl'
+    scraper = OdishaRERAScraper(offline=True, cache=cache, sink=open_sink(str(tmp_path / 'out.jsonl')),
+                                max_attempts=4, dead_letter_path=str(dead_letter))
+    project = {'index': 0, 'rera_no': 'RP/01/2024/00001', 'detail_url': 'http://portal.example/projects/1'}
+    try:
+        results = list(scraper.scrape_projects([project]))
+    finally:
+        scraper.close()
+        cache.close()
+
+    assert results == [(project, None)]
+    assert scraper.retries.retried == 0
+    [entry] = [json.loads(line) for line in dead_letter.read_text().splitlines()]
+    assert entry['attempts'] == 1
+    assert entry['error'] == "not in the page cache"
+
+
+def test_failed_project_is_dead_lettered_after_max_attempts():
+    retries = RetryScheduler(max_attempts=3, base_delay=0, max_delay=0)
+    project = {'index': 0, 'rera_no': 'RP/01/2024/00001'}
+
+    assert retries.requeue(project, project, "HTTP 503")
+    assert retries.pop_ready() is project
+    assert retries.requeue(project, project, "HTTP 503")
+    assert retries.pop_ready() is project
+    assert not retries.requeue(project, project, "HTTP 503")
+
+    assert retries.retried == 2
+    assert retries.next_delay() is None
+    assert [(entry['attempts'], entry['error']) for entry in retries.dead_letter] == [(3, "HTTP 503")]
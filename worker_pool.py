@@ -0,0 +1,177 @@
+import logging
+import queue
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from scheduler import DEFAULT_LATENCY_TARGET, DEFAULT_MAX_ATTEMPTS, AdaptiveLimiter, RetryScheduler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 1.0
+DEFAULT_RECYCLE_AFTER = 50
+WORKER_START_ATTEMPTS = 3
+
+
+class ScraperWorkerPool:
+    def __init__(self, scraper_factory, workers=4, rate=DEFAULT_RATE, recycle_after=DEFAULT_RECYCLE_AFTER,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS, latency_target=DEFAULT_LATENCY_TARGET, retries=None):
+        self.scraper_factory = scraper_factory
+        self.workers = workers
+        self.limiter = AdaptiveLimiter(rate, concurrency=workers, latency_target=latency_target)
+        self.recycle_after = recycle_after
+        self.jobs = queue.Queue(maxsize=workers * 2)
+        self.results = queue.Queue()
+        self.retries = retries or RetryScheduler(max_attempts)
+        self.crashes = 0
+        self.recycles = 0
+        self._fed = 0
+        self._outstanding = 0
+        self._feeding_done = threading.Event()
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def _feed(self, projects):
+        try:
+            for project in projects:
+                with self._lock:
+                    seq = self._fed
+                    self._fed += 1
+                    self._outstanding += 1
+                self.jobs.put((seq, project))
+        except Exception as e:
+            logger.error(f"Stopped feeding worker pool: {e}")
+        finally:
+            self._feeding_done.set()
+
+    def _finished(self):
+        with self._lock:
+            return self._feeding_done.is_set() and self._outstanding == 0
+
+    def _complete(self, seq, project, data):
+        with self._lock:
+            self._outstanding -= 1
+        self.results.put((seq, project, data))
+
+    def _start_scraper(self, name):
+        for attempt in range(1, WORKER_START_ATTEMPTS + 1):
+            try:
+                return self.scraper_factory()
+            except Exception as e:
+                logger.error(f"{name}: failed to start browser (attempt {attempt}): {e}")
+                time.sleep(attempt)
+        return None
+
+    def _close_scraper(self, scraper):
+        try:
+            scraper.close()
+        except Exception as e:
+            logger.debug(f"Error closing worker browser: {e}")
+
+    def _driver_alive(self, scraper):
+        try:
+            scraper.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _next_job(self):
+        job = self.retries.pop_ready()
+        if job is not None:
+            return job
+        try:
+            return self.jobs.get(timeout=0.5)
+        except queue.Empty:
+            return None
+
+    def _work(self, name):
+        scraper = self._start_scraper(name)
+        if scraper is None:
+            return
+        pages = 0
+        try:
+            while not self._finished():
+                # Workers beyond the limiter's current concurrency sit idle until it grows again.
+                if not self.limiter.acquire_slot(timeout=0.5):
+                    continue
+                try:
+                    job = self._next_job()
+                    if job is None:
+                        continue
+                    seq, project = job
+                    self.limiter.acquire()
+                    started = time.monotonic()
+                    try:
+                        data = scraper.scrape_project_details(project)
+                        if data is None and not self._driver_alive(scraper):
+                            raise WebDriverException("browser stopped responding")
+                    except WebDriverException as e:
+                        self.limiter.record(time.monotonic() - started, ok=False)
+                        with self._lock:
+                            self.crashes += 1
+                        logger.warning(f"{name}: browser crashed on project {project['index'] + 1}: {e}")
+                        self._close_scraper(scraper)
+                        scraper = self._start_scraper(name)
+                        pages = 0
+                        if not self.retries.requeue(job, project, f"browser crashed: {e}"):
+                            self._complete(seq, project, None)
+                        if scraper is None:
+                            return
+                        continue
+                    self.limiter.record(time.monotonic() - started, ok=data is not None)
+                finally:
+                    self.limiter.release_slot()
+
+                if data is None and self.retries.requeue(job, project, project.get('error')):
+                    continue
+                self._complete(seq, project, data)
+                pages += 1
+                if self.recycle_after and pages >= self.recycle_after:
+                    logger.info(f"{name}: recycling browser after {pages} pages")
+                    with self._lock:
+                        self.recycles += 1
+                    self._close_scraper(scraper)
+                    scraper = self._start_scraper(name)
+                    pages = 0
+                    if scraper is None:
+                        return
+        finally:
+            if scraper is not None:
+                self._close_scraper(scraper)
+
+    def run(self, projects):
+        feeder = threading.Thread(target=self._feed, args=(projects,), name="pool-feeder", daemon=True)
+        feeder.start()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, args=(f"worker-{i + 1}",), name=f"worker-{i + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        pending = {}
+        next_seq = 0
+        while True:
+            with self._lock:
+                if self._feeding_done.is_set() and next_seq >= self._fed:
+                    break
+            try:
+                seq, project, data = self.results.get(timeout=1)
+            except queue.Empty:
+                if not any(thread.is_alive() for thread in self._threads):
+                    logger.error(f"All workers stopped with {self._outstanding} projects outstanding")
+                    break
+                continue
+
+            pending[seq] = (project, data)
+            while next_seq in pending:
+                yield pending.pop(next_seq)
+                next_seq += 1
+
+        for seq in sorted(pending):
+            yield pending[seq]
+
+        for thread in self._threads:
+            thread.join(timeout=5)
+        logger.info(f"Worker pool finished: {next_seq} projects, {self.crashes} browser crashes, "
+                    f"{self.recycles} recycles")
+        self.limiter.log_stats()